@@ -7,33 +7,48 @@ class TTDTracker:
     def __init__(self, attacker_ids: set[int], tau: float):
         self._attacker_ids = attacker_ids
         self._tau = tau
-        self._detected: dict[int, int] = {}
+        self._attacker_idx = np.fromiter(sorted(attacker_ids), dtype=np.int64, count=len(attacker_ids))
+        self._already_detected = np.zeros(len(self._attacker_idx), dtype=bool)
+        self._detected_t = np.full(len(self._attacker_idx), -1, dtype=np.int64)
 
-    def update(self, agents, t: int) -> None:
-        for a in agents:
-            if a.unique_id in self._attacker_ids:
-                if a.unique_id not in self._detected and a.reputation < self._tau:
-                    self._detected[a.unique_id] = t
+    def update(self, reps, t: int) -> None:
+        if not isinstance(reps, np.ndarray):
+            reps = _reputation_array(reps, self._attacker_idx)
+        m = (reps[self._attacker_idx] < self._tau) & ~self._already_detected
+        newly = np.nonzero(m)[0]
+        self._detected_t[newly] = t
+        self._already_detected[newly] = True
 
     def ttd(self) -> float | None:
-        if not self._detected:
+        if not self._already_detected.any():
             return None
-        return float(np.mean(list(self._detected.values())))
+        return float(self._detected_t[self._already_detected].mean())
 
     def detection_rate(self) -> float:
         if not self._attacker_ids:
             return 0.0
-        return len(self._detected) / len(self._attacker_ids)
+        return int(self._already_detected.sum()) / len(self._attacker_ids)
 
 
-def reputation_distribution(agents) -> dict:
-    reps = np.array([a.reputation for a in agents])
+def _reputation_array(agents, attacker_idx: np.ndarray) -> np.ndarray:
+    size = int(attacker_idx.max()) + 1 if len(attacker_idx) else 0
+    reps = np.full(size, np.inf)
+    for a in agents:
+        if a.unique_id < size:
+            reps[a.unique_id] = a.reputation
+    return reps
+
+
+def reputation_distribution(reps) -> dict:
+    if not isinstance(reps, np.ndarray):
+        reps = np.array([a.reputation for a in reps])
+    p10, p50, p90 = np.percentile(reps, [10, 50, 90])
     return {
         "mean":   float(reps.mean()),
         "std":    float(reps.std()),
-        "p10":    float(np.percentile(reps, 10)),
-        "p50":    float(np.percentile(reps, 50)),
-        "p90":    float(np.percentile(reps, 90)),
+        "p10":    float(p10),
+        "p50":    float(p50),
+        "p90":    float(p90),
         "min":    float(reps.min()),
         "max":    float(reps.max()),
     }
@@ -18,3 +18,6 @@ class BaseScenario(ABC):
 
     @abstractmethod
     def inject(self, model) -> None: ...
+
+    def should_inject(self, step: int) -> bool:
+        return True
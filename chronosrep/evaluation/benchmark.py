@@ -1,7 +1,10 @@
 from __future__ import annotations
+import itertools
+import os
 import time
 import csv
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 import numpy as np
@@ -38,8 +41,9 @@ def _make_model(n_agents: int, t_steps: int, tau: float, seed: int):
     import sys, os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     from chronosrep.model import ChronosRepModel
-    np.random.seed(seed)
-    return ChronosRepModel(n_agents=n_agents, t_steps=t_steps, tau=tau)
+    return ChronosRepModel(
+        n_agents=n_agents, t_steps=t_steps, tau=tau, rng=np.random.default_rng(seed),
+    )
 
 
 def _run_single(scenario: str, n_agents: int, t_steps: int, tau: float, seed: int) -> RunResult:
@@ -57,15 +61,17 @@ def _run_single(scenario: str, n_agents: int, t_steps: int, tau: float, seed: in
     elif scenario == "collusion":
         sc = CollusionFarmingScenario()
         sc.setup(model)
+    gate = sc.should_inject if scenario != "baseline" else None
     for step in range(t_steps):
-        if scenario != "baseline":
+        if gate is not None and gate(model.current_step):
             sc.inject(model)
         model.step()
     wall = time.perf_counter() - t0
-    df = model.datacollector.get_model_vars_dataframe()
-    avg_rep     = float(df["AvgReputation"].iloc[-1]) if "AvgReputation" in df else 0.0
-    iso_rate    = float(df["IsolationRate"].iloc[-1]) if "IsolationRate" in df else 0.0
-    atk_rep     = float(df["AttackerAvgReputation"].iloc[-1]) if "AttackerAvgReputation" in df else 0.0
+    mv = model.datacollector.model_vars
+    avg_rep     = float(mv["AvgReputation"][-1]) if mv.get("AvgReputation") else 0.0
+    iso_rate    = float(mv["IsolationRate"][-1]) if mv.get("IsolationRate") else 0.0
+    atk_rep     = float(mv["AttackerAvgReputation"][-1]) if mv.get("AttackerAvgReputation") else 0.0
+    model.release_agents()
     return RunResult(
         scenario=scenario,
         seed=seed,
@@ -81,6 +87,15 @@ def _run_single(scenario: str, n_agents: int, t_steps: int, tau: float, seed: in
     )
 
 
+def _report(done: int, total: int, r: RunResult) -> None:
+    print(
+        f"[{done}/{total}] sc={r.scenario} n={r.n_agents} t={r.t_steps} "
+        f"τ={r.tau} seed={r.seed} "
+        f"rep={r.avg_reputation:.3f} iso={r.isolation_rate:.3f} "
+        f"wall={r.wall_time_s:.2f}s"
+    )
+
+
 class BenchmarkRunner:
     def __init__(self, config: SweepConfig | None = None):
         self._cfg = config or SweepConfig()
@@ -91,31 +106,33 @@ class BenchmarkRunner:
         self._results.append(r)
         return r
 
-    def run_sweep(self, verbose: bool = True) -> list[RunResult]:
+    def run_sweep(self, verbose: bool = True, max_workers: int | None = None) -> list[RunResult]:
         cfg = self._cfg
-        total = (
-            len(cfg.scenarios)
-            * len(cfg.n_agents_list)
-            * len(cfg.t_steps_list)
-            * len(cfg.tau_list)
-            * len(cfg.seeds)
-        )
+        jobs = list(itertools.product(
+            cfg.scenarios, cfg.n_agents_list, cfg.t_steps_list, cfg.tau_list, cfg.seeds,
+        ))
+        total = len(jobs)
+        results: list[RunResult | None] = [None] * total
+        workers = min(max_workers or os.cpu_count() or 1, max(total, 1))
         done = 0
-        for sc in cfg.scenarios:
-            for n in cfg.n_agents_list:
-                for t in cfg.t_steps_list:
-                    for tau in cfg.tau_list:
-                        for seed in cfg.seeds:
-                            r = _run_single(sc, n, t, tau, seed)
-                            self._results.append(r)
-                            done += 1
-                            if verbose:
-                                print(
-                                    f"[{done}/{total}] sc={sc} n={n} t={t} "
-                                    f"τ={tau} seed={seed} "
-                                    f"rep={r.avg_reputation:.3f} iso={r.isolation_rate:.3f} "
-                                    f"wall={r.wall_time_s:.2f}s"
-                                )
+        if workers == 1:
+            for i, job in enumerate(jobs):
+                r = _run_single(*job)
+                results[i] = r
+                done += 1
+                if verbose:
+                    _report(done, total, r)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                order = sorted(range(total), key=lambda i: jobs[i][1] * jobs[i][2], reverse=True)
+                futures = {ex.submit(_run_single, *jobs[i]): i for i in order}
+                for fut in as_completed(futures):
+                    r = fut.result()
+                    results[futures[fut]] = r
+                    done += 1
+                    if verbose:
+                        _report(done, total, r)
+        self._results.extend(results)
         return self._results
 
     def summary(self) -> dict[str, dict[str, float]]:
@@ -1,10 +1,16 @@
 from __future__ import annotations
 import csv
-import json
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from .benchmark import RunResult
 from .scenario_matrix import ScenarioMatrix
+from chronosrep.utils.serialization import _HAS_PYARROW, save_json, save_parquet
+
+try:
+    import pandas as pd
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
 
 
 class ResultsWriter:
@@ -16,38 +22,44 @@ class ResultsWriter:
         path = self._out / filename
         if not results:
             return path
-        rows = [asdict(r) for r in results]
-        for row in rows:
-            row.pop("extra", None)
-        fieldnames = list(rows[0].keys())
+        names = [f.name for f in fields(RunResult) if f.name != "extra"]
+        if _HAS_PANDAS:
+            df = pd.DataFrame({n: [getattr(r, n) for r in results] for n in names}, columns=names)
+            df.to_csv(path, index=False)
+            return path
         with open(path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows([getattr(r, n) for n in names] for r in results)
+        return path
+
+    def write_parquet(self, results: list[RunResult], filename: str = "benchmark.parquet") -> Path:
+        path = self._out / filename
+        names = [f.name for f in fields(RunResult) if f.name != "extra"]
+        save_parquet({n: [getattr(r, n) for r in results] for n in names}, path)
         return path
 
     def write_json(self, results: list[RunResult], filename: str = "benchmark.json") -> Path:
         path = self._out / filename
-        with open(path, "w") as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
+        save_json([asdict(r) for r in results], path)
         return path
 
     def write_summary(self, summary: dict, filename: str = "summary.json") -> Path:
         path = self._out / filename
-        with open(path, "w") as f:
-            json.dump(summary, f, indent=2)
+        save_json(summary, path)
         return path
 
     def write_matrix(self, matrix: ScenarioMatrix, filename: str = "matrix.json") -> Path:
         path = self._out / filename
         data = [{"coords": c.coords, "metrics": c.metrics} for c in matrix.cells()]
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        save_json(data, path)
         return path
 
     def write_all(self, results: list[RunResult], matrix: ScenarioMatrix | None = None) -> dict[str, Path]:
         paths: dict[str, Path] = {}
         paths["csv"]  = self.write_csv(results)
+        if _HAS_PYARROW and results:
+            paths["parquet"] = self.write_parquet(results)
         paths["json"] = self.write_json(results)
         paths["summary"] = self.write_summary(_summarize(results))
         if matrix is not None:
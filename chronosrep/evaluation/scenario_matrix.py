@@ -1,5 +1,6 @@
 from __future__ import annotations
 import itertools
+from collections import defaultdict
 from dataclasses import dataclass, field
 import numpy as np
 
@@ -16,6 +17,10 @@ class MatrixCell:
     metrics: dict = field(default_factory=dict)
 
 
+def _coord_key(coords: dict) -> tuple:
+    return tuple(sorted(coords.items()))
+
+
 class ScenarioMatrix:
     def __init__(self, dimensions: list[MatrixDimension] | None = None):
         self._dims = dimensions or [
@@ -24,6 +29,7 @@ class ScenarioMatrix:
             MatrixDimension("scenario", ["baseline", "sleeper", "collusion"]),
         ]
         self._cells: list[MatrixCell] = self._build_grid()
+        self._index: dict[tuple, MatrixCell] = {_coord_key(c.coords): c for c in self._cells}
 
     def _build_grid(self) -> list[MatrixCell]:
         names  = [d.name for d in self._dims]
@@ -34,11 +40,14 @@ class ScenarioMatrix:
         return self._cells
 
     def fill(self, coords: dict, metrics: dict) -> None:
-        for cell in self._cells:
-            if cell.coords == coords:
-                cell.metrics.update(metrics)
-                return
-        self._cells.append(MatrixCell(coords=coords, metrics=metrics))
+        key = _coord_key(coords)
+        cell = self._index.get(key)
+        if cell is not None:
+            cell.metrics.update(metrics)
+            return
+        cell = MatrixCell(coords=coords, metrics=metrics)
+        self._cells.append(cell)
+        self._index[key] = cell
 
     def slice(self, **fixed_dims) -> list[MatrixCell]:
         result = []
@@ -48,19 +57,22 @@ class ScenarioMatrix:
         return result
 
     def pivot_table(self, row_dim: str, col_dim: str, metric: str) -> dict:
-        rows = sorted({c.coords[row_dim] for c in self._cells if row_dim in c.coords})
-        cols = sorted({c.coords[col_dim] for c in self._cells if col_dim in c.coords})
+        rows: set = set()
+        cols: set = set()
+        groups: dict[tuple, list] = defaultdict(list)
+        for cell in self._cells:
+            coords = cell.coords
+            if row_dim in coords:
+                rows.add(coords[row_dim])
+            if col_dim in coords:
+                cols.add(coords[col_dim])
+            if metric in cell.metrics:
+                groups[(coords.get(row_dim), coords.get(col_dim))].append(cell.metrics[metric])
         table: dict[str, dict] = {}
-        for r in rows:
+        for r in sorted(rows):
             table[str(r)] = {}
-            for c in cols:
-                matches = [
-                    cell.metrics.get(metric)
-                    for cell in self._cells
-                    if cell.coords.get(row_dim) == r
-                    and cell.coords.get(col_dim) == c
-                    and metric in cell.metrics
-                ]
+            for c in sorted(cols):
+                matches = groups.get((r, c))
                 if matches:
                     table[str(r)][str(c)] = float(np.mean(matches))
         return table
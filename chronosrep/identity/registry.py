@@ -46,8 +46,8 @@ def _fingerprint(data: bytes) -> str:
 class CredentialRegistry:
     def __init__(self):
         self._entries: dict[str, RegistryEntry] = {}
-        self._by_subject: dict[int, list[str]] = defaultdict(list)
-        self._by_type: dict[str, list[str]] = defaultdict(list)
+        self._by_subject: dict[int, list[RegistryEntry]] = defaultdict(list)
+        self._by_type: dict[str, list[RegistryEntry]] = defaultdict(list)
         self._total_registered: int = 0
         self._total_revoked: int = 0
 
@@ -66,8 +66,8 @@ class CredentialRegistry:
             attributes_hash=_fingerprint(attr_bytes),
         )
         self._entries[vc.vc_id] = entry
-        self._by_subject[vc.subject_id].append(vc.vc_id)
-        self._by_type[vc.vc_type].append(vc.vc_id)
+        self._by_subject[vc.subject_id].append(entry)
+        self._by_type[vc.vc_type].append(entry)
         self._total_registered += 1
         if vc.revoked:
             self._total_revoked += 1
@@ -77,8 +77,7 @@ class CredentialRegistry:
         return self._entries.get(vc_id)
 
     def subject_credentials(self, subject_id: int) -> list[RegistryEntry]:
-        ids = self._by_subject.get(subject_id, [])
-        return [self._entries[i] for i in ids if i in self._entries]
+        return list(self._by_subject.get(subject_id, ()))
 
     def revoke(self, vc_id: str) -> bool:
         e = self._entries.get(vc_id)
@@ -90,12 +89,12 @@ class CredentialRegistry:
 
     def active_count(self, subject_id: int) -> int:
         return sum(
-            1 for e in self.subject_credentials(subject_id)
+            1 for e in self._by_subject.get(subject_id, ())
             if e.status == _STATUS_ACTIVE
         )
 
     def revocation_ratio(self, subject_id: int) -> float:
-        creds = self.subject_credentials(subject_id)
+        creds = self._by_subject.get(subject_id, ())
         if not creds:
             return 0.0
         return sum(1 for e in creds if e.status == _STATUS_REVOKED) / len(creds)
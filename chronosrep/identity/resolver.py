@@ -22,15 +22,21 @@ class ResolutionResult:
     linked_domain: Optional[str]
 
 
+_DID_PREFIX_STATES = {m: hashlib.sha3_256(f"{m}:".encode()) for m in _DID_METHODS}
+_PUBKEY_PREFIX_STATE = hashlib.blake2b(b"pubkey:", digest_size=12)
+
+
 def _derive_did(subject_id: int, method: str) -> str:
-    raw = f"{method}:{subject_id:08d}".encode()
-    suffix = hashlib.sha3_256(raw).hexdigest()[:24]
-    return f"{method}:{suffix}"
+    base = _DID_PREFIX_STATES.get(method)
+    h = base.copy() if base is not None else hashlib.sha3_256(f"{method}:".encode())
+    h.update(f"{subject_id:08d}".encode())
+    return f"{method}:{h.hexdigest()[:24]}"
 
 
 def _key_fingerprint(subject_id: int, rotation: int) -> str:
-    raw = f"pubkey:{subject_id}:{rotation}".encode()
-    return hashlib.blake2b(raw, digest_size=12).hexdigest()
+    h = _PUBKEY_PREFIX_STATE.copy()
+    h.update(f"{subject_id}:{rotation}".encode())
+    return h.hexdigest()
 
 
 class DIDResolver:
@@ -1,8 +1,11 @@
 from __future__ import annotations
+import bisect
 import time
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+import numpy as np
+
 _EPOCH_DURATION_S = 3600
 
 
@@ -18,7 +21,7 @@ class RevocationEntry:
 class RevocationIndex:
     def __init__(self):
         self._revoked: dict[str, RevocationEntry] = {}
-        self._by_subject: dict[int, list[str]] = defaultdict(list)
+        self._by_subject: dict[int, list[tuple[int, str]]] = defaultdict(list)
         self._by_epoch: dict[int, list[str]] = defaultdict(list)
         self._t: int = 0
 
@@ -35,7 +38,7 @@ class RevocationIndex:
             reason=reason,
         )
         self._revoked[vc_id] = entry
-        self._by_subject[subject_id].append(vc_id)
+        self._by_subject[subject_id].append((self._t, vc_id))
         self._by_epoch[epoch].append(vc_id)
         return entry
 
@@ -43,12 +46,15 @@ class RevocationIndex:
         return vc_id in self._revoked
 
     def subject_revocations(self, subject_id: int) -> list[RevocationEntry]:
-        return [self._revoked[vid] for vid in self._by_subject.get(subject_id, []) if vid in self._revoked]
+        return [self._revoked[vid] for _, vid in self._by_subject.get(subject_id, []) if vid in self._revoked]
+
+    def subject_revocation_count(self, subject_id: int) -> int:
+        return len(self._by_subject.get(subject_id, ()))
 
     def revocation_velocity(self, subject_id: int, window_t: int = 50) -> float:
-        entries = self.subject_revocations(subject_id)
-        recent = [e for e in entries if self._t - e.revoked_at_t <= window_t]
-        return len(recent) / max(window_t, 1)
+        revs = self._by_subject.get(subject_id, [])
+        i = bisect.bisect_left(revs, (self._t - window_t,))
+        return (len(revs) - i) / max(window_t, 1)
 
     def epoch_revocation_count(self, epoch: int) -> int:
         return len(self._by_epoch.get(epoch, []))
@@ -57,14 +63,12 @@ class RevocationIndex:
         return len(self._revoked)
 
     def accumulation_vector(self, subject_id: int, n_bins: int = 10) -> list[int]:
-        entries = self.subject_revocations(subject_id)
-        if not entries:
+        revs = self._by_subject.get(subject_id, [])
+        if not revs:
             return [0] * n_bins
-        min_t = min(e.revoked_at_t for e in entries)
-        max_t = max(e.revoked_at_t for e in entries) + 1
+        ts = np.fromiter((t for t, _ in revs), dtype=np.int64, count=len(revs))
+        min_t = int(ts[0])
+        max_t = int(ts[-1]) + 1
         bin_size = max(1, (max_t - min_t) // n_bins)
-        bins = [0] * n_bins
-        for e in entries:
-            idx = min((e.revoked_at_t - min_t) // bin_size, n_bins - 1)
-            bins[idx] += 1
-        return bins
+        idx = np.minimum((ts - min_t) // bin_size, n_bins - 1)
+        return np.bincount(idx, minlength=n_bins).tolist()
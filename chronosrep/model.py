@@ -11,23 +11,70 @@ from chronosrep.modules import VCGen, IRV_PE, BSM, VADM, ITE
 class ChronosAgent(mesa.Agent):
     def __init__(self, unique_id: int, model: "ChronosRepModel"):
         super().__init__(unique_id, model)
-        self.irv: np.ndarray = np.zeros(5)
-        self.reputation: float = 0.5
-        self.volatility: float = 0.0
+        self._reset_state()
+
+    def reset(self, model: "ChronosRepModel") -> None:
+        self.model = model
+        self.pos = None
+        model.register_agent(self)
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.irv = np.zeros(5)
+        self.reputation = 0.5
+        self.volatility = 0.0
         self.evidence: list[float] = []
-        self.isolated: bool = False
-        self.is_attacker: bool = False
+        self.isolated = False
+        self.is_attacker = False
+
+    @property
+    def irv(self) -> np.ndarray:
+        return self.model.irv[self.unique_id]
+
+    @irv.setter
+    def irv(self, value: np.ndarray) -> None:
+        self.model.irv[self.unique_id] = value
+
+    @property
+    def reputation(self) -> float:
+        return float(self.model.reputation[self.unique_id])
+
+    @reputation.setter
+    def reputation(self, value: float) -> None:
+        self.model.reputation[self.unique_id] = value
+
+    @property
+    def volatility(self) -> float:
+        return float(self.model.volatility[self.unique_id])
+
+    @volatility.setter
+    def volatility(self, value: float) -> None:
+        self.model.volatility[self.unique_id] = value
+
+    @property
+    def isolated(self) -> bool:
+        return bool(self.model.isolated[self.unique_id])
+
+    @isolated.setter
+    def isolated(self, value: bool) -> None:
+        self.model.isolated[self.unique_id] = value
+
+    @property
+    def is_attacker(self) -> bool:
+        return bool(self.model.is_attacker[self.unique_id])
+
+    @is_attacker.setter
+    def is_attacker(self, value: bool) -> None:
+        self.model.is_attacker[self.unique_id] = value
 
     def step(self):
         if self.isolated:
             return
 
-        all_ids = [a.unique_id for a in self.model.schedule.agents if not a.isolated]
-
         credentials = self.model.vcgen.generate(self.unique_id, is_attacker=self.is_attacker)
         self.irv = self.model.irv_pe.process(self.unique_id, credentials)
 
-        interactions = self.model.ite.generate_interactions(self.unique_id, all_ids)
+        interactions = self.model.ite.generate_interactions(self.unique_id, self.model._active_idx)
         outcomes = [outcome for _, outcome in interactions]
         self.evidence = [
             self.model.ite.penalized_evidence(self.unique_id, target, outcome)
@@ -44,9 +91,20 @@ class ChronosAgent(mesa.Agent):
             self.unique_id, self.irv, r_static
         )
 
-        if self.reputation < self.model.TAU:
-            self.isolated = True
-            self.model._newly_isolated.add(self.unique_id)
+
+def _finalize_step(
+    reps: np.ndarray,
+    isolated: np.ndarray,
+    isolation_step: np.ndarray,
+    tau: float,
+    t: int,
+) -> None:
+    newly = ~isolated & (reps < tau)
+    isolated |= newly
+    isolation_step[newly & (isolation_step < 0)] = t
+
+
+_AGENT_POOL: dict[int, list[list[ChronosAgent]]] = {}
 
 
 class ChronosRepModel(mesa.Model):
@@ -54,24 +112,53 @@ class ChronosRepModel(mesa.Model):
     T: int = 500
     TAU: float = 0.4
 
-    def __init__(self, scenario=None):
+    def __init__(
+        self,
+        scenario=None,
+        n_agents: int | None = None,
+        t_steps: int | None = None,
+        tau: float | None = None,
+        rng: np.random.Generator | None = None,
+    ):
         super().__init__()
+        if n_agents is not None:
+            self.N = n_agents
+        if t_steps is not None:
+            self.T = t_steps
+        if tau is not None:
+            self.TAU = tau
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.reset_randomizer(int(self.rng.integers(2**63)))
         self.schedule = RandomActivation(self)
         self.scenario = scenario
         self.current_step: int = 0
 
-        self._newly_isolated: set[int] = set()
-        self._isolation_step: dict[int, int] = {}
-        self._attacker_ids: set[int] = set()
+        self.reputation = np.full(self.N, 0.5)
+        self.volatility = np.zeros(self.N)
+        self.irv = np.zeros((self.N, 5))
+        self.isolated = np.zeros(self.N, dtype=bool)
+        self.is_attacker = np.zeros(self.N, dtype=bool)
+        self._attacker_mask = np.zeros(self.N, dtype=bool)
+        self._isolation_step = np.full(self.N, -1, dtype=np.int32)
+        self._active_idx = np.arange(self.N, dtype=np.int32)
+        self._avg_rep: float = 0.0
+        self._iso_rate: float = 0.0
+        self._atk_rep: float = 0.0
 
         self.vcgen = VCGen()
         self.irv_pe = IRV_PE()
-        self.bsm = BSM()
-        self.vadm = VADM()
-        self.ite = ITE()
-
-        for i in range(self.N):
-            agent = ChronosAgent(i, self)
+        self.bsm = BSM(capacity=self.N)
+        self.vadm = VADM(seed=self.rng, capacity=self.N)
+        self.ite = ITE(seed=self.rng)
+
+        pooled = _AGENT_POOL.get(self.N)
+        if pooled:
+            self._agent_list = pooled.pop()
+            for agent in self._agent_list:
+                agent.reset(self)
+        else:
+            self._agent_list = [ChronosAgent(i, self) for i in range(self.N)]
+        for agent in self._agent_list:
             self.schedule.add(agent)
 
         if self.scenario:
@@ -79,40 +166,62 @@ class ChronosRepModel(mesa.Model):
 
         self.datacollector = DataCollector(
             model_reporters={
-                "AvgReputation": lambda m: float(np.mean(
-                    [a.reputation for a in m.schedule.agents if not a.isolated]
-                )) if any(not a.isolated for a in m.schedule.agents) else 0.0,
-                "IsolationRate": lambda m: sum(
-                    1 for a in m.schedule.agents if a.isolated
-                ) / m.N,
-                "AttackerAvgReputation": lambda m: float(np.mean(
-                    [a.reputation for a in m.schedule.agents
-                     if a.unique_id in m._attacker_ids and not a.isolated]
-                )) if any(
-                    a.unique_id in m._attacker_ids and not a.isolated
-                    for a in m.schedule.agents
-                ) else 0.0,
+                "AvgReputation": lambda m: m._avg_rep,
+                "IsolationRate": lambda m: m._iso_rate,
+                "AttackerAvgReputation": lambda m: m._atk_rep,
             }
         )
 
     def step(self):
-        self._newly_isolated.clear()
         self.current_step += 1
 
         if self.scenario:
             self.scenario.inject(self)
 
+        self._active_idx = np.flatnonzero(~self.isolated).astype(np.int32)
         self.schedule.step()
+        _finalize_step(
+            self.reputation, self.isolated, self._isolation_step,
+            self.TAU, self.current_step,
+        )
         self.ite.tick()
 
-        for uid in self._newly_isolated:
-            if uid not in self._isolation_step:
-                self._isolation_step[uid] = self.current_step
-
+        self._compute_step_metrics()
         self.datacollector.collect(self)
 
+    def run(self, n_steps: int | None = None) -> None:
+        step = self.step
+        for _ in range(self.T if n_steps is None else n_steps):
+            step()
+
+    def _compute_step_metrics(self) -> None:
+        alive = ~self.isolated
+        self._avg_rep = float(self.reputation[alive].mean()) if alive.any() else 0.0
+        self._iso_rate = float(self.isolated.mean())
+        atk_alive = self._attacker_mask & alive
+        self._atk_rep = float(self.reputation[atk_alive].mean()) if atk_alive.any() else 0.0
+
+    @property
+    def _attacker_ids(self) -> set[int]:
+        return set(np.flatnonzero(self._attacker_mask).tolist())
+
+    def mark_attackers(self, idx, behaving: bool = True) -> None:
+        self._attacker_mask[idx] = True
+        self.is_attacker[idx] = behaving
+
+    def release_agents(self) -> None:
+        if self._agent_list:
+            for agent in self._agent_list:
+                self.deregister_agent(agent)
+            self.schedule = RandomActivation(self)
+            _AGENT_POOL.setdefault(self.N, []).append(self._agent_list)
+            self._agent_list = []
+
     def time_to_detection(self, attacker_ids: set[int] | None = None) -> float | None:
-        ids = attacker_ids or self._attacker_ids
-        detected = [self._isolation_step[i] for i in ids if i in self._isolation_step]
-        return float(np.mean(detected)) if detected else None
+        if attacker_ids:
+            steps = self._isolation_step[list(attacker_ids)]
+        else:
+            steps = self._isolation_step[self._attacker_mask]
+        detected = steps[steps >= 0]
+        return float(detected.mean()) if detected.size else None
 
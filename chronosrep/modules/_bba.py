@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+
+TR, UN, UK = 0b001, 0b010, 0b100
+TR_UN = TR | UN
+TR_UK = TR | UK
+UN_UK = UN | UK
+FRAME = TR | UN | UK
+
+ELEMENTS   = (TR, UN, UK)
+
+SUBSETS_MASKS: tuple[int, ...] = (TR, UN, UK, TR_UN, TR_UK, UN_UK, FRAME)
+SUBSET_COUNT = len(SUBSETS_MASKS)
+
+POPCOUNT    = np.array([0, 1, 1, 2, 1, 2, 2, 3], dtype=np.uint8)
+SUBSET_BITS = np.array(SUBSETS_MASKS, dtype=np.uint8)
+
+BIT_TO_IDX = np.full(FRAME + 1, -1, dtype=np.int64)
+BIT_TO_IDX[SUBSET_BITS] = np.arange(SUBSET_COUNT)
+FRAME_IDX  = int(BIT_TO_IDX[FRAME])
+
+INTER_INDEX   = BIT_TO_IDX[SUBSET_BITS[:, None] & SUBSET_BITS[None, :]]
+INTER_VALID   = INTER_INDEX >= 0
+INTER_TARGETS = INTER_INDEX[INTER_VALID]
+
+INTER_SCATTER = np.zeros((SUBSET_COUNT * SUBSET_COUNT, SUBSET_COUNT))
+INTER_SCATTER[np.flatnonzero(INTER_VALID), INTER_TARGETS] = 1.0
+CONFLICT_FLAT = (~INTER_VALID).ravel().astype(np.float64)
+
+VACUOUS_BASIS = np.zeros(SUBSET_COUNT)
+VACUOUS_BASIS[FRAME_IDX] = 1.0
+
+BELIEF_MASKS = {
+    hyp: np.array([float((A & hyp) == A) for A in SUBSETS_MASKS]) for hyp in SUBSETS_MASKS
+}
+PLAUS_MASKS = {
+    hyp: np.array([float((A & hyp) != 0) for A in SUBSETS_MASKS]) for hyp in SUBSETS_MASKS
+}
+BELIEF_MASK_TR = BELIEF_MASKS[TR]
+BELIEF_MASK_UN = BELIEF_MASKS[UN]
+BELIEF_MASK_UK = BELIEF_MASKS[UK]
+PLAUS_MASK_TR  = PLAUS_MASKS[TR]
+
+PIG_SHARE = np.array([
+    [float((A & e) != 0) / POPCOUNT[A] for e in ELEMENTS] for A in SUBSETS_MASKS
+])
+SUBSET_DENOMS = ((1 << POPCOUNT[SUBSET_BITS].astype(np.int64)) - 1).astype(np.float64)
+LOG_DENOMS    = np.log(SUBSET_DENOMS)
+LN2_RECIP     = 1.0 / np.log(2.0)
+
+
+def bba_to_vec(bba: dict[int, float]) -> np.ndarray:
+    vec = np.zeros(SUBSET_COUNT)
+    for A, m in bba.items():
+        if A:
+            vec[BIT_TO_IDX[A]] += m
+    return vec
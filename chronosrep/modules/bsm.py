@@ -1,96 +1,140 @@
 from __future__ import annotations
 import math
-from collections import deque
-from dataclasses import dataclass, field
 
 import numpy as np
 
+from chronosrep.utils.jit import njit, prange
+
 _CUSUM_H     = 4.0
 _CUSUM_K     = 0.5
 _ZSCORE_WIN  = 30
 _ENTROPY_EPS = 1e-9
 
 
-@dataclass
-class _StreamState:
-    window: deque = field(default_factory=lambda: deque(maxlen=_ZSCORE_WIN))
-    cusum_pos: float = 0.0
-    cusum_neg: float = 0.0
-    alarm_count: int = 0
-    last_entropy: float = 0.0
-    t: int = 0
-
-
-def _shannon_entropy(probs: np.ndarray) -> float:
-    p = probs[probs > _ENTROPY_EPS]
-    return float(-np.sum(p * np.log2(p)))
-
-
-def _outcome_distribution(window: deque) -> np.ndarray:
-    arr = np.array(list(window), dtype=float)
-    if len(arr) == 0:
-        return np.array([0.5, 0.5])
-    p1 = arr.mean()
-    p0 = 1.0 - p1
-    return np.array([p0, p1])
-
-
-def _zscore_normalize(value: float, window: deque) -> float:
-    if len(window) < 2:
-        return 0.0
-    arr = np.array(list(window), dtype=float)
-    mu, sigma = arr.mean(), arr.std()
-    if sigma < _ENTROPY_EPS:
-        return 0.0
-    return (value - mu) / sigma
-
-
-def _cusum_update(
-    z: float,
-    s_pos: float,
-    s_neg: float,
-    k: float = _CUSUM_K,
-) -> tuple[float, float, bool]:
-    s_pos = max(0.0, s_pos + z - k)
-    s_neg = max(0.0, s_neg - z - k)
-    alarm = (s_pos > _CUSUM_H) or (s_neg > _CUSUM_H)
-    if alarm:
-        s_pos = 0.0
-        s_neg = 0.0
-    return s_pos, s_neg, alarm
+def _binary_entropy(p1: float) -> float:
+    h = 0.0
+    for p in (1.0 - p1, p1):
+        if p > _ENTROPY_EPS:
+            h -= p * math.log2(p)
+    return h
+
+
+def _binary_entropy_vec(p1: np.ndarray) -> np.ndarray:
+    P = np.stack([1.0 - p1, p1])
+    logp = np.log2(P, out=np.zeros_like(P), where=P > _ENTROPY_EPS)
+    return -(P * logp).sum(axis=0)
+
+
+@njit(cache=True)
+def _monitor_kernel(values, buf, t0, total, total_sq, s_pos, s_neg, k, h, alarm):
+    win = buf.shape[0]
+    head = t0 % win
+    count = min(t0, win)
+    n_alarms = 0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if count == win:
+            old = buf[head]
+            total -= old
+            total_sq -= old * old
+        else:
+            count += 1
+        buf[head] = v
+        head = (head + 1) % win
+        total += v
+        total_sq += v * v
+
+        z = 0.0
+        if count >= 2:
+            mu = total / count
+            var = total_sq / count - mu * mu
+            if var > 0.0:
+                sigma = math.sqrt(var)
+                if sigma >= _ENTROPY_EPS:
+                    z = (v - mu) / sigma
+
+        s_pos = max(0.0, s_pos + z - k)
+        s_neg = max(0.0, s_neg - z - k)
+        if s_pos > h or s_neg > h:
+            s_pos = 0.0
+            s_neg = 0.0
+            alarm[i] = True
+            n_alarms += 1
+    return total, total_sq, s_pos, s_neg, n_alarms
+
+
+@njit(cache=True, parallel=True)
+def _monitor_batch_kernel(slots, values, buf, t, total, total_sq, s_pos, s_neg, k, h, alarm, n_alarms):
+    for i in prange(slots.shape[0]):
+        s = slots[i]
+        res = _monitor_kernel(
+            values[i], buf[s], t[s], total[s], total_sq[s], s_pos[s], s_neg[s], k, h, alarm[i],
+        )
+        total[s] = res[0]
+        total_sq[s] = res[1]
+        s_pos[s] = res[2]
+        s_neg[s] = res[3]
+        n_alarms[i] = res[4]
 
 
 class BSM:
-    def __init__(self, cusum_h: float = _CUSUM_H, cusum_k: float = _CUSUM_K):
+    def __init__(self, cusum_h: float = _CUSUM_H, cusum_k: float = _CUSUM_K, capacity: int = 64):
         self._h = cusum_h
         self._k = cusum_k
-        self._states: dict[int, _StreamState] = {}
-
-    def _ensure(self, agent_id: int) -> _StreamState:
-        if agent_id not in self._states:
-            self._states[agent_id] = _StreamState()
-        return self._states[agent_id]
+        self._slot: dict[int, int] = {}
+        self._alloc(max(capacity, 1))
+
+    def _alloc(self, cap: int) -> None:
+        n = len(self._slot)
+        old = getattr(self, "_buf", None)
+        buf = np.zeros((cap, _ZSCORE_WIN))
+        fields = {
+            "_total": np.float64, "_total_sq": np.float64,
+            "_cusum_pos": np.float64, "_cusum_neg": np.float64,
+            "_last_entropy": np.float64, "_alarm_count": np.int64, "_t": np.int64,
+        }
+        if old is not None:
+            buf[:n] = old[:n]
+        self._buf = buf
+        for name, dtype in fields.items():
+            arr = np.zeros(cap, dtype=dtype)
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+
+    def _ensure(self, agent_id: int) -> int:
+        slot = self._slot.get(agent_id)
+        if slot is None:
+            slot = len(self._slot)
+            if slot == self._buf.shape[0]:
+                self._alloc(2 * slot)
+            self._slot[agent_id] = slot
+        return slot
 
     def monitor(self, agent_id: int, behavior_stream: list[int]) -> dict:
         s = self._ensure(agent_id)
-        alarms: list[int] = []
-
-        for outcome in behavior_stream:
-            s.window.append(float(outcome))
-            z = _zscore_normalize(float(outcome), s.window)
-            s.cusum_pos, s.cusum_neg, alarm = _cusum_update(z, s.cusum_pos, s.cusum_neg, self._k)
-            if alarm:
-                s.alarm_count += 1
-                alarms.append(s.t)
-            s.t += 1
-
-        dist = _outcome_distribution(s.window)
-        h = _shannon_entropy(dist)
-        s.last_entropy = h
-
-        arr = np.array(list(s.window), dtype=float)
-        mean_outcome = float(arr.mean()) if len(arr) > 0 else 0.5
-        anomaly_score = float(s.alarm_count) / max(s.t, 1)
+        values = np.asarray(behavior_stream, dtype=np.float64)
+        alarm = np.zeros(values.shape[0], dtype=np.bool_)
+        t0 = self._t.item(s)
+        total, total_sq, s_pos, s_neg, n_alarms = _monitor_kernel(
+            values, self._buf[s], t0, self._total.item(s), self._total_sq.item(s),
+            self._cusum_pos.item(s), self._cusum_neg.item(s), self._k, self._h, alarm,
+        )
+        self._total[s] = total
+        self._total_sq[s] = total_sq
+        self._cusum_pos[s] = s_pos
+        self._cusum_neg[s] = s_neg
+        alarms = [t0 + i for i in np.flatnonzero(alarm).tolist()] if n_alarms else []
+        alarm_count = self._alarm_count.item(s) + n_alarms
+        t = t0 + values.shape[0]
+        self._alarm_count[s] = alarm_count
+        self._t[s] = t
+
+        count = min(t, _ZSCORE_WIN)
+        mean_outcome = float(total / count) if count > 0 else 0.5
+        h = _binary_entropy(mean_outcome)
+        self._last_entropy[s] = h
+        anomaly_score = float(alarm_count) / max(t, 1)
 
         return {
             "agent_id":      agent_id,
@@ -98,13 +142,47 @@ class BSM:
             "entropy":       h,
             "anomaly_score": anomaly_score,
             "alarm_steps":   alarms,
-            "cusum_pos":     s.cusum_pos,
-            "cusum_neg":     s.cusum_neg,
-            "t":             s.t,
+            "cusum_pos":     float(s_pos),
+            "cusum_neg":     float(s_neg),
+            "t":             t,
+        }
+
+    def monitor_batch(self, agent_ids, streams_2d: np.ndarray) -> dict[str, np.ndarray]:
+        ids = np.asarray(agent_ids, dtype=np.int64)
+        if np.unique(ids).size != ids.size:
+            raise ValueError("agent_ids must be unique within a batch")
+        slots = np.fromiter((self._ensure(int(a)) for a in ids), dtype=np.int64, count=ids.size)
+        values = np.ascontiguousarray(streams_2d, dtype=np.float64).reshape(ids.size, -1)
+        alarm = np.zeros(values.shape, dtype=np.bool_)
+        n_alarms = np.zeros(ids.size, dtype=np.int64)
+        _monitor_batch_kernel(
+            slots, values, self._buf, self._t, self._total, self._total_sq,
+            self._cusum_pos, self._cusum_neg, self._k, self._h, alarm, n_alarms,
+        )
+        self._alarm_count[slots] += n_alarms
+        self._t[slots] += values.shape[1]
+
+        t = self._t[slots]
+        count = np.minimum(t, _ZSCORE_WIN)
+        mean_outcome = np.divide(
+            self._total[slots], count, out=np.full(ids.size, 0.5), where=count > 0,
+        )
+        h = _binary_entropy_vec(mean_outcome)
+        self._last_entropy[slots] = h
+
+        return {
+            "agent_id":      ids,
+            "mean_outcome":  mean_outcome,
+            "entropy":       h,
+            "anomaly_score": self._alarm_count[slots] / np.maximum(t, 1),
+            "alarm_mask":    alarm,
+            "cusum_pos":     self._cusum_pos[slots],
+            "cusum_neg":     self._cusum_neg[slots],
+            "t":             t,
         }
 
     def anomaly_score(self, agent_id: int) -> float:
-        s = self._states.get(agent_id)
-        if s is None or s.t == 0:
+        s = self._slot.get(agent_id)
+        if s is None or self._t[s] == 0:
             return 0.0
-        return s.alarm_count / s.t
+        return float(self._alarm_count[s] / self._t[s])
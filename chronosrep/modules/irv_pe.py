@@ -1,134 +1,45 @@
 from __future__ import annotations
-import math
-from itertools import chain, combinations
-from typing import TYPE_CHECKING
-
 import numpy as np
 
-if TYPE_CHECKING:
-    from chronosrep.modules.vcgen import VCRecord
-
-_FRAME = frozenset({"trusted", "untrusted", "unknown"})
-_S_TR  = frozenset({"trusted"})
-_S_UN  = frozenset({"untrusted"})
-_S_UK  = frozenset({"unknown"})
-_EMPTY = frozenset()
-
-_VC_TYPE_WEIGHT = {
-    "KYC":        1.00,
-    "DID_DOC":    0.85,
-    "BEHAVIORAL": 0.90,
-    "DELEGATED":  0.70,
-    "GOVERNANCE": 0.75,
-}
-
-_TIER_DISCOUNT = {
-    "ROOT_CA":         1.00,
-    "INTERMEDIATE_CA": 0.90,
-    "LEAF_ISSUER":     0.75,
-}
-
-_CHAIN_DEPTH_PENALTY = 0.05
-
-
-def _powerset(s):
-    return [
-        frozenset(c)
-        for c in chain.from_iterable(combinations(list(s), r) for r in range(1, len(s) + 1))
-    ]
-
-
-_SUBSETS = _powerset(_FRAME)
-
-
-def _belief_entropy(bba: dict) -> float:
-    h = 0.0
-    for A, m in bba.items():
-        if m <= 0.0:
-            continue
-        card = len(A)
-        denom = (1 << card) - 1
-        if denom <= 0:
-            continue
-        h -= m * math.log2(m / denom)
-    return h
-
-
-def _conflict_coeff(m1: dict, m2: dict) -> float:
-    K = 0.0
-    for A in _SUBSETS:
-        for B in _SUBSETS:
-            if A & B == _EMPTY:
-                K += m1.get(A, 0.0) * m2.get(B, 0.0)
-    return min(K, 1.0)
-
-
-def _chronosrep_combine(m1: dict, m2: dict) -> dict:
-    K = _conflict_coeff(m1, m2)
-    if K >= 1.0:
-        return {_FRAME: 1.0}
-    norm = 1.0 - K
-    fused: dict = {}
-    for A in _SUBSETS:
-        mass = sum(
-            m1.get(B, 0.0) * m2.get(C, 0.0)
-            for B in _SUBSETS
-            for C in _SUBSETS
-            if B & C == A
-        )
-        if mass > 0.0:
-            fused[A] = mass / norm
-    return fused
-
+from chronosrep.modules._bba import (
+    INTER_SCATTER, CONFLICT_FLAT, VACUOUS_BASIS,
+    BELIEF_MASK_TR, BELIEF_MASK_UN, BELIEF_MASK_UK,
+    PLAUS_MASK_TR, PIG_SHARE, LOG_DENOMS, LN2_RECIP,
+)
 
-def _condition_bba(bba: dict, condition_set: frozenset) -> dict:
-    if not condition_set:
-        return bba
-    conditioned: dict = {}
-    for A in _SUBSETS:
-        intersection = A & condition_set
-        if not intersection:
-            continue
-        conditioned[intersection] = conditioned.get(intersection, 0.0) + bba.get(A, 0.0)
-    total = sum(conditioned.values())
-    if total == 0.0:
-        return {_FRAME: 1.0}
-    return {k: v / total for k, v in conditioned.items()}
+_IRV_PROJ = np.column_stack([
+    BELIEF_MASK_TR, BELIEF_MASK_UN, BELIEF_MASK_UK, PLAUS_MASK_TR, PIG_SHARE[:, 0],
+])
 
 
-def _downweight_bba(bba: dict, w: float) -> dict:
-    vacuous = 1.0 - w
-    result: dict = {}
-    for A, m in bba.items():
-        result[A] = m * w + (vacuous if A == _FRAME else 0.0)
-    return result
+def _belief_entropies(M: np.ndarray) -> np.ndarray:
+    logm = np.log(M, out=np.zeros_like(M), where=M > 0.0)
+    return -np.einsum("...i,...i->...", M, logm - LOG_DENOMS) * LN2_RECIP
 
 
-def _pignistic_transform(bba: dict) -> dict:
-    betp: dict = {e: 0.0 for e in ["trusted", "untrusted", "unknown"]}
-    for A, m in bba.items():
-        card = len(A)
-        if card == 0:
-            continue
-        share = m / card
-        for elem in A:
-            betp[elem] = betp.get(elem, 0.0) + share
-    return betp
+def _combine_batch(M1: np.ndarray, M2: np.ndarray) -> np.ndarray:
+    O = (M1[:, :, None] * M2[:, None, :]).reshape(M1.shape[0], -1)
+    K = np.minimum(O @ CONFLICT_FLAT, 1.0)
+    total_conflict = K >= 1.0
+    fused = (O @ INTER_SCATTER) / np.where(total_conflict, 1.0, 1.0 - K)[:, None]
+    fused[total_conflict] = VACUOUS_BASIS
+    return fused
 
 
-def _belief(bba: dict, hyp: frozenset) -> float:
-    return sum(m for A, m in bba.items() if A and A <= hyp)
+def _fuse_all(M: np.ndarray) -> np.ndarray:
+    while M.shape[0] > 1:
+        half = M.shape[0] // 2
+        fused = _combine_batch(M[0:2 * half:2], M[1:2 * half:2])
+        M = np.vstack([fused, M[2 * half:]]) if M.shape[0] % 2 else fused
+    return M[0]
 
 
-def _plausibility(bba: dict, hyp: frozenset) -> float:
-    return sum(m for A, m in bba.items() if A & hyp)
+def _downweight_bba(m: np.ndarray, w: float | np.ndarray) -> np.ndarray:
+    return m * w + VACUOUS_BASIS * (1.0 - w)
 
 
-def _effective_weight(vc) -> float:
-    type_w  = _VC_TYPE_WEIGHT.get(vc.vc_type, 0.7)
-    tier_d  = _TIER_DISCOUNT.get(vc.issuer_tier, 0.7)
-    depth_p = max(0.0, 1.0 - vc.chain_depth * _CHAIN_DEPTH_PENALTY)
-    return vc.issuer_trust * type_w * tier_d * depth_p
+def _effective_weights(credentials: list) -> np.ndarray:
+    return np.fromiter((vc._effective_w for vc in credentials), np.float64, len(credentials))
 
 
 class IRV_PE:
@@ -141,37 +52,19 @@ class IRV_PE:
         if not active:
             active = credentials
 
-        bbas: list[dict] = []
-        for vc in active:
-            bba = dict(vc.bba)
-            h = _belief_entropy(bba)
-            w = _effective_weight(vc)
-            if vc.revoked:
-                w *= (1.0 - self.revocation_penalty)
-            if h > self.eta:
-                w *= self.eta / h
-            w = max(0.01, min(w, 1.0))
-            if w < 1.0:
-                bba = _downweight_bba(bba, w)
-            bbas.append(bba)
-
-        if not bbas:
+        if not active:
             return np.zeros(5)
 
-        fused = bbas[0]
-        for nxt in bbas[1:]:
-            fused = _chronosrep_combine(fused, nxt)
-
-        betp = _pignistic_transform(fused)
+        M = np.stack([vc._bba_vec for vc in active])
+        w = _effective_weights(active)
+        revoked = np.fromiter((vc.revoked for vc in active), bool, len(active))
+        w = np.where(revoked, w * (1.0 - self.revocation_penalty), w)
+        h = _belief_entropies(M)
+        w = np.where(h > self.eta, w * self.eta / np.maximum(h, self.eta), w)
+        w = np.clip(w, 0.01, 1.0)
+        M = _downweight_bba(M, w[:, None])
 
-        bel_tr  = _belief(fused, _S_TR)
-        bel_un  = _belief(fused, _S_UN)
-        bel_uk  = _belief(fused, _S_UK)
-        pl_tr   = _plausibility(fused, _S_TR)
-        betp_tr = betp.get("trusted", 0.0)
+        fused = _fuse_all(M)
 
-        irv = np.clip(
-            np.array([bel_tr, bel_un, bel_uk, pl_tr, betp_tr]),
-            0.0, 1.0,
-        )
+        irv = np.clip(fused @ _IRV_PROJ, 0.0, 1.0)
         return irv
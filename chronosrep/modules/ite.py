@@ -1,12 +1,16 @@
 from __future__ import annotations
-import random
 from collections import defaultdict
 from dataclasses import dataclass, field
 
 import networkx as nx
-import community as community_louvain
 import numpy as np
 
+try:
+    import igraph as ig
+    _HAS_IGRAPH = True
+except ImportError:
+    _HAS_IGRAPH = False
+
 _SUSPECT_DIN   = 0.60
 _SUSPECT_EXTER = 0.20
 _BETA          = 0.5
@@ -42,15 +46,16 @@ class ITE:
         gamma: float = _GAMMA,
         recompute_interval: int = 10,
         k_interactions: int = 3,
-        seed: int = 42,
+        seed: int | np.random.Generator = 42,
     ):
         self._beta = beta
         self._gamma = gamma
         self._recompute_interval = recompute_interval
         self._k = k_interactions
-        self._rng = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
 
         self._graph: nx.DiGraph = nx.DiGraph()
+        self._edge_meta: dict[tuple[int, int], list[int]] = {}
         self._nbrs: dict[int, set] = defaultdict(set)
         self._partition: dict[int, int] = {}
         self._comm_stats: dict[int, _CommStats] = {}
@@ -63,53 +68,88 @@ class ITE:
                 self._nbrs.setdefault(aid, set())
 
     def _add_edge(self, u: int, v: int, outcome: int) -> None:
-        if self._graph.has_edge(u, v):
-            self._graph[u][v]["weight"] = self._graph[u][v]["weight"] + 1
-            self._graph[u][v]["last"] = outcome
-        else:
-            self._graph.add_edge(u, v, weight=1, last=outcome)
-        self._nbrs[u].add(v)
-        self._nbrs[v].add(u)
+        meta = self._edge_meta.get((u, v))
+        if meta is not None:
+            meta[0] += 1
+            meta[1] = outcome
+            return
+        self._edge_meta[(u, v)] = [1, outcome]
+        self._graph.add_edge(u, v)
+        nbrs = self._nbrs
+        nu = nbrs.get(u)
+        if nu is None:
+            nu = nbrs[u] = set()
+        nu.add(v)
+        nv = nbrs.get(v)
+        if nv is None:
+            nv = nbrs[v] = set()
+        nv.add(u)
 
     def _recompute(self) -> None:
-        G_und = nx.Graph()
-        G_und.add_nodes_from(self._graph.nodes())
-        G_und.add_edges_from(self._graph.edges())
-        if G_und.number_of_edges() == 0:
-            self._partition = {n: n for n in G_und.nodes()}
+        if self._graph.number_of_edges() == 0:
+            self._partition = {n: n for n in self._graph.nodes()}
         else:
-            self._partition = community_louvain.best_partition(G_und)
-
-        by_comm: dict[int, list] = defaultdict(list)
-        for node, comm in self._partition.items():
-            by_comm[comm].append(node)
+            self._partition = self._louvain()
+        part = self._partition
+
+        by_comm: dict[int, set] = defaultdict(set)
+        for node, comm in part.items():
+            by_comm[comm].add(node)
+
+        internal_cnt: dict[int, int] = defaultdict(int)
+        external_cnt: dict[int, int] = defaultdict(int)
+        for u, v in self._edge_meta:
+            cu = part[u]
+            cv = part[v]
+            if cu == cv:
+                internal_cnt[cu] += 1
+            else:
+                external_cnt[cu] += 1
 
         self._comm_stats = {}
-        for cid, members in by_comm.items():
-            n = len(members)
-            mset = set(members)
-            internal = sum(1 for u, v in self._graph.edges() if u in mset and v in mset)
-            external = sum(1 for u, v in self._graph.edges() if u in mset and v not in mset)
+        for cid, mset in by_comm.items():
+            n = len(mset)
+            internal = internal_cnt[cid]
+            external = external_cnt[cid]
             max_int = n * (n - 1)
             din = internal / max_int if max_int > 0 else 0.0
             total_out = internal + external
             ext_ratio = external / total_out if total_out > 0 else 1.0
             self._comm_stats[cid] = _CommStats(members=mset, din=din, ext_ratio=ext_ratio)
 
+    def _louvain(self) -> dict[int, int]:
+        if _HAS_IGRAPH:
+            nodes = list(self._graph.nodes())
+            pos = {n: i for i, n in enumerate(nodes)}
+            g = ig.Graph(n=len(nodes), edges=[(pos[u], pos[v]) for u, v in self._edge_meta])
+            g.simplify()
+            return dict(zip(nodes, g.community_multilevel().membership))
+        G_und = self._graph.to_undirected(as_view=True)
+        comms = nx.community.louvain_communities(G_und, weight=None, seed=self._rng)
+        return {n: cid for cid, members in enumerate(comms) for n in members}
+
     def tick(self) -> None:
         self._step += 1
         if self._step % self._recompute_interval == 0:
             self._recompute()
 
     def generate_interactions(
-        self, agent_id: int, all_ids: list[int]
+        self, agent_id: int, active_idx: np.ndarray
     ) -> list[tuple[int, int]]:
-        self._ensure([agent_id] + all_ids)
-        candidates = [x for x in all_ids if x != agent_id]
-        targets = self._rng.sample(candidates, min(self._k, len(candidates)))
+        active_idx = np.asarray(active_idx)
+        n = active_idx.size
+        pos = int(np.searchsorted(active_idx, agent_id))
+        present = pos < n and active_idx[pos] == agent_id
+        n_cand = n - 1 if present else n
+        k = min(self._k, n_cand)
+        picks = self._rng.choice(n_cand, size=k, replace=False)
+        if present:
+            picks[picks >= pos] += 1
+        targets = active_idx[picks].tolist()
+        outcomes = self._rng.integers(0, 2, size=k).tolist()
+        self._ensure([agent_id] + targets)
         pairs: list[tuple[int, int]] = []
-        for t in targets:
-            outcome = self._rng.randint(0, 1)
+        for t, outcome in zip(targets, outcomes):
             self._add_edge(agent_id, t, outcome)
             pairs.append((t, outcome))
         return pairs
@@ -118,6 +158,14 @@ class ITE:
         self._ensure([u, v])
         self._add_edge(u, v, outcome)
 
+    def force_interaction_batch(self, src: np.ndarray, dst: np.ndarray, outcome: int) -> None:
+        src = np.asarray(src).tolist()
+        dst = np.asarray(dst).tolist()
+        self._ensure(list(dict.fromkeys(x for pair in zip(src, dst) for x in pair)))
+        add = self._add_edge
+        for u, v in zip(src, dst):
+            add(u, v, outcome)
+
     def penalized_evidence(
         self, endorser_id: int, target_id: int, raw_outcome: int
     ) -> float:
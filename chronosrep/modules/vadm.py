@@ -1,53 +1,119 @@
 from __future__ import annotations
-from collections import deque
-from dataclasses import dataclass, field
+from math import sqrt
 
 import numpy as np
 
+from chronosrep.utils.jit import HAS_NUMBA, njit, prange
+
 _GAMMA_THRESHOLD = 3.0
 _X_LO = 0.0
 _X_HI = 1.0
+_NOISE_POOL = 1 << 16
 
 
-@dataclass
-class _AgentState:
-    x: float
-    theta: float
-    history: deque = field(default_factory=lambda: deque(maxlen=20))
-    t: int = 0
-
-
+@njit("float64(float64, float64)", cache=True)
 def _noise_floor(sigma: float, theta: float) -> float:
-    return sigma / max(np.sqrt(2.0 * theta), 1e-8)
+    return sigma / max(sqrt(2.0 * theta), 1e-8)
 
 
+@njit("float64(float64, float64, float64)", cache=True)
 def _gamma_ratio(epsilon: float, sigma: float, theta: float) -> float:
     nf = _noise_floor(sigma, theta)
     return abs(epsilon) / nf if nf > 0 else 0.0
 
 
+@njit("float64(float64, float64, float64, float64, float64, float64, float64)", cache=True, fastmath=True)
 def _euler_maruyama(
     x: float,
     mu: float,
     theta: float,
     sigma: float,
     dt: float,
-    rng: np.random.Generator,
-    jump_scale: float,
-    gamma: float,
+    z: float,
+    jump_draw: float,
 ) -> float:
     drift = theta * (mu - x) * dt
-    diffusion = sigma * rng.standard_normal() * np.sqrt(dt)
-    jump = 0.0
-    if gamma > _GAMMA_THRESHOLD:
-        direction = -1.0 if x > mu else 1.0
-        jump = direction * abs(rng.normal(0.0, jump_scale))
-    return float(np.clip(x + drift + diffusion + jump, _X_LO, _X_HI))
+    diffusion = sigma * z * sqrt(dt)
+    direction = -1.0 if x > mu else 1.0
+    jump = direction * abs(jump_draw)
+    return min(max(x + drift + diffusion + jump, _X_LO), _X_HI)
 
 
+@njit("float64(float64, float64, float64, float64)", cache=True, fastmath=True)
 def _update_theta(theta: float, epsilon: float, alpha: float, dt: float) -> float:
     grad = epsilon - theta * dt
-    return float(np.clip(theta + alpha * grad, 1e-4, 10.0))
+    return min(max(theta + alpha * grad, 1e-4), 10.0)
+
+
+@njit("float64[::1](float64, float64, float64, float64, float64, float64[:])", cache=True, fastmath=True)
+def _ou_trajectory(
+    x0: float,
+    mu: float,
+    theta: float,
+    sigma: float,
+    dt: float,
+    noise: np.ndarray,
+) -> np.ndarray:
+    x = np.empty(noise.shape[0] + 1)
+    x[0] = x0
+    sq_dt = sqrt(dt)
+    for i in range(noise.shape[0]):
+        nxt = x[i] + theta * (mu - x[i]) * dt + sigma * noise[i] * sq_dt
+        x[i + 1] = min(max(nxt, _X_LO), _X_HI)
+    return x
+
+
+def _ou_trajectory_py(
+    x0: float,
+    mu: float,
+    theta: float,
+    sigma: float,
+    dt: float,
+    noise: list[float],
+) -> list[float]:
+    sq_dt = sqrt(dt)
+    x = x0
+    out = [x0]
+    for z in noise:
+        nxt = x + theta * (mu - x) * dt + sigma * z * sq_dt
+        x = _X_LO if nxt < _X_LO else (_X_HI if nxt > _X_HI else nxt)
+        out.append(x)
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _step_batch_kernel(
+    slots, mu, r_static, z, jump_draw, x, theta, hist, hsum, hsumsq, t,
+    sigma, dt, alpha, gamma_threshold, x_out, sigma_out,
+):
+    win = hist.shape[1]
+    for i in prange(slots.shape[0]):
+        s = slots[i]
+        xs = x[s]
+        epsilon = abs(r_static[i] - xs)
+        gamma = _gamma_ratio(epsilon, sigma, theta[s])
+        th = _update_theta(theta[s], epsilon, alpha, dt)
+        jd = jump_draw[i] if gamma > gamma_threshold else 0.0
+        xs = _euler_maruyama(xs, mu[i], th, sigma, dt, z[i], jd)
+        x[s] = xs
+        theta[s] = th
+        head = t[s] % win
+        if t[s] >= win:
+            old = hist[s, head]
+            hsum[s] -= old
+            hsumsq[s] -= old * old
+        hist[s, head] = xs
+        hsum[s] += xs
+        hsumsq[s] += xs * xs
+        t[s] += 1
+
+        n = min(t[s], win)
+        sw = 0.0
+        if n > 1:
+            m = hsum[s] / n
+            sw = sqrt(max(hsumsq[s] / n - m * m, 0.0))
+        x_out[i] = xs
+        sigma_out[i] = sw
 
 
 class VADM:
@@ -59,7 +125,8 @@ class VADM:
         jump_scale: float = 0.35,
         alpha: float = 0.05,
         window: int = 20,
-        seed: int = 0,
+        seed: int | np.random.Generator = 0,
+        capacity: int = 64,
     ):
         self._dt = dt
         self._theta_0 = theta_0
@@ -68,16 +135,41 @@ class VADM:
         self._alpha = alpha
         self._window = window
         self._rng = np.random.default_rng(seed)
-        self._states: dict[int, _AgentState] = {}
+        self._noise_pool: list[float] = []
+        self._noise_idx = 0
+        self._slot: dict[int, int] = {}
+        self._x = np.zeros(0)
+        self._theta = np.zeros(0)
+        self._hist = np.zeros((0, window))
+        self._hsum = np.zeros(0)
+        self._hsumsq = np.zeros(0)
+        self._t = np.zeros(0, dtype=np.int64)
+        self._alloc(max(capacity, 1))
 
-    def _init(self, agent_id: int, mu: float) -> _AgentState:
-        s = _AgentState(
-            x=float(np.clip(mu, _X_LO, _X_HI)),
-            theta=self._theta_0,
-            history=deque(maxlen=self._window),
-        )
-        self._states[agent_id] = s
-        return s
+    def _draw(self) -> float:
+        if self._noise_idx >= len(self._noise_pool):
+            self._noise_pool = self._rng.standard_normal(_NOISE_POOL).tolist()
+            self._noise_idx = 0
+        v = self._noise_pool[self._noise_idx]
+        self._noise_idx += 1
+        return v
+
+    def _alloc(self, cap: int) -> None:
+        n = len(self._slot)
+        for name in ("_x", "_theta", "_hist", "_hsum", "_hsumsq", "_t"):
+            old = getattr(self, name)
+            arr = np.zeros((cap,) + old.shape[1:], dtype=old.dtype)
+            arr[:n] = old[:n]
+            setattr(self, name, arr)
+
+    def _init(self, agent_id: int, mu: float) -> int:
+        slot = len(self._slot)
+        if slot == self._x.shape[0]:
+            self._alloc(2 * slot)
+        self._slot[agent_id] = slot
+        self._x[slot] = min(max(mu, _X_LO), _X_HI)
+        self._theta[slot] = self._theta_0
+        return slot
 
     def step(
         self,
@@ -85,22 +177,72 @@ class VADM:
         irv: np.ndarray,
         r_static: float,
     ) -> tuple[float, float]:
-        mu = float(np.clip(irv[0], _X_LO, _X_HI))
-        s = self._states.get(agent_id) or self._init(agent_id, mu)
+        mu = float(irv[0])
+        mu = _X_LO if mu < _X_LO else _X_HI if mu > _X_HI else mu
+        s = self._slot.get(agent_id)
+        if s is None:
+            s = self._init(agent_id, mu)
+        x = self._x.item(s)
+        theta = self._theta.item(s)
 
-        epsilon = abs(r_static - s.x)
-        gamma = _gamma_ratio(epsilon, self._sigma, s.theta)
+        epsilon = abs(r_static - x)
+        gamma = _gamma_ratio(epsilon, self._sigma, theta)
 
-        s.theta = _update_theta(s.theta, epsilon, self._alpha, self._dt)
-        s.x = _euler_maruyama(
-            s.x, mu, s.theta, self._sigma,
-            self._dt, self._rng, self._jump_scale, gamma,
-        )
-        s.history.append(s.x)
-        s.t += 1
+        theta = _update_theta(theta, epsilon, self._alpha, self._dt)
+        z = self._draw()
+        jump_draw = self._jump_scale * self._draw() if gamma > _GAMMA_THRESHOLD else 0.0
+        x = float(_euler_maruyama(
+            x, mu, theta, self._sigma, self._dt, z, jump_draw,
+        ))
+        self._x[s] = x
+        self._theta[s] = theta
+        t = self._t.item(s)
+        head = t % self._window
+        hsum = self._hsum.item(s)
+        hsumsq = self._hsumsq.item(s)
+        if t >= self._window:
+            old = self._hist.item(s, head)
+            hsum -= old
+            hsumsq -= old * old
+        hsum += x
+        hsumsq += x * x
+        self._hist[s, head] = x
+        self._hsum[s] = hsum
+        self._hsumsq[s] = hsumsq
+        self._t[s] = t + 1
 
-        sigma_w = float(np.std(s.history)) if len(s.history) > 1 else 0.0
-        return s.x, sigma_w
+        n = min(t + 1, self._window)
+        sigma_w = 0.0
+        if n > 1:
+            m = hsum / n
+            sigma_w = sqrt(max(hsumsq / n - m * m, 0.0))
+        return x, sigma_w
+
+    def step_batch(
+        self,
+        agent_ids,
+        irv_matrix: np.ndarray,
+        r_vec: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        ids = np.asarray(agent_ids, dtype=np.int64)
+        if np.unique(ids).size != ids.size:
+            raise ValueError("agent_ids must be unique within a batch")
+        n = ids.size
+        mu = np.clip(np.asarray(irv_matrix, dtype=np.float64).reshape(n, -1)[:, 0], _X_LO, _X_HI)
+        slots = np.empty(n, dtype=np.int64)
+        for i, aid in enumerate(ids.tolist()):
+            s = self._slot.get(aid)
+            slots[i] = self._init(aid, mu[i]) if s is None else s
+        z = self._rng.standard_normal(n)
+        jump_draw = self._rng.normal(0.0, self._jump_scale, n)
+        x_out = np.empty(n)
+        sigma_out = np.empty(n)
+        _step_batch_kernel(
+            slots, mu, np.asarray(r_vec, dtype=np.float64), z, jump_draw,
+            self._x, self._theta, self._hist, self._hsum, self._hsumsq, self._t,
+            self._sigma, self._dt, self._alpha, _GAMMA_THRESHOLD, x_out, sigma_out,
+        )
+        return x_out, sigma_out
 
     def step_ou_only(
         self,
@@ -109,16 +251,13 @@ class VADM:
         theta: float,
         n_steps: int,
     ) -> list[float]:
-        traj = [x0]
-        x = x0
-        for _ in range(n_steps):
-            drift = theta * (mu - x) * self._dt
-            diff  = self._sigma * self._rng.standard_normal() * np.sqrt(self._dt)
-            x = float(np.clip(x + drift + diff, _X_LO, _X_HI))
-            traj.append(x)
-        return traj
+        noise = self._rng.standard_normal(n_steps)
+        if not HAS_NUMBA:
+            return _ou_trajectory_py(x0, mu, theta, self._sigma, self._dt, noise.tolist())
+        return _ou_trajectory(x0, mu, theta, self._sigma, self._dt, noise).tolist()
 
     def decay(self, reputation: float, volatility: float, delta_t: int) -> float:
         drift = self._theta_0 * (0.5 - reputation) * delta_t
-        diff  = volatility * self._rng.standard_normal() * np.sqrt(delta_t)
-        return float(np.clip(reputation + drift + diff, _X_LO, _X_HI))
+        diff  = volatility * self._draw() * sqrt(delta_t)
+        x = reputation + drift + diff
+        return _X_LO if x < _X_LO else _X_HI if x > _X_HI else float(x)
@@ -1,21 +1,37 @@
 from __future__ import annotations
 import hashlib
-import random
 import time
 from dataclasses import dataclass, field
-from itertools import chain, combinations
 from typing import Optional
 
-_FRAME = frozenset({"trusted", "untrusted", "unknown"})
-_S_TR = frozenset({"trusted"})
-_S_UN = frozenset({"untrusted"})
-_S_UK = frozenset({"unknown"})
-_S_TR_UN = frozenset({"trusted", "untrusted"})
-_S_TR_UK = frozenset({"trusted", "unknown"})
-_S_UN_UK = frozenset({"untrusted", "unknown"})
+import numpy as np
+
+from chronosrep.modules._bba import TR, UN, UK, TR_UK, UN_UK, FRAME, bba_to_vec
 
 _VC_TYPES = ("KYC", "DID_DOC", "BEHAVIORAL", "DELEGATED", "GOVERNANCE")
 _ISSUER_TIERS = ("ROOT_CA", "INTERMEDIATE_CA", "LEAF_ISSUER")
+_VC_TYPE_IDX = {t: i for i, t in enumerate(_VC_TYPES)}
+_TIER_IDX = {t: i for i, t in enumerate(_ISSUER_TIERS)}
+
+_VC_TYPE_WEIGHT = {
+    "KYC":        1.00,
+    "DID_DOC":    0.85,
+    "BEHAVIORAL": 0.90,
+    "DELEGATED":  0.70,
+    "GOVERNANCE": 0.75,
+}
+
+_TIER_DISCOUNT = {
+    "ROOT_CA":         1.00,
+    "INTERMEDIATE_CA": 0.90,
+    "LEAF_ISSUER":     0.75,
+}
+
+_CHAIN_DEPTH_PENALTY = 0.05
+_UNKNOWN_WEIGHT      = 0.7
+
+_TYPE_W = tuple(_VC_TYPE_WEIGHT[t] for t in _VC_TYPES) + (_UNKNOWN_WEIGHT,)
+_TIER_D = tuple(_TIER_DISCOUNT[t] for t in _ISSUER_TIERS) + (_UNKNOWN_WEIGHT,)
 _ATTR_KEYS_KYC = ("identity_hash", "nationality_code", "risk_band", "kyc_level")
 _ATTR_KEYS_DID = ("did_method", "pub_key_alg", "rotation_count", "linked_domain")
 _ATTR_KEYS_BEH = ("tx_count_30d", "avg_tx_value", "flagged_ratio", "peer_score")
@@ -36,8 +52,32 @@ _TIER_TRUST_RANGE = {
     "LEAF_ISSUER":     (0.45, 0.75),
 }
 
+_TIER_WEIGHTS = {
+    "KYC":        (0.40, 0.40, 0.20),
+    "DID_DOC":    (0.20, 0.45, 0.35),
+    "BEHAVIORAL": (0.05, 0.30, 0.65),
+    "DELEGATED":  (0.10, 0.35, 0.55),
+    "GOVERNANCE": (0.30, 0.50, 0.20),
+}
+_TIER_BASE_DEPTH = {"ROOT_CA": 0, "INTERMEDIATE_CA": 1, "LEAF_ISSUER": 2}
+
+_CHOICES_MAP = {
+    "risk_band":        ["LOW", "MEDIUM"],
+    "kyc_level":        [1, 2, 3],
+    "did_method":       ["did:web", "did:key", "did:ion", "did:ethr"],
+    "pub_key_alg":      ["Ed25519", "secp256k1", "P-256"],
+    "nationality_code": ["VN", "US", "SG", "EU", "UK"],
+    "linked_domain":    ["example.com", "defi.xyz", "anon.io"],
+    "dao_id":           ["dao_alpha", "dao_beta", "dao_gamma"],
+}
+_ATTACKER_CHOICES = {"risk_band": ["LOW", "MEDIUM", "HIGH"]}
+
 _REVOCATION_PROB_HONEST   = 0.02
 _REVOCATION_PROB_ATTACKER = 0.35
+_HASH_SEED_BYTES = 16
+_BBA_DRAWS = 5
+_YEAR_S = 31536000
+_DAY_S  = 86400
 
 
 @dataclass(frozen=True)
@@ -52,106 +92,129 @@ class VCRecord:
     bba: dict
     issuance_ts: int
     chain_depth: int
+    vc_type_id: int = -1
+    tier_id: int = -1
+    _effective_w: float = field(init=False, repr=False, compare=False)
+    _bba_vec: np.ndarray = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        if self.vc_type_id < 0:
+            object.__setattr__(self, "vc_type_id", _VC_TYPE_IDX.get(self.vc_type, -1))
+        if self.tier_id < 0:
+            object.__setattr__(self, "tier_id", _TIER_IDX.get(self.issuer_tier, -1))
+        depth_p = max(0.0, 1.0 - self.chain_depth * _CHAIN_DEPTH_PENALTY)
+        w = self.issuer_trust * _TYPE_W[self.vc_type_id] * _TIER_D[self.tier_id] * depth_p
+        object.__setattr__(self, "_effective_w", w)
+        object.__setattr__(self, "_bba_vec", bba_to_vec(self.bba))
 
-def _powerset_subsets():
-    s = list(_FRAME)
-    return tuple(
-        frozenset(c)
-        for c in chain.from_iterable(combinations(s, r) for r in range(1, len(s) + 1))
-    )
 
+def _attr_kind(k: str) -> str:
+    if "hash" in k or "key" in k or "did" in k:
+        return "hash"
+    if "count" in k or "depth" in k or "rotation" in k:
+        return "count"
+    if "ratio" in k or "score" in k or "weight" in k:
+        return "ratio"
+    if "epoch" in k:
+        return "epoch"
+    if "bitmask" in k:
+        return "bitmask"
+    if "band" in k or "level" in k or "method" in k or "alg" in k:
+        return "choice"
+    return "uniform"
 
-_ALL_SUBSETS = _powerset_subsets()
 
+_ATTR_KINDS = {
+    vt: tuple((k, _attr_kind(k)) for k in keys) for vt, keys in _ATTR_KEY_MAP.items()
+}
+_ATTRS_PER_VC = max(len(keys) for keys in _ATTR_KEY_MAP.values())
 
-def _build_honest_bba(rng: random.Random) -> dict:
-    m_tr = rng.uniform(0.50, 0.78)
-    m_uk = rng.uniform(0.04, 0.18)
-    m_fr = rng.uniform(0.03, 0.10)
-    residual = max(0.0, 1.0 - m_tr - m_uk - m_fr)
-    m_un = residual * rng.uniform(0.00, 0.12)
-    m_tr_uk = residual * rng.uniform(0.00, 0.08)
-    raw = {
-        _S_TR:    m_tr,
-        _S_UN:    m_un,
-        _S_UK:    m_uk,
-        _S_TR_UK: m_tr_uk,
-        _FRAME:   m_fr,
-    }
+
+def _normalized_bba(raw: dict) -> dict:
     total = sum(raw.values())
     return {k: v / total for k, v in raw.items()}
 
 
-def _build_attacker_bba(rng: random.Random) -> dict:
-    m_un = rng.uniform(0.48, 0.72)
-    m_uk = rng.uniform(0.10, 0.24)
-    m_fr = rng.uniform(0.05, 0.14)
+def _build_honest_bba(u: list[float]) -> dict:
+    m_tr = 0.50 + 0.28 * u[0]
+    m_uk = 0.04 + 0.14 * u[1]
+    m_fr = 0.03 + 0.07 * u[2]
+    residual = max(0.0, 1.0 - m_tr - m_uk - m_fr)
+    m_un = residual * 0.12 * u[3]
+    m_tr_uk = residual * 0.08 * u[4]
+    return _normalized_bba({
+        TR:    m_tr,
+        UN:    m_un,
+        UK:    m_uk,
+        TR_UK: m_tr_uk,
+        FRAME: m_fr,
+    })
+
+
+def _build_attacker_bba(u: list[float]) -> dict:
+    m_un = 0.48 + 0.24 * u[0]
+    m_uk = 0.10 + 0.14 * u[1]
+    m_fr = 0.05 + 0.09 * u[2]
     residual = max(0.0, 1.0 - m_un - m_uk - m_fr)
-    m_tr = residual * rng.uniform(0.00, 0.08)
-    m_un_uk = residual * rng.uniform(0.00, 0.10)
-    raw = {
-        _S_TR:    m_tr,
-        _S_UN:    m_un,
-        _S_UK:    m_uk,
-        _S_UN_UK: m_un_uk,
-        _FRAME:   m_fr,
-    }
-    total = sum(raw.values())
-    return {k: v / total for k, v in raw.items()}
+    m_tr = residual * 0.08 * u[3]
+    m_un_uk = residual * 0.10 * u[4]
+    return _normalized_bba({
+        TR:    m_tr,
+        UN:    m_un,
+        UK:    m_uk,
+        UN_UK: m_un_uk,
+        FRAME: m_fr,
+    })
+
+
+def _attr_hash(seed: bytes) -> str:
+    return hashlib.sha256(seed).digest()[:16].hex()
 
 
-def _build_attributes(vc_type: str, rng: random.Random, is_attacker: bool) -> dict:
-    keys = _ATTR_KEY_MAP[vc_type]
+def _build_attributes(
+    vc_type: str, u: list[float], seeds: bytes, is_attacker: bool, now: int,
+) -> dict:
     attrs: dict = {}
-    for k in keys:
-        if "hash" in k or "key" in k or "did" in k:
-            seed_val = rng.getrandbits(128)
-            attrs[k] = hashlib.sha3_256(seed_val.to_bytes(16, "big")).hexdigest()[:32]
-        elif "count" in k or "depth" in k or "rotation" in k:
-            attrs[k] = rng.randint(0, 200 if is_attacker else 50)
-        elif "ratio" in k or "score" in k or "weight" in k:
-            attrs[k] = round(rng.uniform(0.0, 0.25 if is_attacker else 0.08), 4)
-        elif "epoch" in k:
-            attrs[k] = int(time.time()) + rng.randint(86400, 31536000)
-        elif "bitmask" in k:
-            attrs[k] = rng.getrandbits(16)
-        elif "band" in k or "level" in k or "method" in k or "alg" in k:
-            choices_map = {
-                "risk_band":      ["LOW", "MEDIUM", "HIGH"] if is_attacker else ["LOW", "MEDIUM"],
-                "kyc_level":      [1, 2, 3],
-                "did_method":     ["did:web", "did:key", "did:ion", "did:ethr"],
-                "pub_key_alg":    ["Ed25519", "secp256k1", "P-256"],
-                "nationality_code": ["VN", "US", "SG", "EU", "UK"],
-                "linked_domain":  ["example.com", "defi.xyz", "anon.io"],
-                "dao_id":         ["dao_alpha", "dao_beta", "dao_gamma"],
-            }
-            pool = choices_map.get(k, ["A", "B", "C"])
-            attrs[k] = rng.choice(pool)
+    for j, (k, kind) in enumerate(_ATTR_KINDS[vc_type]):
+        x = u[j]
+        if kind == "hash":
+            seed_val = seeds[j * _HASH_SEED_BYTES:(j + 1) * _HASH_SEED_BYTES]
+            attrs[k] = _attr_hash(seed_val)
+        elif kind == "count":
+            attrs[k] = int(x * ((200 if is_attacker else 50) + 1))
+        elif kind == "ratio":
+            attrs[k] = round(x * (0.25 if is_attacker else 0.08), 4)
+        elif kind == "epoch":
+            attrs[k] = now + _DAY_S + int(x * (_YEAR_S - _DAY_S + 1))
+        elif kind == "bitmask":
+            attrs[k] = int(x * 65536)
+        elif kind == "choice":
+            pool = (_ATTACKER_CHOICES.get(k) if is_attacker else None) or _CHOICES_MAP.get(k, ["A", "B", "C"])
+            attrs[k] = pool[int(x * len(pool))]
         else:
-            attrs[k] = round(rng.uniform(0.0, 1.0), 4)
+            attrs[k] = round(x, 4)
     return attrs
 
 
-def _issuer_tier_for_vc_type(vc_type: str, rng: random.Random) -> str:
-    weights = {
-        "KYC":        [0.40, 0.40, 0.20],
-        "DID_DOC":    [0.20, 0.45, 0.35],
-        "BEHAVIORAL": [0.05, 0.30, 0.65],
-        "DELEGATED":  [0.10, 0.35, 0.55],
-        "GOVERNANCE": [0.30, 0.50, 0.20],
-    }
-    return rng.choices(_ISSUER_TIERS, weights=weights[vc_type], k=1)[0]
+def _issuer_tier(vc_type: str, x: float) -> str:
+    weights = _TIER_WEIGHTS[vc_type]
+    acc = 0.0
+    for tier, w in zip(_ISSUER_TIERS, weights):
+        acc += w
+        if x * sum(weights) < acc:
+            return tier
+    return _ISSUER_TIERS[-1]
 
 
-def _issuer_trust(tier: str, rng: random.Random) -> float:
+def _issuer_trust(tier: str, x: float) -> float:
     lo, hi = _TIER_TRUST_RANGE[tier]
-    return round(rng.uniform(lo, hi), 4)
+    return round(lo + (hi - lo) * x, 4)
 
 
-def _chain_depth(tier: str, rng: random.Random) -> int:
-    base = {"ROOT_CA": 0, "INTERMEDIATE_CA": 1, "LEAF_ISSUER": 2}[tier]
-    return base + rng.randint(0, 1)
+_U_TYPE, _U_TIER, _U_TRUST, _U_ATK, _U_REV, _U_TS, _U_DEPTH = range(7)
+_U_BBA   = 7
+_U_ATTR  = _U_BBA + _BBA_DRAWS
+_U_WIDTH = _U_ATTR + _ATTRS_PER_VC
 
 
 class VCGen:
@@ -164,26 +227,35 @@ class VCGen:
         n_credentials: int = 5,
         is_attacker: bool = False,
     ) -> list[VCRecord]:
-        rng = random.Random(agent_id + self._seed_offset * 100003)
-        vc_types = rng.choices(_VC_TYPES, k=n_credentials)
+        rng = np.random.default_rng(agent_id + self._seed_offset * 100003)
+        draws = rng.random((_U_WIDTH, n_credentials)).T.tolist()
+        stride = _ATTRS_PER_VC * _HASH_SEED_BYTES
+        seeds = rng.bytes(n_credentials * stride)
+        now = int(time.time())
+        bba_fn = _build_attacker_bba if is_attacker else _build_honest_bba
+        rev_prob = _REVOCATION_PROB_ATTACKER if is_attacker else _REVOCATION_PROB_HONEST
         records: list[VCRecord] = []
-        for i, vt in enumerate(vc_types):
-            tier = _issuer_tier_for_vc_type(vt, rng)
-            trust = _issuer_trust(tier, rng)
+        for i, u in enumerate(draws):
+            type_id = int(u[_U_TYPE] * len(_VC_TYPES))
+            vt = _VC_TYPES[type_id]
+            tier = _issuer_tier(vt, u[_U_TIER])
+            trust = _issuer_trust(tier, u[_U_TRUST])
             if is_attacker:
-                trust *= rng.uniform(0.5, 0.85)
-            bba_fn = _build_attacker_bba if is_attacker else _build_honest_bba
-            rev_prob = _REVOCATION_PROB_ATTACKER if is_attacker else _REVOCATION_PROB_HONEST
+                trust *= 0.5 + 0.35 * u[_U_ATK]
             records.append(VCRecord(
                 vc_id=f"vc-{agent_id:04d}-{i}-{vt[:3]}",
                 vc_type=vt,
                 issuer_tier=tier,
                 issuer_trust=round(trust, 4),
                 subject_id=agent_id,
-                revoked=rng.random() < rev_prob,
-                attributes=_build_attributes(vt, rng, is_attacker),
-                bba=bba_fn(rng),
-                issuance_ts=int(time.time()) - rng.randint(0, 31536000),
-                chain_depth=_chain_depth(tier, rng),
+                revoked=u[_U_REV] < rev_prob,
+                attributes=_build_attributes(
+                    vt, u[_U_ATTR:], seeds[i * stride:(i + 1) * stride], is_attacker, now,
+                ),
+                bba=bba_fn(u[_U_BBA:_U_ATTR]),
+                issuance_ts=now - int(u[_U_TS] * (_YEAR_S + 1)),
+                chain_depth=_TIER_BASE_DEPTH[tier] + int(u[_U_DEPTH] * 2),
+                vc_type_id=type_id,
+                tier_id=_TIER_IDX[tier],
             ))
         return records
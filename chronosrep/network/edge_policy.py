@@ -12,6 +12,7 @@ class EdgeWeightConfig:
 
 
 _DEFAULT_CFG = EdgeWeightConfig()
+_HISTORY_LEN = 10
 
 
 def _recency_factor(dt: int, decay: float) -> float:
@@ -23,7 +24,7 @@ def _outcome_momentum(history: list[int], momentum: float) -> float:
         return 0.5
     weighted = 0.0
     total_w = 0.0
-    for i, outcome in enumerate(reversed(history[-10:])):
+    for i, outcome in enumerate(reversed(history[-_HISTORY_LEN:])):
         w = momentum ** i
         weighted += w * outcome
         total_w += w
@@ -59,11 +60,31 @@ class EdgeWeightPolicy:
         current_t: int,
         agent_volatility: dict[int, float],
     ) -> dict[tuple[int, int], float]:
-        result: dict[tuple[int, int], float] = {}
-        for (u, v), meta in edges.items():
-            dt = current_t - meta.get("last_t", current_t)
-            hist = meta.get("outcome_history", [])
-            trust = meta.get("issuer_trust", 0.7)
-            vol = agent_volatility.get(u, 0.0)
-            result[(u, v)] = self.compute(hist, dt, trust, vol)
-        return result
+        cfg = self._cfg
+        keys = list(edges)
+        n = len(keys)
+        dt    = np.empty(n)
+        trust = np.empty(n)
+        vol   = np.empty(n)
+        hist  = np.zeros((n, _HISTORY_LEN))
+        mask  = np.zeros((n, _HISTORY_LEN))
+        for i, (u, v) in enumerate(keys):
+            meta = edges[(u, v)]
+            dt[i] = current_t - meta.get("last_t", current_t)
+            trust[i] = meta.get("issuer_trust", 0.7)
+            vol[i] = agent_volatility.get(u, 0.0)
+            h = meta.get("outcome_history", [])[-_HISTORY_LEN:]
+            if h:
+                hist[i, _HISTORY_LEN - len(h):] = h
+                mask[i, _HISTORY_LEN - len(h):] = 1.0
+
+        recency = np.power(cfg.recency_decay, dt)
+        w = (cfg.outcome_momentum ** np.arange(_HISTORY_LEN))[::-1] * mask
+        total_w = w.sum(axis=1)
+        momentum = np.where(
+            total_w > 0, (hist * w).sum(axis=1) / np.where(total_w > 0, total_w, 1.0), 0.5,
+        )
+        f = cfg.issuer_trust_factor
+        base = ((1.0 - f) * momentum + f * trust) * recency
+        out = np.clip(base * (1.0 - cfg.volatility_penalty * vol), 0.0, 1.0)
+        return dict(zip(keys, out.tolist()))
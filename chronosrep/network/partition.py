@@ -1,7 +1,6 @@
 from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass, field
-import networkx as nx
 
 
 @dataclass
@@ -19,15 +18,21 @@ class PartitionCache:
         self._snapshots: list[PartitionSnapshot] = []
         self._current: dict[int, int] = {}
 
-    def store(self, t: int, partition: dict[int, int], G_und: nx.Graph) -> PartitionSnapshot:
-        try:
-            mod = nx.community.modularity(
-                G_und,
-                [{n for n, c in partition.items() if c == cid}
-                 for cid in set(partition.values())],
-            )
-        except Exception:
-            mod = 0.0
+    def store(
+        self,
+        t: int,
+        partition: dict[int, int],
+        internal: dict[int, float],
+        external: dict[int, float],
+        m_edges: float,
+    ) -> PartitionSnapshot:
+        mod = 0.0
+        if m_edges > 0:
+            two_m = 2.0 * m_edges
+            for cid in internal.keys() | external.keys():
+                L = internal.get(cid, 0)
+                D = 2 * L + external.get(cid, 0)
+                mod += L / m_edges - (D / two_m) ** 2
 
         sizes: dict[int, int] = defaultdict(int)
         for c in partition.values():
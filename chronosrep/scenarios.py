@@ -1,42 +1,43 @@
 from __future__ import annotations
 
-import random
+import numpy as np
 
+from chronosrep.core.interfaces import BaseScenario
 
-class SleeperAgentScenario:
+
+def _force_random_targets(model, outcome: int) -> None:
+    alive = ~model.isolated
+    active = np.flatnonzero(alive)
+    if active.size < 2:
+        return
+    attackers = np.flatnonzero(model._attacker_mask & alive)
+    if attackers.size == 0:
+        return
+    picks = model.rng.integers(0, active.size - 1, size=attackers.size)
+    picks += picks >= np.searchsorted(active, attackers)
+    model.ite.force_interaction_batch(attackers, active[picks], outcome)
+
+
+class SleeperAgentScenario(BaseScenario):
     N_ATTACKERS = 20
     DEFECT_STEP = 201
 
     def setup(self, model) -> None:
-        all_ids = [a.unique_id for a in model.schedule.agents]
-        model._attacker_ids = set(random.sample(all_ids, self.N_ATTACKERS))
-        for a in model.schedule.agents:
-            if a.unique_id in model._attacker_ids:
-                a.is_attacker = True
+        model.mark_attackers(model.rng.choice(model.N, self.N_ATTACKERS, replace=False))
 
     def inject(self, model) -> None:
         t = model.current_step
         outcome = 1 if t < self.DEFECT_STEP else 0
-        active = {a.unique_id for a in model.schedule.agents if not a.isolated}
-        for uid in model._attacker_ids:
-            if uid not in active:
-                continue
-            targets = [x for x in active if x != uid]
-            if targets:
-                model.ite.force_interaction(uid, random.choice(targets), outcome)
+        _force_random_targets(model, outcome)
 
 
-class TransgressionRecoveryScenario:
+class TransgressionRecoveryScenario(BaseScenario):
     PHASE_MISBEHAVE_START = 101
     PHASE_REFORM_START = 201
 
     def setup(self, model) -> None:
-        all_ids = [a.unique_id for a in model.schedule.agents]
         n = max(1, int(0.20 * model.N))
-        model._attacker_ids = set(random.sample(all_ids, n))
-        for a in model.schedule.agents:
-            if a.unique_id in model._attacker_ids:
-                a.is_attacker = True
+        model.mark_attackers(model.rng.choice(model.N, n, replace=False))
 
     def inject(self, model) -> None:
         t = model.current_step
@@ -46,34 +47,21 @@ class TransgressionRecoveryScenario:
             outcome = 0
         else:
             outcome = 1
-            for a in model.schedule.agents:
-                if a.unique_id in model._attacker_ids:
-                    a.is_attacker = False
+            model.is_attacker[model._attacker_mask] = False
 
-        active = {a.unique_id for a in model.schedule.agents if not a.isolated}
-        for uid in model._attacker_ids:
-            if uid not in active:
-                continue
-            targets = [x for x in active if x != uid]
-            if targets:
-                model.ite.force_interaction(uid, random.choice(targets), outcome)
+        _force_random_targets(model, outcome)
 
 
-class CollusionFarmingScenario:
+class CollusionFarmingScenario(BaseScenario):
     def setup(self, model) -> None:
-        all_ids = [a.unique_id for a in model.schedule.agents]
         n = max(2, int(0.20 * model.N))
-        model._attacker_ids = set(random.sample(all_ids, n))
-        self._colluders = list(model._attacker_ids)
-        for a in model.schedule.agents:
-            if a.unique_id in model._attacker_ids:
-                a.is_attacker = False
+        colluders = model.rng.choice(model.N, n, replace=False)
+        self._colluders = colluders.tolist()
+        model.mark_attackers(colluders, behaving=False)
+        src, dst = np.nonzero(~np.eye(colluders.size, dtype=bool))
+        self._src_arr, self._dst_arr = colluders[src], colluders[dst]
 
     def inject(self, model) -> None:
-        active_colluders = [uid for uid in self._colluders
-                            if not model.schedule._agents[uid].isolated
-                            if uid in model.schedule._agents]
-        for uid in active_colluders:
-            for target in active_colluders:
-                if target != uid:
-                    model.ite.force_interaction(uid, target, 1)
+        alive = ~model.isolated
+        valid = alive[self._src_arr] & alive[self._dst_arr]
+        model.ite.force_interaction_batch(self._src_arr[valid], self._dst_arr[valid], 1)
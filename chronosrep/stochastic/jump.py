@@ -1,10 +1,11 @@
 from __future__ import annotations
 import numpy as np
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 _DEFAULT_LAMBDA = 0.02
 _DEFAULT_MU_J   = 0.0
 _DEFAULT_SIGMA_J = 0.25
+_EVENT_BUF = 64
 
 
 @dataclass
@@ -15,13 +16,6 @@ class JumpEvent:
     direction: int
 
 
-@dataclass
-class JumpState:
-    events: list[JumpEvent] = field(default_factory=list)
-    total_mass: float = 0.0
-    t: int = 0
-
-
 class JumpProcess:
     def __init__(
         self,
@@ -29,53 +23,102 @@ class JumpProcess:
         mu_j: float = _DEFAULT_MU_J,
         sigma_j: float = _DEFAULT_SIGMA_J,
         gamma_threshold: float = 3.0,
-        seed: int = 0,
+        seed: int | np.random.Generator = 0,
+        event_buffer: int = _EVENT_BUF,
+        dt: float = 1.0,
     ):
         self._lambda = lambda_rate
+        self._lambda_dt = lambda_rate * dt
         self._mu_j = mu_j
         self._sigma_j = sigma_j
         self._gamma_thr = gamma_threshold
         self._rng = np.random.default_rng(seed)
-        self._states: dict[int, JumpState] = {}
+        self._slot: dict[int, int] = {}
+        self._t = np.zeros(64, dtype=np.int64)
+        self._mass = np.zeros(64)
+        k = max(event_buffer, 1)
+        self._ev_t = np.zeros((64, k), dtype=np.int64)
+        self._ev_amp = np.zeros((64, k), dtype=np.float32)
+        self._ev_n = np.zeros(64, dtype=np.int64)
+
+    def _ensure(self, pid: int) -> int:
+        slot = self._slot.get(pid)
+        if slot is None:
+            slot = len(self._slot)
+            if slot == self._t.shape[0]:
+                for name in ("_t", "_mass", "_ev_t", "_ev_amp", "_ev_n"):
+                    arr = getattr(self, name)
+                    setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+            self._slot[pid] = slot
+        return slot
 
-    def _ensure(self, pid: int) -> JumpState:
-        if pid not in self._states:
-            self._states[pid] = JumpState()
-        return self._states[pid]
+    def _record(self, slots: np.ndarray, amp: np.ndarray) -> None:
+        k = amp.shape[0]
+        order = np.argsort(slots, kind="stable")
+        ranked = slots[order]
+        rank = np.empty(k, dtype=np.int64)
+        rank[order] = np.arange(k) - np.searchsorted(ranked, ranked)
+        cols = (self._ev_n[slots] + rank) % self._ev_t.shape[1]
+        self._ev_t[slots, cols] = self._t[slots]
+        self._ev_amp[slots, cols] = amp
+        np.add.at(self._ev_n, slots, 1)
 
-    def sample(self, pid: int, gamma: float, dt: float = 1.0) -> float:
+    def _events_of(self, s: int) -> tuple[np.ndarray, np.ndarray]:
+        m = min(self._ev_n.item(s), self._ev_t.shape[1])
+        return self._ev_t[s, :m], self._ev_amp[s, :m]
+
+    def sample(self, pid: int, gamma: float, dt: float | None = None) -> float:
         s = self._ensure(pid)
-        s.t += 1
+        self._t[s] += 1
         if gamma <= self._gamma_thr:
             return 0.0
-        n_jumps = int(self._rng.poisson(self._lambda * dt))
+        n_jumps = int(self._rng.poisson(self._lambda_dt if dt is None else self._lambda * dt))
         if n_jumps == 0:
             return 0.0
         amplitudes = self._rng.normal(self._mu_j, self._sigma_j, n_jumps)
         total = float(amplitudes.sum())
-        for amp in amplitudes:
-            s.events.append(JumpEvent(
-                t=s.t,
-                pid=pid,
-                amplitude=float(amp),
-                direction=int(np.sign(amp)),
-            ))
-        s.total_mass += abs(total)
+        self._record(np.full(n_jumps, s, dtype=np.int64), amplitudes)
+        self._mass[s] += abs(total)
         return total
 
+    def batch_sample(self, pids, gammas, dt: float | None = None) -> np.ndarray:
+        n = len(pids)
+        slots = np.fromiter((self._ensure(p) for p in pids), dtype=np.int64, count=n)
+        np.add.at(self._t, slots, 1)
+        totals = np.zeros(n)
+        mask = np.asarray(gammas) > self._gamma_thr
+        n_active = int(mask.sum())
+        if n_active == 0:
+            return totals
+        ns = np.zeros(n, dtype=np.int64)
+        lam = self._lambda_dt if dt is None else self._lambda * dt
+        ns[mask] = self._rng.poisson(lam, n_active)
+        n_jumps = int(ns.sum())
+        if n_jumps == 0:
+            return totals
+        amps = self._rng.normal(self._mu_j, self._sigma_j, n_jumps)
+        hit = ns > 0
+        starts = np.cumsum(ns) - ns
+        totals[hit] = np.add.reduceat(amps, starts[hit])
+        np.add.at(self._mass, slots[hit], np.abs(totals[hit]))
+        self._record(np.repeat(slots, ns), amps)
+        return totals
+
     def jump_intensity(self, pid: int, window_t: int = 50) -> float:
-        s = self._states.get(pid)
-        if s is None or s.t == 0:
+        s = self._slot.get(pid)
+        if s is None or self._t[s] == 0:
             return 0.0
-        recent = [e for e in s.events if s.t - e.t <= window_t]
-        return len(recent) / max(window_t, 1)
+        t_buf, _ = self._events_of(s)
+        return int(np.count_nonzero(self._t[s] - t_buf <= window_t)) / max(window_t, 1)
 
     def cumulative_jump_mass(self, pid: int) -> float:
-        s = self._states.get(pid)
-        return s.total_mass if s else 0.0
+        s = self._slot.get(pid)
+        return float(self._mass[s]) if s is not None else 0.0
 
     def last_jump(self, pid: int) -> JumpEvent | None:
-        s = self._states.get(pid)
-        if s and s.events:
-            return s.events[-1]
-        return None
+        s = self._slot.get(pid)
+        if s is None or self._ev_n[s] == 0:
+            return None
+        col = (self._ev_n.item(s) - 1) % self._ev_t.shape[1]
+        amp = self._ev_amp.item(s, col)
+        return JumpEvent(t=self._ev_t.item(s, col), pid=pid, amplitude=amp, direction=int(np.sign(amp)))
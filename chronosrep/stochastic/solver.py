@@ -3,6 +3,7 @@ import numpy as np
 from dataclasses import dataclass
 from .wiener import WienerProcess
 from .jump import JumpProcess
+from chronosrep.utils.jit import njit
 
 _X_LO = 0.0
 _X_HI = 1.0
@@ -15,29 +16,48 @@ class OUParams:
     sigma: float
 
 
+@njit("float64(float64, float64, float64, float64, float64, float64, float64)", cache=True, fastmath=True)
 def _euler_maruyama_step(
     x: float,
-    params: OUParams,
+    mu: float,
+    theta: float,
+    sigma: float,
     dW: float,
     J: float,
     dt: float,
 ) -> float:
-    drift = params.theta * (params.mu - x) * dt
-    diff  = params.sigma * dW
-    return float(np.clip(x + drift + diff + J, _X_LO, _X_HI))
+    drift = theta * (mu - x) * dt
+    diff  = sigma * dW
+    v = x + drift + diff + J
+    return _X_LO if v < _X_LO else (_X_HI if v > _X_HI else v)
 
 
+@njit("float64(float64, float64, float64, float64, float64, float64, float64)", cache=True, fastmath=True)
 def _milstein_step(
     x: float,
-    params: OUParams,
+    mu: float,
+    theta: float,
+    sigma: float,
     dW: float,
     J: float,
     dt: float,
 ) -> float:
-    drift   = params.theta * (params.mu - x) * dt
-    diff    = params.sigma * dW
-    milstein_corr = 0.5 * params.sigma ** 2 * (dW ** 2 - dt)
-    return float(np.clip(x + drift + diff + milstein_corr + J, _X_LO, _X_HI))
+    sigma2  = sigma * sigma
+    drift   = theta * (mu - x) * dt
+    diff    = sigma * dW
+    milstein_corr = 0.5 * sigma2 * (dW * dW - dt)
+    v = x + drift + diff + milstein_corr + J
+    return _X_LO if v < _X_LO else (_X_HI if v > _X_HI else v)
+
+
+@njit("float64[::1](float64, float64, float64, float64, float64, float64[:])", cache=True, fastmath=True)
+def _ou_scan(x0: float, mu: float, theta: float, sigma: float, dt: float, dW: np.ndarray) -> np.ndarray:
+    x = np.empty(dW.shape[0] + 1)
+    x[0] = x0
+    for i in range(dW.shape[0]):
+        v = x[i] + theta * (mu - x[i]) * dt + sigma * dW[i]
+        x[i + 1] = _X_LO if v < _X_LO else (_X_HI if v > _X_HI else v)
+    return x
 
 
 class SDESolver:
@@ -47,64 +67,98 @@ class SDESolver:
         method: str = "euler_maruyama",
         gamma_threshold: float = 3.0,
         seed: int = 0,
+        dtype: type = np.float64,
     ):
         self._dt = dt
+        self._dtype = np.dtype(dtype)
         self._method = method
+        self._milstein = method == "milstein"
+        self._step_fn = _milstein_step if self._milstein else _euler_maruyama_step
         self._gamma_thr = gamma_threshold
-        self._wiener = WienerProcess(dt=dt, seed=seed)
-        self._jump   = JumpProcess(gamma_threshold=gamma_threshold, seed=seed + 1)
-        self._x: dict[int, float] = {}
+        self._bitgen = np.random.Philox(seed)
+        self._wiener = WienerProcess(dt=dt, seed=np.random.Generator(self._bitgen.jumped(0)))
+        self._jump   = JumpProcess(
+            gamma_threshold=gamma_threshold, seed=np.random.Generator(self._bitgen.jumped(1)), dt=dt,
+        )
+        self._z_buf = np.empty(64, dtype=self._dtype)
+        self._row: dict[int, int] = {}
+        self._x_arr = np.zeros(64, dtype=self._dtype)
+        self._mu    = np.zeros(64)
+        self._theta = np.zeros(64)
+        self._sigma = np.zeros(64)
+
+    def _ensure(self, pid: int, x0: float) -> int:
+        row = self._row.get(pid)
+        if row is None:
+            row = len(self._row)
+            if row == self._x_arr.shape[0]:
+                for name in ("_x_arr", "_mu", "_theta", "_sigma"):
+                    arr = getattr(self, name)
+                    setattr(self, name, np.concatenate([arr, np.zeros_like(arr)]))
+            self._row[pid] = row
+            self._x_arr[row] = min(max(x0, _X_LO), _X_HI)
+            self._mu[row] = x0
+        return row
+
+    def set_params(self, pid: int, p: OUParams) -> None:
+        row = self._ensure(pid, p.mu)
+        self._mu[row] = p.mu
+        self._theta[row] = p.theta
+        self._sigma[row] = p.sigma
+
+    def params(self, pid: int) -> OUParams | None:
+        row = self._row.get(pid)
+        if row is None:
+            return None
+        return OUParams(self._mu.item(row), self._theta.item(row), self._sigma.item(row))
 
     def init(self, pid: int, x0: float) -> None:
-        self._x[pid] = float(np.clip(x0, _X_LO, _X_HI))
+        row = self._ensure(pid, x0)
+        self._x_arr[row] = min(max(float(x0), _X_LO), _X_HI)
 
     def step(self, pid: int, params: OUParams, gamma: float) -> float:
-        if pid not in self._x:
-            self.init(pid, params.mu)
-        x = self._x[pid]
+        self.set_params(pid, params)
+        row = self._row[pid]
+        x = self._x_arr.item(row)
         dW = self._wiener.increment(pid)
-        J  = self._jump.sample(pid, gamma, self._dt)
-        if self._method == "milstein":
-            x_new = _milstein_step(x, params, dW, J, self._dt)
-        else:
-            x_new = _euler_maruyama_step(x, params, dW, J, self._dt)
-        self._x[pid] = x_new
-        return x_new
+        J  = self._jump.sample(pid, gamma)
+        self._x_arr[row] = self._step_fn(x, params.mu, params.theta, params.sigma, dW, J, self._dt)
+        return self._x_arr.item(row)
 
     def batch_step(
         self,
         pids: list[int],
-        params_map: dict[int, OUParams],
+        params_map: dict[int, OUParams] | None,
         gammas: dict[int, float],
     ) -> dict[int, float]:
-        dWs = self._wiener.batch_increment(pids)
-        result: dict[int, float] = {}
-        for pid in pids:
-            if pid not in self._x:
-                self.init(pid, params_map[pid].mu)
-            x = self._x[pid]
-            p = params_map[pid]
-            dW = dWs[pid]
-            J = self._jump.sample(pid, gammas.get(pid, 0.0), self._dt)
-            if self._method == "milstein":
-                x_new = _milstein_step(x, p, dW, J, self._dt)
-            else:
-                x_new = _euler_maruyama_step(x, p, dW, J, self._dt)
-            self._x[pid] = x_new
-            result[pid] = x_new
-        return result
+        n = len(pids)
+        if n == 0:
+            return {}
+        if params_map is not None:
+            for pid in pids:
+                self.set_params(pid, params_map[pid])
+        idx = np.fromiter((self._row[pid] for pid in pids), dtype=np.int64, count=n)
+        mu, theta, sigma = self._mu[idx], self._theta[idx], self._sigma[idx]
+        if self._z_buf.shape[0] < n:
+            self._z_buf = np.empty(n, dtype=self._dtype)
+        dW = self._wiener.batch_increment_array(pids, out=self._z_buf[:n])
+        g = np.fromiter((gammas.get(pid, 0.0) for pid in pids), dtype=self._dtype, count=n)
+        J = self._jump.batch_sample(pids, g).astype(self._dtype, copy=False)
+
+        x = self._x_arr[idx]
+        x_new = x + theta * (mu - x) * self._dt + sigma * dW + J
+        if self._milstein:
+            x_new += 0.5 * sigma * sigma * (dW * dW - self._dt)
+        np.clip(x_new, _X_LO, _X_HI, out=x_new)
+        self._x_arr[idx] = x_new
+        return dict(zip(pids, self._x_arr[idx].tolist()))
 
     def trajectory(self, pid: int, params: OUParams, n_steps: int) -> list[float]:
-        x = self._x.get(pid, params.mu)
-        traj = [x]
-        for _ in range(n_steps):
-            dW = float(np.random.default_rng().standard_normal() * np.sqrt(self._dt))
-            x = float(np.clip(
-                x + params.theta * (params.mu - x) * self._dt + params.sigma * dW,
-                _X_LO, _X_HI,
-            ))
-            traj.append(x)
-        return traj
+        row = self._row.get(pid)
+        x = self._x_arr.item(row) if row is not None else params.mu
+        dW = self._wiener._rng.standard_normal(n_steps) * self._wiener._sqrt_dt
+        return _ou_scan(x, params.mu, params.theta, params.sigma, self._dt, dW).tolist()
 
     def current(self, pid: int) -> float:
-        return self._x.get(pid, 0.5)
+        row = self._row.get(pid)
+        return self._x_arr.item(row) if row is not None else 0.5
@@ -1,7 +1,8 @@
 from __future__ import annotations
+import math
 import numpy as np
-from collections import deque
 from dataclasses import dataclass, field
+from chronosrep.utils.jit import njit
 
 
 _DEFAULT_WINDOW = 30
@@ -11,20 +12,71 @@ _MIN_VOL        = 1e-8
 
 @dataclass
 class VolState:
-    returns: deque = field(default_factory=lambda: deque(maxlen=_DEFAULT_WINDOW))
+    buf: np.ndarray = field(default_factory=lambda: np.zeros(_DEFAULT_WINDOW))
+    head: int = 0
+    count: int = 0
+    sum: float = 0.0
+    sumsq: float = 0.0
     ewma_var: float = 0.0
     realized_var_hist: list[float] = field(default_factory=list)
 
-
-def _realized_vol(returns: deque) -> float:
-    if len(returns) < 2:
-        return _MIN_VOL
-    arr = np.asarray(returns, dtype=float)
-    return float(max(_MIN_VOL, np.std(arr, ddof=1)))
+    def push(self, r: float) -> None:
+        w = self.buf.shape[0]
+        old = self.buf.item(self.head) if self.count == w else 0.0
+        self.buf[self.head] = r
+        self.head = (self.head + 1) % w
+        self.sum += r - old
+        self.sumsq += r * r - old * old
+        if self.count < w:
+            self.count += 1
 
 
-def _ewma_vol(ewma_var: float, r_new: float, lam: float) -> float:
-    return float(lam * ewma_var + (1 - lam) * r_new ** 2)
+def _realized_vol(st: VolState) -> float:
+    n = st.count
+    if n < 2:
+        return _MIN_VOL
+    var = (st.sumsq - st.sum * st.sum / n) / (n - 1)
+    return max(_MIN_VOL, math.sqrt(var)) if var > 0.0 else _MIN_VOL
+
+
+def _ewma_vol(ewma_var: float, r_new: float, lam: float, one_minus_lam: float) -> float:
+    return lam * ewma_var + one_minus_lam * r_new * r_new
+
+
+@njit(cache=True)
+def _vol_scan(
+    r: np.ndarray,
+    buf: np.ndarray,
+    head: int,
+    count: int,
+    s: float,
+    ss: float,
+    ev: float,
+    lam: float,
+    one_minus_lam: float,
+    ewma_out: np.ndarray,
+    rv_out: np.ndarray,
+):
+    w = buf.shape[0]
+    for i in range(r.shape[0]):
+        x = r[i]
+        old = buf[head] if count == w else 0.0
+        buf[head] = x
+        head = (head + 1) % w
+        s += x - old
+        ss += x * x - old * old
+        if count < w:
+            count += 1
+        ev = lam * ev + one_minus_lam * x * x
+        e = math.sqrt(ev)
+        ewma_out[i] = e if e > _MIN_VOL else _MIN_VOL
+        if count < 2:
+            rv_out[i] = _MIN_VOL
+        else:
+            var = (ss - s * s / count) / (count - 1)
+            v = math.sqrt(var) if var > 0.0 else _MIN_VOL
+            rv_out[i] = v if v > _MIN_VOL else _MIN_VOL
+    return head, count, s, ss, ev
 
 
 def _parkinson_vol(highs: list[float], lows: list[float]) -> float:
@@ -63,24 +115,38 @@ class VolatilityEstimator:
     def __init__(self, window: int = _DEFAULT_WINDOW, ewma_lambda: float = _EWMA_LAMBDA):
         self._window = window
         self._lam = ewma_lambda
+        self._one_minus_lam = 1.0 - ewma_lambda
         self._states: dict[int, VolState] = {}
 
     def _get(self, pid: int) -> VolState:
-        if pid not in self._states:
-            self._states[pid] = VolState(returns=deque(maxlen=self._window))
-        return self._states[pid]
+        st = self._states.get(pid)
+        if st is None:
+            st = self._states[pid] = VolState(buf=np.zeros(self._window))
+        return st
 
     def update(self, pid: int, x_new: float, x_prev: float) -> None:
         r = x_new - x_prev
         st = self._get(pid)
-        st.returns.append(r)
-        st.ewma_var = _ewma_vol(st.ewma_var, r, self._lam)
+        st.push(r)
+        st.ewma_var = _ewma_vol(st.ewma_var, r, self._lam, self._one_minus_lam)
+
+    def batch_update(self, pid: int, xs: np.ndarray, x_prev: float) -> tuple[np.ndarray, np.ndarray]:
+        xs = np.asarray(xs, dtype=np.float64)
+        r = np.diff(xs, prepend=x_prev)
+        st = self._get(pid)
+        ewmas = np.empty(r.shape[0])
+        rvols = np.empty(r.shape[0])
+        st.head, st.count, st.sum, st.sumsq, st.ewma_var = _vol_scan(
+            r, st.buf, st.head, st.count, st.sum, st.sumsq, st.ewma_var,
+            self._lam, self._one_minus_lam, ewmas, rvols,
+        )
+        return ewmas, rvols
 
     def realized_vol(self, pid: int) -> float:
-        return _realized_vol(self._get(pid).returns)
+        return _realized_vol(self._get(pid))
 
     def ewma_vol(self, pid: int) -> float:
-        return float(max(_MIN_VOL, np.sqrt(self._get(pid).ewma_var)))
+        return max(_MIN_VOL, math.sqrt(self._get(pid).ewma_var))
 
     def parkinson_vol(self, highs: list[float], lows: list[float]) -> float:
         return _parkinson_vol(highs, lows)
@@ -113,7 +179,7 @@ class VolatilityEstimator:
     def snapshot(self, pid: int) -> dict:
         v = self._get(pid)
         return {
-            "realized": _realized_vol(v.returns),
+            "realized": _realized_vol(v),
             "ewma": self.ewma_vol(pid),
-            "n_obs": len(v.returns),
+            "n_obs": v.count,
         }
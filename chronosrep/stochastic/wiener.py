@@ -1,59 +1,82 @@
 from __future__ import annotations
+import math
 import numpy as np
-from dataclasses import dataclass, field
 
-
-@dataclass
-class WienerState:
-    path: list[float] = field(default_factory=list)
-    cumulative: float = 0.0
-    t: int = 0
+_PATH_LEN = 256
 
 
 class WienerProcess:
-    def __init__(self, dt: float = 1.0, seed: int = 0):
+    def __init__(
+        self,
+        dt: float = 1.0,
+        seed: int | np.random.Generator = 0,
+        path_len: int = _PATH_LEN,
+    ):
         self._dt = dt
+        self._sqrt_dt = math.sqrt(dt)
         self._rng = np.random.default_rng(seed)
-        self._states: dict[int, WienerState] = {}
+        self._slot: dict[int, int] = {}
+        self._cum = np.zeros(64)
+        self._qv = np.zeros(64)
+        self._t = np.zeros(64, dtype=np.int64)
+        self._path = np.zeros((max(path_len, 1), 64))
 
-    def _ensure(self, pid: int) -> WienerState:
-        if pid not in self._states:
-            self._states[pid] = WienerState()
-        return self._states[pid]
+    def _ensure(self, pid: int) -> int:
+        slot = self._slot.get(pid)
+        if slot is None:
+            slot = len(self._slot)
+            cap = self._t.shape[0]
+            if slot == cap:
+                self._cum = np.concatenate([self._cum, np.zeros(cap)])
+                self._qv = np.concatenate([self._qv, np.zeros(cap)])
+                self._t = np.concatenate([self._t, np.zeros(cap, dtype=np.int64)])
+                self._path = np.concatenate([self._path, np.zeros_like(self._path)], axis=1)
+            self._slot[pid] = slot
+        return slot
 
     def increment(self, pid: int) -> float:
         s = self._ensure(pid)
-        dW = float(self._rng.standard_normal() * np.sqrt(self._dt))
-        s.path.append(dW)
-        s.cumulative += dW
-        s.t += 1
+        dW = float(self._rng.standard_normal() * self._sqrt_dt)
+        t = self._t.item(s)
+        self._path[t % self._path.shape[0], s] = dW
+        self._cum[s] += dW
+        self._qv[s] += dW * dW
+        self._t[s] = t + 1
         return dW
 
-    def batch_increment(self, pids: list[int]) -> dict[int, float]:
+    def batch_increment_array(self, pids, out: np.ndarray | None = None) -> np.ndarray:
         n = len(pids)
-        if n == 0:
+        idx = np.fromiter((self._ensure(p) for p in pids), dtype=np.int64, count=n)
+        if out is None:
+            dW = self._rng.standard_normal(n)
+        else:
+            dW = self._rng.standard_normal(dtype=out.dtype, out=out[:n])
+        dW *= self._sqrt_dt
+        self._path[self._t[idx] % self._path.shape[0], idx] = dW
+        np.add.at(self._cum, idx, dW)
+        np.add.at(self._qv, idx, dW * dW)
+        np.add.at(self._t, idx, 1)
+        return dW
+
+    def batch_increment(self, pids: list[int]) -> dict[int, float]:
+        if len(pids) == 0:
             return {}
-        dWs = self._rng.standard_normal(n) * np.sqrt(self._dt)
-        result: dict[int, float] = {}
-        for i, pid in enumerate(pids):
-            s = self._ensure(pid)
-            dW = float(dWs[i])
-            s.path.append(dW)
-            s.cumulative += dW
-            s.t += 1
-            result[pid] = dW
-        return result
+        return dict(zip(pids, self.batch_increment_array(pids).tolist()))
+
+    def _recent(self, s: int, window: int) -> np.ndarray:
+        L = self._path.shape[0]
+        t = self._t.item(s)
+        m = min(window, t, L)
+        return self._path[np.arange(t - m, t) % L, s]
 
     def realized_variance(self, pid: int, window: int = 20) -> float:
-        s = self._states.get(pid)
-        if s is None or len(s.path) < 2:
+        s = self._slot.get(pid)
+        if s is None or self._t[s] < 2:
             return 0.0
-        arr = np.array(s.path[-window:])
-        return float(np.var(arr))
+        return float(np.var(self._recent(s, window)))
 
     def quadratic_variation(self, pid: int) -> float:
-        s = self._states.get(pid)
+        s = self._slot.get(pid)
         if s is None:
             return 0.0
-        arr = np.array(s.path)
-        return float(np.sum(arr ** 2))
+        return float(self._qv[s])
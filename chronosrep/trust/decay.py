@@ -33,17 +33,27 @@ def _hyperbolic_decay(r: float, dt: int, half_life: float) -> float:
 class DecayScheduler:
     def __init__(self, config: DecayConfig | None = None):
         self._cfg = config or DecayConfig()
-        self._last_active: dict[int, int] = {}
+        self._row: dict[int, int] = {}
+        self._last_active_arr = np.zeros(64, dtype=np.int64)
         self._t: int = 0
 
     def tick(self) -> None:
         self._t += 1
 
     def mark_active(self, agent_id: int) -> None:
-        self._last_active[agent_id] = self._t
+        row = self._row.get(agent_id)
+        if row is None:
+            row = len(self._row)
+            if row == self._last_active_arr.shape[0]:
+                self._last_active_arr = np.concatenate(
+                    [self._last_active_arr, np.zeros_like(self._last_active_arr)]
+                )
+            self._row[agent_id] = row
+        self._last_active_arr[row] = self._t
 
     def apply(self, agent_id: int, current_rep: float) -> float:
-        last = self._last_active.get(agent_id, self._t)
+        row = self._row.get(agent_id)
+        last = self._last_active_arr.item(row) if row is not None else self._t
         dt = max(0, self._t - last)
         if dt == 0:
             return current_rep
@@ -56,7 +66,25 @@ class DecayScheduler:
             decayed = _hyperbolic_decay(current_rep, dt, self._cfg.half_life)
         else:
             decayed = current_rep
-        return float(np.clip(decayed, 0.0, 1.0))
+        return min(max(decayed, 0.0), 1.0)
 
     def apply_all(self, reps: dict[int, float]) -> dict[int, float]:
-        return {aid: self.apply(aid, r) for aid, r in reps.items()}
+        n = len(reps)
+        if n == 0:
+            return {}
+        r = np.fromiter(reps.values(), dtype=np.float64, count=n)
+        rows = np.fromiter((self._row.get(aid, -1) for aid in reps), dtype=np.int64, count=n)
+        dt = np.where(rows >= 0, self._t - self._last_active_arr[rows], 0)
+        np.maximum(dt, 0, out=dt)
+        cfg = self._cfg
+        if cfg.mode == "exponential":
+            decayed = r * np.exp(-cfg.lambda_exp * dt)
+        elif cfg.mode == "power_law":
+            decayed = r / (1.0 + dt) ** cfg.alpha_pow
+        elif cfg.mode == "hyperbolic":
+            decayed = r * cfg.half_life / (cfg.half_life + dt) if cfg.half_life > 0 else np.zeros(n)
+        else:
+            decayed = r.copy()
+        np.clip(decayed, 0.0, 1.0, out=decayed)
+        out = np.where(dt > 0, decayed, r)
+        return dict(zip(reps, out.tolist()))
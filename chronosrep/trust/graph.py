@@ -33,6 +33,11 @@ class TrustGraph:
         self._out_adj: dict[int, set[int]] = defaultdict(set)
         self._in_adj: dict[int, set[int]] = defaultdict(set)
         self._t: int = 0
+        self._rev: int = 0
+        self._edge_arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._active: dict[int, None] = {}
+        self._active_list: list[int] | None = None
+        self._active_arr: np.ndarray | None = None
 
     def upsert_node(self, agent_id: int, reputation: float, volatility: float, irv: np.ndarray) -> None:
         if agent_id in self._nodes:
@@ -42,6 +47,9 @@ class TrustGraph:
             n.irv = irv
             n.t_last_active = self._t
         else:
+            self._rev += 1
+            self._active[agent_id] = None
+            self._active_list = None
             self._nodes[agent_id] = _TrustNode(
                 agent_id=agent_id,
                 reputation=reputation,
@@ -51,6 +59,8 @@ class TrustGraph:
             )
 
     def record_interaction(self, src: int, dst: int, outcome: int, penalized_signal: float) -> None:
+        self._rev += 1
+        self._edge_arrays = None
         key = (src, dst)
         if key in self._edges:
             e = self._edges[key]
@@ -68,9 +78,35 @@ class TrustGraph:
             self._out_adj[src].add(dst)
             self._in_adj[dst].add(src)
 
+    def record_interactions(self, src, dst, outcomes, penalized_signals) -> None:
+        src = np.asarray(src, dtype=np.int64).tolist()
+        dst = np.asarray(dst, dtype=np.int64).tolist()
+        n = len(src)
+        outcomes = np.broadcast_to(np.asarray(outcomes, dtype=np.float64), (n,)).tolist()
+        signals = np.broadcast_to(np.asarray(penalized_signals, dtype=np.float64), (n,)).tolist()
+        self._rev += 1
+        self._edge_arrays = None
+        edges, decay, t = self._edges, self._decay_base, self._t
+        out_adj, in_adj = self._out_adj, self._in_adj
+        for s, d, o, w in zip(src, dst, outcomes, signals):
+            e = edges.get((s, d))
+            if e is not None:
+                e.weight = max(_MIN_WEIGHT, e.weight * decay + w)
+                e.outcome_sum += o
+                e.interaction_count += 1
+                e.last_t = t
+            else:
+                edges[(s, d)] = _TrustEdge(weight=w, outcome_sum=o, interaction_count=1, last_t=t)
+                out_adj[s].add(d)
+                in_adj[d].add(s)
+
     def isolate(self, agent_id: int) -> None:
         if agent_id in self._nodes:
             self._nodes[agent_id].isolated = True
+            self._rev += 1
+            if agent_id in self._active:
+                del self._active[agent_id]
+                self._active_list = None
 
     def neighbors_out(self, agent_id: int) -> list[int]:
         return list(self._out_adj.get(agent_id, set()))
@@ -82,6 +118,15 @@ class TrustGraph:
         e = self._edges.get((src, dst))
         return e.weight if e else 0.0
 
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._edge_arrays is None:
+            n = len(self._edges)
+            src = np.fromiter((k[0] for k in self._edges), dtype=np.int64, count=n)
+            dst = np.fromiter((k[1] for k in self._edges), dtype=np.int64, count=n)
+            w = np.fromiter((e.weight for e in self._edges.values()), dtype=np.float64, count=n)
+            self._edge_arrays = (src, dst, w)
+        return self._edge_arrays
+
     def edge_success_rate(self, src: int, dst: int) -> float:
         e = self._edges.get((src, dst))
         if e is None or e.interaction_count == 0:
@@ -91,8 +136,19 @@ class TrustGraph:
     def tick(self) -> None:
         self._t += 1
 
+    def _refresh_active(self) -> None:
+        self._active_list = list(self._active)
+        self._active_arr = np.fromiter(self._active, dtype=np.int64, count=len(self._active))
+
     def active_node_ids(self) -> list[int]:
-        return [nid for nid, n in self._nodes.items() if not n.isolated]
+        if self._active_list is None:
+            self._refresh_active()
+        return list(self._active_list)
+
+    def active_id_array(self) -> np.ndarray:
+        if self._active_list is None:
+            self._refresh_active()
+        return self._active_arr
 
     def node(self, agent_id: int) -> _TrustNode | None:
         return self._nodes.get(agent_id)
@@ -7,34 +7,69 @@ _MAX_ITER = 50
 _TOL = 1e-6
 
 
-def _pagerank_dict(graph: TrustGraph, node_ids: list[int]) -> dict[int, float]:
-    n = len(node_ids)
-    if n == 0:
-        return {}
-    idx = {nid: i for i, nid in enumerate(node_ids)}
-    scores = np.full(n, 1.0 / n)
-    for _ in range(_MAX_ITER):
-        new_scores = np.full(n, (1.0 - _DAMPING) / n)
-        for nid in node_ids:
-            i = idx[nid]
-            out_nbrs = graph.neighbors_out(nid)
-            out_nbrs = [v for v in out_nbrs if v in idx]
-            if not out_nbrs:
-                for j in range(n):
-                    new_scores[j] += _DAMPING * scores[i] / n
-                continue
-            total_w = sum(graph.edge_weight(nid, v) for v in out_nbrs)
-            if total_w < 1e-12:
-                total_w = 1.0
-            for v in out_nbrs:
-                j = idx[v]
-                w = graph.edge_weight(nid, v) / total_w
-                new_scores[j] += _DAMPING * scores[i] * w
+def _index_of(ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+    if ids.size == 0:
+        return np.full(query.shape, -1, dtype=np.int64)
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    pos = np.minimum(np.searchsorted(sorted_ids, query), ids.size - 1)
+    return np.where(sorted_ids[pos] == query, order[pos], -1)
+
+
+def _edge_index(graph: TrustGraph, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    src, dst, w = graph.edge_arrays()
+    si = _index_of(ids, src)
+    di = _index_of(ids, dst)
+    keep = (si >= 0) & (di >= 0)
+    return si[keep], di[keep], w[keep]
+
+
+def _pagerank_scores(
+    graph: TrustGraph,
+    ids: np.ndarray,
+    x0: np.ndarray | None = None,
+    edges: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+    damping: float = _DAMPING,
+    max_iter: int = _MAX_ITER,
+) -> np.ndarray:
+    n = ids.size
+    si, di, w = _edge_index(graph, ids) if edges is None else edges
+
+    total_w = np.bincount(si, weights=w, minlength=n)
+    total_w[total_w < 1e-12] = 1.0
+    wn = w / total_w[si]
+    dangling = np.bincount(si, minlength=n) == 0
+
+    scores = np.full(n, 1.0 / n) if x0 is None else x0
+    for _ in range(max_iter):
+        pushed = np.bincount(di, weights=wn * scores[si], minlength=n)
+        new_scores = (1.0 - damping) / n + damping * (pushed + scores[dangling].sum() / n)
         delta = float(np.abs(new_scores - scores).sum())
         scores = new_scores
         if delta < _TOL:
             break
-    return {nid: float(scores[idx[nid]]) for nid in node_ids}
+    return scores
+
+
+def _pagerank_dict(graph: TrustGraph, node_ids: list[int]) -> dict[int, float]:
+    if not node_ids:
+        return {}
+    scores = _pagerank_scores(graph, np.asarray(node_ids, dtype=np.int64))
+    return dict(zip(node_ids, scores.tolist()))
+
+
+def _mix_incoming(
+    vals: np.ndarray,
+    si: np.ndarray,
+    di: np.ndarray,
+    w: np.ndarray,
+    alpha: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    m = vals.shape[0]
+    total_w = np.bincount(di, weights=w, minlength=m)
+    contrib = np.bincount(di, weights=w * vals[si], minlength=m)
+    upd = total_w >= 1e-12
+    return upd, (1.0 - alpha) * vals[upd] + alpha * contrib[upd] / total_w[upd]
 
 
 def _weighted_reputation_propagation(
@@ -44,46 +79,116 @@ def _weighted_reputation_propagation(
     alpha: float = 0.3,
 ) -> dict[int, float]:
     propagated = dict(base_reps)
-    for nid in node_ids:
-        in_nbrs = graph.neighbors_in(nid)
-        in_nbrs = [v for v in in_nbrs if v in base_reps]
-        if not in_nbrs:
-            continue
-        total_w = sum(graph.edge_weight(v, nid) for v in in_nbrs)
-        if total_w < 1e-12:
-            continue
-        contrib = sum(
-            graph.edge_weight(v, nid) * base_reps[v] for v in in_nbrs
-        ) / total_w
-        propagated[nid] = (1.0 - alpha) * base_reps[nid] + alpha * contrib
+    m = len(base_reps)
+    if m == 0 or not node_ids:
+        return propagated
+    keys = np.fromiter(base_reps.keys(), dtype=np.int64, count=m)
+    vals = np.fromiter(base_reps.values(), dtype=np.float64, count=m)
+    is_target = np.zeros(m, dtype=bool)
+    ti = _index_of(keys, np.asarray(node_ids, dtype=np.int64))
+    is_target[ti[ti >= 0]] = True
+
+    si, di, w = _edge_index(graph, keys)
+    keep = is_target[di]
+    upd, new_vals = _mix_incoming(vals, si[keep], di[keep], w[keep], alpha)
+    propagated.update(zip(keys[upd].tolist(), new_vals.tolist()))
     return propagated
 
 
 class PropagationEngine:
-    def __init__(self, alpha: float = 0.3, use_pagerank: bool = True):
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        use_pagerank: bool = True,
+        damping: float = _DAMPING,
+        max_iter: int = _MAX_ITER,
+        warm_start: bool = False,
+    ):
+        # Warm-starting PageRank from the previous scores converges in fewer
+        # iterations but stops at a different point within tolerance, so results
+        # depend on call history and are not bit-reproducible across runs.
         self._alpha = alpha
+        self._warm_start = warm_start
         self._use_pagerank = use_pagerank
-        self._pr_cache: dict[int, float] = {}
+        self._damping = damping
+        self._max_iter = max_iter
+        self._pr_cache: dict[int, float] | None = {}
+        self._pr_norm: np.ndarray | None = None
+        self._last_graph: TrustGraph | None = None
+        self._last_rev: int = -1
+        self._last_key: bytes = b""
+        self._last_result: dict[int, float] = {}
+        self._pr_ids: np.ndarray | None = None
+        self._pr_scores: np.ndarray | None = None
+        self._edges: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._edges_graph: TrustGraph | None = None
+        self._edges_ids: np.ndarray | None = None
+        self._edges_rev: int = -1
+
+    def _base_arrays(self, base_reps: dict[int, float]) -> tuple[np.ndarray, np.ndarray]:
+        n = len(base_reps)
+        keys = np.fromiter(base_reps.keys(), dtype=np.int64, count=n)
+        vals = np.fromiter(base_reps.values(), dtype=np.float64, count=n)
+        return keys, vals
+
+    def _edges_for(self, graph: TrustGraph, ids: np.ndarray):
+        same = ids is self._edges_ids or (
+            self._edges_ids is not None and np.array_equal(ids, self._edges_ids)
+        )
+        if not (same and graph is self._edges_graph and graph._rev == self._edges_rev):
+            self._edges = _edge_index(graph, ids)
+            self._edges_graph, self._edges_ids, self._edges_rev = graph, ids, graph._rev
+        return self._edges
+
+    def _propagate_ids(self, graph: TrustGraph, ids: np.ndarray, reps: np.ndarray) -> np.ndarray:
+        edges = self._edges_for(graph, ids)
+        if self._use_pagerank:
+            warm = self._warm_start and (
+                ids is self._pr_ids or (self._pr_ids is not None and np.array_equal(ids, self._pr_ids))
+            )
+            scores = _pagerank_scores(
+                graph, ids, self._pr_scores if warm else None, edges, self._damping, self._max_iter,
+            )
+            self._pr_ids, self._pr_scores = ids, scores
+            pr_max = float(scores.max())
+            self._pr_norm = scores / pr_max if pr_max > 0 else scores
+            self._pr_cache = None
+            reps *= 0.7 + 0.3 * self._pr_norm
+            np.clip(reps, 0.0, 1.0, out=reps)
+        upd, new_vals = _mix_incoming(reps, *edges, self._alpha)
+        reps[upd] = new_vals
+        return reps
+
+    def propagate_array(self, graph: TrustGraph, base: np.ndarray) -> np.ndarray:
+        ids = graph.active_id_array()
+        reps = np.array(base, dtype=np.float64)
+        if ids.size == 0:
+            return reps
+        return self._propagate_ids(graph, ids, reps)
 
     def propagate(self, graph: TrustGraph, base_reps: dict[int, float]) -> dict[int, float]:
         node_ids = graph.active_node_ids()
         if not node_ids:
             return base_reps
 
+        keys, vals = self._base_arrays(base_reps)
+        key = keys.tobytes() + vals.tobytes()
+        if graph is self._last_graph and graph._rev == self._last_rev and key == self._last_key:
+            return dict(self._last_result)
+
         if self._use_pagerank:
-            pr = _pagerank_dict(graph, node_ids)
-            pr_max = max(pr.values()) if pr else 1.0
-            if pr_max > 0:
-                pr = {k: v / pr_max for k, v in pr.items()}
-            self._pr_cache = pr
-            adjusted = {
-                nid: float(np.clip(base_reps.get(nid, 0.5) * (0.7 + 0.3 * pr.get(nid, 0.5)), 0.0, 1.0))
-                for nid in node_ids
-            }
+            ids = graph.active_id_array()
+            bi = _index_of(keys, ids)
+            adjusted = self._propagate_ids(graph, ids, np.where(bi >= 0, vals[bi], 0.5))
+            result = dict(zip(node_ids, adjusted.tolist()))
         else:
-            adjusted = dict(base_reps)
+            result = _weighted_reputation_propagation(graph, node_ids, base_reps, self._alpha)
 
-        return _weighted_reputation_propagation(graph, node_ids, adjusted, self._alpha)
+        self._last_graph, self._last_rev, self._last_key = graph, graph._rev, key
+        self._last_result = result
+        return dict(result)
 
     def pagerank_score(self, agent_id: int) -> float:
+        if self._pr_cache is None:
+            self._pr_cache = dict(zip(self._pr_ids.tolist(), self._pr_norm.tolist()))
         return self._pr_cache.get(agent_id, 0.0)
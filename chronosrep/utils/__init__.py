@@ -1,23 +1,25 @@
 from .math_utils import (
     softmax, sigmoid, shannon_entropy, rolling_mean, rolling_std,
-    ewma, z_score, clip_normalize, gini_coefficient, lorenz_curve,
+    ewma, ewma_path, z_score, clip_normalize, gini_coefficient, lorenz_curve,
     cosine_similarity, kl_divergence,
 )
 from .seed_manager import (
     set_global_seed, get_global_seed, make_rng, fork_rng, temp_seed, seeds_for_sweep,
 )
 from .serialization import (
-    save_json, load_json, save_pickle, load_pickle,
-    dataclass_to_dict, agent_state_snapshot, save_checkpoint,
+    save_json, load_json, save_msgpack, load_msgpack, save_parquet, load_parquet,
+    save_pickle, load_pickle,
+    dataclass_to_dict, agent_state_snapshot, save_checkpoint, AsyncCheckpointer,
 )
 from .logging_utils import get_logger, StepLogger
 
 __all__ = [
     "softmax", "sigmoid", "shannon_entropy", "rolling_mean", "rolling_std",
-    "ewma", "z_score", "clip_normalize", "gini_coefficient", "lorenz_curve",
+    "ewma", "ewma_path", "z_score", "clip_normalize", "gini_coefficient", "lorenz_curve",
     "cosine_similarity", "kl_divergence",
     "set_global_seed", "get_global_seed", "make_rng", "fork_rng", "temp_seed", "seeds_for_sweep",
-    "save_json", "load_json", "save_pickle", "load_pickle",
-    "dataclass_to_dict", "agent_state_snapshot", "save_checkpoint",
+    "save_json", "load_json", "save_msgpack", "load_msgpack", "save_parquet", "load_parquet",
+    "save_pickle", "load_pickle",
+    "dataclass_to_dict", "agent_state_snapshot", "save_checkpoint", "AsyncCheckpointer",
     "get_logger", "StepLogger",
 ]
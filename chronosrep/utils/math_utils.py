@@ -1,46 +1,78 @@
 from __future__ import annotations
+import math
 import numpy as np
 
+from chronosrep.utils.jit import njit
+
+_LN2_RECIP = 1.0 / np.log(2.0)
+
 
 def softmax(x: np.ndarray, temperature: float = 1.0) -> np.ndarray:
-    x = np.asarray(x, dtype=float)
+    x = np.asarray(x)
+    x = x.astype(np.result_type(x.dtype, np.float32), copy=False)
     if temperature <= 0:
         raise ValueError("temperature must be > 0")
-    e = np.exp((x - x.max()) / temperature)
-    return e / e.sum()
+    out = np.subtract(x, x.max())
+    if temperature != 1.0:
+        out /= temperature
+    np.exp(out, out=out)
+    out /= out.sum()
+    return out
+
+
+def _sigmoid_scalar(z: float) -> float:
+    if z >= 0.0:
+        return 1.0 / (1.0 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1.0 + e)
 
 
 def sigmoid(x: float | np.ndarray, k: float = 1.0, x0: float = 0.0) -> float | np.ndarray:
-    return 1.0 / (1.0 + np.exp(-k * (np.asarray(x) - x0)))
+    if np.ndim(x) == 0:
+        return _sigmoid_scalar(k * (float(x) - x0))
+    out = np.subtract(np.asarray(x, dtype=float), x0)
+    out *= -k
+    np.exp(out, out=out)
+    out += 1.0
+    np.reciprocal(out, out=out)
+    return out
 
 
 def shannon_entropy(probs: np.ndarray) -> float:
     p = np.asarray(probs, dtype=float)
-    p = p[p > 0]
-    return float(-np.sum(p * np.log2(p)))
+    logp = np.log(p, out=np.zeros_like(p), where=p > 0)
+    return float(-np.vdot(p, logp)) * _LN2_RECIP
+
+
+def _window_sums(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    n = x.shape[0]
+    csum = np.zeros(n + 1)
+    np.cumsum(x, out=csum[1:])
+    hi = np.arange(1, n + 1)
+    lo = np.maximum(hi - max(window, 1), 0)
+    return csum[hi] - csum[lo], (hi - lo).astype(np.float64)
 
 
 def rolling_mean(arr: list[float], window: int) -> list[float]:
-    if not arr:
+    if len(arr) == 0:
         return []
-    out = []
-    for i in range(len(arr)):
-        w = arr[max(0, i - window + 1): i + 1]
-        out.append(float(np.mean(w)))
-    return out
+    s, length = _window_sums(np.asarray(arr, dtype=float), window)
+    s /= length
+    return s.tolist()
 
 
 def rolling_std(arr: list[float], window: int, ddof: int = 1) -> list[float]:
-    if not arr:
+    if len(arr) == 0:
         return []
-    out = []
-    for i in range(len(arr)):
-        w = arr[max(0, i - window + 1): i + 1]
-        if len(w) < 2:
-            out.append(0.0)
-        else:
-            out.append(float(np.std(w, ddof=ddof)))
-    return out
+    x = np.asarray(arr, dtype=float)
+    x = x - x.mean()
+    s, length = _window_sums(x, window)
+    s2, _ = _window_sums(x * x, window)
+    s2 -= s * s / length
+    np.maximum(s2, 0.0, out=s2)
+    denom = length - ddof
+    var = np.divide(s2, denom, out=np.zeros_like(s2), where=(length >= 2) & (denom > 0))
+    return np.sqrt(var, out=var).tolist()
 
 
 def ewma(arr: list[float], lam: float = 0.94) -> list[float]:
@@ -52,6 +84,15 @@ def ewma(arr: list[float], lam: float = 0.94) -> list[float]:
     return result
 
 
+@njit("float64[::1](float64, float64[:], float64)", cache=True, fastmath=True)
+def ewma_path(x0: float, s: np.ndarray, lam: float) -> np.ndarray:
+    out = np.empty(s.shape[0] + 1)
+    out[0] = x0
+    for i in range(s.shape[0]):
+        out[i + 1] = (1.0 - lam) * out[i] + lam * s[i]
+    return out
+
+
 def z_score(value: float, mean: float, std: float) -> float:
     if std < 1e-12:
         return 0.0
@@ -68,12 +109,12 @@ def clip_normalize(arr: np.ndarray, lo: float = 0.0, hi: float = 1.0) -> np.ndar
 def gini_coefficient(values: list[float] | np.ndarray) -> float:
     arr = np.asarray(values, dtype=float)
     arr = arr[arr >= 0]
-    if arr.sum() < 1e-12:
+    total = arr.sum()
+    if total < 1e-12:
         return 0.0
-    arr = np.sort(arr)
-    n = len(arr)
-    idx = np.arange(1, n + 1)
-    return float((2 * (idx * arr).sum() / (n * arr.sum())) - (n + 1) / n)
+    arr.sort()
+    n = arr.shape[0]
+    return float(np.dot(2.0 * np.arange(1, n + 1) - n - 1, arr) / (n * total))
 
 
 def lorenz_curve(values: list[float] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -1,10 +1,45 @@
 from __future__ import annotations
 import json
+import math
 import pickle
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, fields, is_dataclass
 import numpy as np
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+def _msgpack_hook(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+if _HAS_MSGSPEC:
+    _MSGPACK_ENC = msgspec.msgpack.Encoder(enc_hook=_msgpack_hook)
+    _MSGPACK_DEC = msgspec.msgpack.Decoder()
+
 
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -14,33 +49,180 @@ class NumpyEncoder(json.JSONEncoder):
             return int(obj)
         if isinstance(obj, (np.floating,)):
             return float(obj)
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
         return super().default(obj)
 
 
-def save_json(obj, path: str | Path, indent: int = 2) -> Path:
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(obj, f, cls=NumpyEncoder, indent=indent)
+def _orjson_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(d: Path) -> None:
+    if d not in _ENSURED_DIRS:
+        d.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(d)
+
+
+def _open_for_write(path: Path):
+    _ensure_dir(path.parent)
+    try:
+        return open(path, "wb")
+    except FileNotFoundError:
+        _ENSURED_DIRS.discard(path.parent)
+        _ensure_dir(path.parent)
+        return open(path, "wb")
+
+
+def _write_bytes(path: Path, data: bytes) -> Path:
+    with _open_for_write(path) as f:
+        f.write(data)
     return path
 
 
+def _has_nonfinite(obj) -> bool:
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind in "fc" and not np.isfinite(obj).all()
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return any(_has_nonfinite(getattr(obj, f.name)) for f in fields(obj))
+    return False
+
+
+def _encode_json(obj, indent: int | None = 2) -> bytes:
+    # orjson writes NaN/Infinity as null; keep the stdlib tokens so both paths
+    # produce the same file and the values survive a round trip.
+    if _HAS_ORJSON and indent in (None, 0, 2) and not _has_nonfinite(obj):
+        opt = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            opt |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_orjson_default, option=opt)
+    return json.dumps(obj, cls=NumpyEncoder, indent=indent).encode()
+
+
+def save_json(obj, path: str | Path, indent: int | None = 2) -> Path:
+    return _write_bytes(Path(path), _encode_json(obj, indent))
+
+
 def load_json(path: str | Path) -> object:
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _encode_msgpack(obj) -> bytes:
+    if not _HAS_MSGSPEC:
+        raise ImportError("msgspec is required for .msgpack output")
+    return _MSGPACK_ENC.encode(obj)
+
+
+def save_msgpack(obj, path: str | Path) -> Path:
+    return _write_bytes(Path(path), _encode_msgpack(obj))
+
+
+def load_msgpack(path: str | Path) -> object:
+    if not _HAS_MSGSPEC:
+        raise ImportError("msgspec is required for .msgpack input")
+    with open(path, "rb") as f:
+        return _MSGPACK_DEC.decode(f.read())
+
+
+def _arrow_column(values):
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        return pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), values.shape[1])
+    return pa.array(values)
+
+
+def _encode_parquet(columns: dict, metadata: dict | None = None) -> bytes:
+    if not _HAS_PYARROW:
+        raise ImportError("pyarrow is required for .parquet output")
+    table = pa.table({k: _arrow_column(v) for k, v in columns.items() if v is not None})
+    if metadata:
+        table = table.replace_schema_metadata({k: _encode_json(v, None) for k, v in metadata.items()})
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue().to_pybytes()
+
+
+def save_parquet(columns, path: str | Path, metadata: dict | None = None) -> Path:
+    if not isinstance(columns, dict):
+        columns = {k: columns[k].to_numpy() for k in columns.columns}
+    return _write_bytes(Path(path), _encode_parquet(columns, metadata))
+
+
+def load_parquet(path: str | Path) -> dict[str, np.ndarray]:
+    if not _HAS_PYARROW:
+        raise ImportError("pyarrow is required for .parquet input")
+    table = pq.read_table(path)
+    out = {}
+    for name in table.column_names:
+        col = table.column(name).combine_chunks()
+        if pa.types.is_fixed_size_list(col.type):
+            out[name] = col.flatten().to_numpy().reshape(len(col), col.type.list_size)
+        else:
+            out[name] = col.to_numpy(zero_copy_only=False)
+    return out
+
+
+def _is_plain_array(obj) -> bool:
+    return isinstance(obj, np.ndarray) and not obj.dtype.hasobject
 
 
 def save_pickle(obj, path: str | Path) -> Path:
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "wb") as f:
-        pickle.dump(obj, f)
+    with _open_for_write(path) as f:
+        if _is_plain_array(obj):
+            np.save(f, obj, allow_pickle=False)
+        elif isinstance(obj, dict) and obj and all(
+            isinstance(k, str) and _is_plain_array(v) for k, v in obj.items()
+        ):
+            np.savez(f, **obj)
+        else:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
     return path
 
 
+_NPY_MAGIC = b"\x93NUMPY"
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
 def load_pickle(path: str | Path) -> object:
+    """Load a file written by ``save_pickle``.
+
+    Plain arrays come back as read-only ``np.memmap`` views; call ``np.array``
+    on the result if it needs to be modified.
+    """
+    path = Path(path)
     with open(path, "rb") as f:
-        return pickle.load(f)
+        head = f.read(len(_NPY_MAGIC))
+        if not head.startswith((_NPY_MAGIC, _ZIP_MAGIC)):
+            f.seek(0)
+            return pickle.load(f)
+    if head == _NPY_MAGIC:
+        return np.load(path, mmap_mode="r", allow_pickle=False)
+    with np.load(path, allow_pickle=False) as z:
+        return {k: z[k] for k in z.files}
 
 
 def dataclass_to_dict(obj) -> dict:
@@ -50,23 +232,20 @@ def dataclass_to_dict(obj) -> dict:
         return vars(obj)
 
 
-def agent_state_snapshot(agents: list) -> list[dict]:
-    rows = []
-    for a in agents:
-        row = {
-            "unique_id":  a.unique_id,
-            "reputation": float(getattr(a, "reputation", 0.0)),
-            "isolated":   bool(getattr(a, "isolated", False)),
-            "is_attacker": bool(getattr(a, "is_attacker", False)),
-        }
-        irv = getattr(a, "irv", None)
-        if irv is not None:
-            row["irv"] = irv.tolist() if isinstance(irv, np.ndarray) else irv
-        rows.append(row)
-    return rows
+def agent_state_snapshot(agents: list) -> dict[str, np.ndarray | None]:
+    n = len(agents)
+    irvs = [getattr(a, "irv", None) for a in agents]
+    has_irv = n > 0 and all(v is not None for v in irvs)
+    return {
+        "unique_id":   np.fromiter((a.unique_id for a in agents), dtype=np.int64, count=n),
+        "reputation":  np.fromiter((getattr(a, "reputation", 0.0) for a in agents), dtype=np.float64, count=n),
+        "isolated":    np.fromiter((getattr(a, "isolated", False) for a in agents), dtype=np.bool_, count=n),
+        "is_attacker": np.fromiter((getattr(a, "is_attacker", False) for a in agents), dtype=np.bool_, count=n),
+        "irv":         np.vstack(irvs) if has_irv else None,
+    }
 
 
-def save_checkpoint(model, path: str | Path, step: int | None = None) -> Path:
+def _encode_checkpoint(model, path: str | Path, step: int | None) -> tuple[Path, bytes]:
     path = Path(path)
     if step is not None:
         path = path.with_stem(f"{path.stem}_step{step:05d}")
@@ -75,4 +254,46 @@ def save_checkpoint(model, path: str | Path, step: int | None = None) -> Path:
         "step": step,
         "agents": agents_snapshot,
     }
-    return save_json(payload, path)
+    if path.suffix == ".msgpack":
+        return path, _encode_msgpack(payload)
+    if path.suffix == ".parquet":
+        return path, _encode_parquet(agents_snapshot, {"step": step})
+    return path, _encode_json(payload)
+
+
+def save_checkpoint(model, path: str | Path, step: int | None = None) -> Path:
+    return _write_bytes(*_encode_checkpoint(model, path, step))
+
+
+class AsyncCheckpointer:
+    def __init__(self, max_pending: int = 8):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._max_pending = max(max_pending, 1)
+        self._pending: deque[Future] = deque()
+        self._done: list[Path] = []
+
+    def save(self, model, path: str | Path, step: int | None = None) -> Future:
+        target, data = _encode_checkpoint(model, path, step)
+        while len(self._pending) >= self._max_pending:
+            self._done.append(self._pending.popleft().result())
+        fut = self._pool.submit(_write_bytes, target, data)
+        self._pending.append(fut)
+        return fut
+
+    def flush(self) -> list[Path]:
+        paths, self._done = self._done, []
+        while self._pending:
+            paths.append(self._pending.popleft().result())
+        return paths
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> AsyncCheckpointer:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,3 +1,7 @@
+from ._plot_helpers import configure_mpl, plots_enabled
+
+configure_mpl()
+
 from .run_experiments import main
 
-__all__ = ["main"]
+__all__ = ["main", "configure_mpl", "plots_enabled"]
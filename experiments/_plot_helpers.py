@@ -0,0 +1,31 @@
+from __future__ import annotations
+import os
+import sys
+
+import matplotlib
+
+_RC = {
+    "savefig.dpi": 120,
+    "font.family": "DejaVu Sans",
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+_PLOTS_ENV = "CHRONOSREP_PLOTS"
+SAVEFIG_KW = {"pil_kwargs": {"compress_level": 1, "optimize": False}}
+_configured = False
+
+
+def configure_mpl() -> None:
+    global _configured
+    if _configured:
+        return
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update(_RC)
+    _configured = True
+
+
+def plots_enabled(argv: list[str] | None = None) -> bool:
+    if "--no-plots" in (sys.argv if argv is None else argv):
+        return False
+    return os.environ.get(_PLOTS_ENV, "1") != "0"
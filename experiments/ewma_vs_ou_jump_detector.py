@@ -8,6 +8,11 @@ known injection step.
 from __future__ import annotations
 from pathlib import Path
 import numpy as np
+
+from chronosrep.utils.math_utils import ewma_path
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
 import matplotlib.pyplot as plt
 
 _EWMA_LAMBDA = 0.15
@@ -15,39 +20,26 @@ _N_STEPS     = 51
 _ATTACK_STEP = 35
 _OUT = Path(__file__).parent / "output" / "ewma_vs_ou_jump_detector.png"
 
-
-def _ewma_trace(evidence: list[float], lam: float) -> list[float]:
-    rep = 0.5
-    traj = [rep]
-    for e in evidence:
-        rep = (1 - lam) * rep + lam * e
-        traj.append(rep)
-    return traj
+_IRV_HONEST = np.array([0.80, 0.02, 0.05, 0.82, 0.80])
+_IRV_ATTACK = np.array([0.05, 0.75, 0.10, 0.08, 0.05])
+_IRV_HONEST.flags.writeable = False
+_IRV_ATTACK.flags.writeable = False
 
 
-def _ou_jd_trace(evidence: list[float]) -> list[float]:
+def _ou_jd_trace(evidence: np.ndarray) -> list[float]:
     from chronosrep.modules.vadm import VADM
     vadm = VADM(theta_0=0.4, sigma=0.03, jump_scale=0.40, seed=17)
-    import numpy as np
-    irv_honest  = np.array([0.80, 0.02, 0.05, 0.82, 0.80])
-    irv_attack  = np.array([0.05, 0.75, 0.10, 0.08, 0.05])
-    rep, _ = vadm.step(0, irv_honest, 0.80)
+    step = vadm.step
+    rep, _ = step(0, _IRV_HONEST, 0.80)
     traj = [rep]
-    for t, e in enumerate(evidence):
-        irv = irv_attack if t >= _ATTACK_STEP - 1 else irv_honest
-        rep, _ = vadm.step(0, irv, float(e))
+    for t, e in enumerate(np.asarray(evidence, dtype=np.float64).tolist()):
+        rep, _ = step(0, _IRV_ATTACK if t >= _ATTACK_STEP - 1 else _IRV_HONEST, e)
         traj.append(rep)
     return traj
 
 
-def _build_euler_evidence() -> list[float]:
-    ev: list[float] = []
-    for t in range(_N_STEPS):
-        if t < _ATTACK_STEP:
-            ev.append(1.0)
-        else:
-            ev.append(0.0)
-    return ev
+def _build_euler_evidence() -> np.ndarray:
+    return np.where(np.arange(_N_STEPS) < _ATTACK_STEP, 1.0, 0.0)
 
 
 def run(out_path: Path = _OUT) -> None:
@@ -55,7 +47,7 @@ def run(out_path: Path = _OUT) -> None:
     evidence = _build_euler_evidence()
     t_axis   = list(range(_N_STEPS + 1))
 
-    traj_ewma = _ewma_trace(evidence, _EWMA_LAMBDA)
+    traj_ewma = ewma_path(0.5, np.asarray(evidence, dtype=np.float64), _EWMA_LAMBDA)
     traj_ou   = _ou_jd_trace(evidence)
 
     fig, ax = plt.subplots(figsize=(10, 5))
@@ -80,7 +72,7 @@ def run(out_path: Path = _OUT) -> None:
     ax.set_ylim(-0.05, 1.10)
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     plt.close(fig)
     print(f"Saved → {out_path}")
 
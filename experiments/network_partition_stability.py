@@ -9,59 +9,86 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 import networkx as nx
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
+import matplotlib.pyplot as plt
+
 try:
     import community as community_louvain
     _HAS_LOUVAIN = True
 except ImportError:
     _HAS_LOUVAIN = False
 
-from chronosrep.network.topology import TopologyBuilder
+from chronosrep.network.topology import TopologyBuilder, TopologyConfig
 from chronosrep.network.partition import PartitionCache
 
 _OUT = Path(__file__).parent / "output" / "network_partition_stability.png"
 
 
-def _modularity(G: nx.Graph) -> float:
+def _partition(G: nx.Graph) -> dict[int, int]:
+    if not _HAS_LOUVAIN or G.number_of_nodes() < 3:
+        return {n: 0 for n in G.nodes()}
+    try:
+        return community_louvain.best_partition(G)
+    except Exception:
+        return {n: 0 for n in G.nodes()}
+
+
+def _modularity(part: dict[int, int], G: nx.Graph) -> float:
     if not _HAS_LOUVAIN or G.number_of_nodes() < 3:
         return 0.0
     try:
-        part = community_louvain.best_partition(G)
         return community_louvain.modularity(part, G)
     except Exception:
         return 0.0
 
 
-def _run_topology(mode: str, n: int, T: int) -> list[float]:
-    builder = TopologyBuilder(seed=42)
-    G = builder.build(mode, n)
+def _community_counts(part: dict[int, int], G: nx.Graph) -> tuple[dict[int, float], dict[int, float]]:
+    internal: dict[int, float] = {}
+    external: dict[int, float] = {}
+    for u, v, w in G.edges(data="weight", default=1.0):
+        cu, cv = part[u], part[v]
+        if cu == cv:
+            internal[cu] = internal.get(cu, 0.0) + w
+        else:
+            external[cu] = external.get(cu, 0.0) + w
+            external[cv] = external.get(cv, 0.0) + w
+    return internal, external
+
+
+def _run_topology(mode: str, n: int, T: int, rng: np.random.Generator) -> list[float]:
+    builder = TopologyBuilder(TopologyConfig(mode=mode), seed=42)
+    G = builder.build(n)
     cache = PartitionCache()
+    nodes = np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())
     mods = []
+    ug, part, q = G, {}, 0.0
     for t in range(T):
-        if t % 5 == 0 and t > 0:
+        dirty = t == 0
+        if t % 5 == 0 and t > 0 and nodes.size >= 2:
             edges = list(G.edges())
-            n_rewire = max(1, int(0.02 * len(edges)))
-            for _ in range(n_rewire):
-                if edges:
-                    u, v = edges[np.random.randint(len(edges))]
-                    G.remove_edge(u, v)
-                    a, b = np.random.choice(list(G.nodes()), 2, replace=False)
-                    G.add_edge(int(a), int(b))
-        ug = G.to_undirected() if G.is_directed() else G
-        q = _modularity(ug)
+            n_rewire = min(max(1, int(0.02 * len(edges))), len(edges))
+            picked = rng.choice(len(edges), size=n_rewire, replace=False)
+            a = rng.integers(0, nodes.size, n_rewire)
+            b = rng.integers(0, nodes.size - 1, n_rewire)
+            b += b >= a
+            G.remove_edges_from([edges[i] for i in picked.tolist()])
+            G.add_edges_from(zip(nodes[a].tolist(), nodes[b].tolist()))
+            dirty = True
+        if dirty:
+            ug = G.to_undirected() if G.is_directed() else G
+            part = _partition(ug)
+            q = _modularity(part, ug)
         mods.append(q)
         if t % 10 == 0:
-            import networkx.algorithms.community as nx_comm
-            try:
-                part_dict = community_louvain.best_partition(ug) if _HAS_LOUVAIN else {n: 0 for n in ug.nodes()}
-                cache.update(t, part_dict, ug)
-            except Exception:
-                pass
+            internal, external = _community_counts(part, ug)
+            cache.store(t, part, internal, external, ug.size(weight="weight"))
     return mods
 
 
@@ -69,14 +96,13 @@ def main(out_path: Path = _OUT) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     N = 80
     T = 100
-    modes = ["erdos_renyi", "barabasi_albert", "watts_strogatz"]
+    modes = ["random_erdos_renyi", "barabasi_albert", "watts_strogatz"]
     labels = ["Erdős-Rényi", "Barabási-Albert", "Watts-Strogatz"]
 
     fig, ax = plt.subplots(figsize=(9, 4))
     steps = np.arange(T)
     for mode, lbl in zip(modes, labels):
-        np.random.seed(0)
-        mods = _run_topology(mode, N, T)
+        mods = _run_topology(mode, N, T, np.random.default_rng(0))
         ax.plot(steps, mods, label=lbl, linewidth=1.8)
 
     ax.set_xlabel("Step")
@@ -85,7 +111,7 @@ def main(out_path: Path = _OUT) -> None:
     ax.legend()
     ax.grid(alpha=0.3)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     print(f"Saved → {out_path}")
     plt.close(fig)
 
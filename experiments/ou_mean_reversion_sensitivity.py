@@ -6,6 +6,10 @@ speed parameter theta, demonstrating robustness to initialization bias.
 from __future__ import annotations
 from pathlib import Path
 import numpy as np
+
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
 import matplotlib.pyplot as plt
 
 from chronosrep.modules.vadm import VADM
@@ -36,7 +40,7 @@ def run(out_path: Path = _OUT) -> None:
     ax.set_ylim(0.0, 1.05)
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     plt.close(fig)
     print(f"Saved → {out_path}")
 
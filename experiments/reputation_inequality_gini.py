@@ -9,11 +9,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
+import matplotlib.pyplot as plt
+
 from chronosrep.model import ChronosRepModel
 from chronosrep.scenarios import SleeperAgentScenario, CollusionFarmingScenario
 from chronosrep.utils import gini_coefficient
@@ -23,12 +27,12 @@ _OUT = Path(__file__).parent / "output" / "reputation_inequality_gini.png"
 
 def _gini_series(model: ChronosRepModel, t_steps: int, scenario=None) -> list[float]:
     ginis = []
+    gate = scenario.should_inject if scenario is not None else None
     for step in range(t_steps):
-        if scenario is not None:
+        if gate is not None and gate(model.current_step):
             scenario.inject(model)
         model.step()
-        reps = [a.reputation for a in model.schedule.agents]
-        ginis.append(gini_coefficient(reps))
+        ginis.append(gini_coefficient(model.reputation))
     return ginis
 
 
@@ -64,7 +68,7 @@ def main(out_path: Path = _OUT) -> None:
     ax.legend()
     ax.grid(alpha=0.3)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     print(f"Saved → {out_path}")
     plt.close(fig)
 
@@ -9,11 +9,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
+import matplotlib.pyplot as plt
+
 from chronosrep.identity.revocation import RevocationIndex
 
 _OUT = Path(__file__).parent / "output" / "revocation_velocity_analysis.png"
@@ -21,38 +25,39 @@ _OUT = Path(__file__).parent / "output" / "revocation_velocity_analysis.png"
 
 def main(out_path: Path = _OUT) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    np.random.seed(7)
+    rng = np.random.default_rng(7)
     T = 100
+    EPOCH = 10
     N_honest   = 80
     N_attacker = 20
     idx = RevocationIndex()
 
-    honest_ids   = list(range(N_honest))
-    attacker_ids = list(range(N_honest, N_honest + N_attacker))
-
-    velocities: list[float] = []
-    atk_accum:  list[float] = []
-    hon_accum:  list[float] = []
+    honest_ids   = np.arange(N_honest)
+    attacker_ids = np.arange(N_honest, N_honest + N_attacker)
+    hon_events = rng.random((T, N_honest)) < 0.01
+    atk_events = rng.random((T, N_attacker)) < 0.15
 
+    atk_velocity = np.empty(T)
+    hon_velocity = np.empty(T)
     for step in range(T):
-        epoch = step // 10
-        for aid in honest_ids:
-            if np.random.random() < 0.01:
-                idx.revoke(aid, f"vc-{aid}-{step}", epoch)
-        for aid in attacker_ids:
-            if np.random.random() < 0.15:
-                idx.revoke(aid, f"vc-{aid}-{step}", epoch)
+        reason = f"epoch-{step // EPOCH}"
+        for aid in honest_ids[hon_events[step]].tolist():
+            idx.revoke(f"vc-{aid}-{step}", aid, reason)
+        for aid in attacker_ids[atk_events[step]].tolist():
+            idx.revoke(f"vc-{aid}-{step}", aid, reason)
+        atk_velocity[step] = np.mean([idx.revocation_velocity(a, EPOCH) for a in attacker_ids.tolist()])
+        hon_velocity[step] = np.mean([idx.revocation_velocity(a, EPOCH) for a in honest_ids.tolist()])
+        idx.tick()
 
-        velocities.append(idx.revocation_velocity(epoch))
-        atk_acc = np.mean([idx.accumulation_vector(aid, T, 10)[-1] for aid in attacker_ids])
-        hon_acc = np.mean([idx.accumulation_vector(aid, T, 10)[-1] for aid in honest_ids])
-        atk_accum.append(float(atk_acc))
-        hon_accum.append(float(hon_acc))
+    atk_accum = np.cumsum(atk_events.sum(axis=1)) / N_attacker
+    hon_accum = np.cumsum(hon_events.sum(axis=1)) / N_honest
 
     steps = np.arange(T)
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(9, 6), sharex=True)
-    ax1.plot(steps, velocities, color="crimson", linewidth=1.8)
-    ax1.set_ylabel("Revocation velocity (per epoch)")
+    ax1.plot(steps, atk_velocity, label="Attacker", color="red",       linewidth=1.8)
+    ax1.plot(steps, hon_velocity, label="Honest",   color="steelblue", linewidth=1.8)
+    ax1.set_ylabel(f"Revocation velocity\n(per agent-step, {EPOCH}-step window)")
+    ax1.legend()
     ax1.set_title("Credential Revocation Dynamics — Honest vs. Attacker Cohorts")
     ax1.grid(alpha=0.3)
 
@@ -64,7 +69,7 @@ def main(out_path: Path = _OUT) -> None:
     ax2.grid(alpha=0.3)
 
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     print(f"Saved → {out_path}")
     plt.close(fig)
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 import time
 import numpy as np
+
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl, plots_enabled
+
+configure_mpl()
 import matplotlib.pyplot as plt
 
 from chronosrep import ChronosRepModel
@@ -15,14 +19,14 @@ from chronosrep.analysis import MetricsCollector
 def _run(model_cls, scenario=None) -> tuple[ChronosRepModel, float]:
     m = model_cls(scenario=scenario)
     t0 = time.perf_counter()
-    for _ in range(model_cls.T):
-        m.step()
-    return m, time.perf_counter() - t0
+    m.run(model_cls.T)
+    elapsed = time.perf_counter() - t0
+    m.release_agents()
+    return m, elapsed
 
 
 def _rep_series(m: ChronosRepModel) -> list[float]:
-    df = m.datacollector.get_model_vars_dataframe()
-    return df["AvgReputation"].tolist()
+    return list(m.datacollector.model_vars["AvgReputation"])
 
 
 def plot_reputation_curves(
@@ -45,7 +49,7 @@ def plot_reputation_curves(
     ax.legend()
     ax.grid(True, alpha=0.3)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     plt.close(fig)
     print(f"[Plot] saved → {out_path}")
 
@@ -56,22 +60,25 @@ def main() -> None:
 
     print(f"Running baseline  (N={N}, T={T}) ...")
     m_base, t0 = _run(ChronosRepModel)
-    print(f"  done in {t0:.1f}s  AvgRep={m_base.datacollector.get_model_vars_dataframe()['AvgReputation'].iloc[-1]:.4f}")
+    print(f"  done in {t0:.1f}s  AvgRep={m_base.datacollector.model_vars['AvgReputation'][-1]:.4f}")
 
     print("Running Scenario 1 — Sleeper ...")
     m_sl, t1 = _run(ChronosRepModel, SleeperAgentScenario())
-    df1 = m_sl.datacollector.get_model_vars_dataframe()
-    print(f"  done in {t1:.1f}s  AvgRep={df1['AvgReputation'].iloc[-1]:.4f}  IsoRate={df1['IsolationRate'].iloc[-1]:.3f}")
+    mv1 = m_sl.datacollector.model_vars
+    print(f"  done in {t1:.1f}s  AvgRep={mv1['AvgReputation'][-1]:.4f}  IsoRate={mv1['IsolationRate'][-1]:.3f}")
 
     print("Running Scenario 2 — Transgression ...")
     m_tr, t2 = _run(ChronosRepModel, TransgressionRecoveryScenario())
-    df2 = m_tr.datacollector.get_model_vars_dataframe()
-    print(f"  done in {t2:.1f}s  AvgRep={df2['AvgReputation'].iloc[-1]:.4f}  IsoRate={df2['IsolationRate'].iloc[-1]:.3f}")
+    mv2 = m_tr.datacollector.model_vars
+    print(f"  done in {t2:.1f}s  AvgRep={mv2['AvgReputation'][-1]:.4f}  IsoRate={mv2['IsolationRate'][-1]:.3f}")
 
     print("Running Scenario 3 — Collusion ...")
     m_co, t3 = _run(ChronosRepModel, CollusionFarmingScenario())
-    df3 = m_co.datacollector.get_model_vars_dataframe()
-    print(f"  done in {t3:.1f}s  AvgRep={df3['AvgReputation'].iloc[-1]:.4f}  IsoRate={df3['IsolationRate'].iloc[-1]:.3f}")
+    mv3 = m_co.datacollector.model_vars
+    print(f"  done in {t3:.1f}s  AvgRep={mv3['AvgReputation'][-1]:.4f}  IsoRate={mv3['IsolationRate'][-1]:.3f}")
+
+    if not plots_enabled():
+        return
 
     plot_reputation_curves({
         "Baseline":      _rep_series(m_base),
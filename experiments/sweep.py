@@ -3,6 +3,7 @@ sweep.py – Parameter sweep runner.
 Runs BenchmarkRunner over a SweepConfig and writes results to results/.
 """
 from __future__ import annotations
+import os
 import sys
 from pathlib import Path
 
@@ -12,8 +13,12 @@ sys.path.insert(0, str(ROOT))
 from chronosrep.evaluation import BenchmarkRunner, SweepConfig, ResultsWriter
 from chronosrep.utils import set_global_seed
 
+_JOBS_ENV = "CHRONOSREP_SWEEP_JOBS"
 
-def main():
+
+def main(n_jobs: int | None = None):
+    if n_jobs is None and os.environ.get(_JOBS_ENV):
+        n_jobs = int(os.environ[_JOBS_ENV])
     set_global_seed(42)
     cfg = SweepConfig(
         n_agents_list=[50, 100],
@@ -24,7 +29,7 @@ def main():
     )
     runner = BenchmarkRunner(config=cfg)
     print("Starting sweep …")
-    results = runner.run_sweep(verbose=True)
+    results = runner.run_sweep(verbose=True, max_workers=n_jobs)
     summary = runner.summary()
 
     writer = ResultsWriter(output_dir=ROOT / "results")
@@ -39,4 +44,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
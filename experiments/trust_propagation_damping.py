@@ -9,11 +9,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
+import matplotlib.pyplot as plt
+
 from chronosrep.trust.graph import TrustGraph
 from chronosrep.trust.propagation import PropagationEngine
 
@@ -23,7 +27,9 @@ _OUT = Path(__file__).parent / "output" / "trust_propagation_damping.png"
 def _build_ring(n: int, trust: float = 0.7) -> TrustGraph:
     g = TrustGraph()
     for i in range(n):
-        g.record_interaction(i, (i + 1) % n, success=True)
+        g.upsert_node(i, 0.5, 0.0, np.zeros(5))
+    for i in range(n):
+        g.record_interaction(i, (i + 1) % n, 1, trust)
     return g
 
 
@@ -38,15 +44,12 @@ def main(out_path: Path = _OUT) -> None:
     for ax, alpha in zip(axes, alphas):
         np.random.seed(0)
         g = _build_ring(N)
-        rep = {i: float(np.random.uniform(0.3, 0.9)) for i in range(N)}
+        arr = np.empty((T_steps + 1, N))
+        arr[0] = np.random.uniform(0.3, 0.9, N)
         engine = PropagationEngine(damping=alpha, max_iter=20)
+        for t in range(T_steps):
+            arr[t + 1] = engine.propagate_array(g, arr[t])
 
-        series = [list(rep.values())]
-        for _ in range(T_steps):
-            rep = engine.propagate(g, rep)
-            series.append(list(rep.values()))
-
-        arr = np.array(series)
         for i in range(min(10, N)):
             ax.plot(arr[:, i], alpha=0.5, linewidth=0.8)
         ax.plot(arr.mean(axis=1), color="black", linewidth=2, label="mean")
@@ -58,7 +61,7 @@ def main(out_path: Path = _OUT) -> None:
     axes[0].set_ylabel("Reputation")
     fig.suptitle("Trust Propagation — Damping Factor Sensitivity")
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     print(f"Saved → {out_path}")
     plt.close(fig)
 
@@ -9,12 +9,16 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl
+
+configure_mpl()
+import matplotlib.pyplot as plt
+import matplotlib.patches as mpatches
+
 from chronosrep.stochastic.solver import SDESolver, OUParams
 from chronosrep.stochastic.volatility import VolatilityEstimator
 
@@ -31,16 +35,14 @@ def main(out_path: Path = _OUT) -> None:
     vol_est = VolatilityEstimator(window=20)
     solver.init(pid, 0.5)
 
-    xs:     list[float] = []
-    ewmas:  list[float] = []
-    rvols:  list[float] = []
-    regimes: list[str]  = []
+    xs = np.empty(T)
+    regimes: list[str] = []
 
     params_calm   = OUParams(mu=0.75, theta=0.3, sigma=0.03)
     params_stress = OUParams(mu=0.40, theta=0.5, sigma=0.15)
     params_attack = OUParams(mu=0.20, theta=0.8, sigma=0.25)
 
-    prev = solver.current(pid)
+    x0 = solver.current(pid)
     for t in range(T):
         if t < 60:
             p, gamma, regime = params_calm,   0.0, "calm"
@@ -49,14 +51,9 @@ def main(out_path: Path = _OUT) -> None:
         else:
             p, gamma, regime = params_attack, 4.5, "attack"
 
-        x = solver.step(pid, p, gamma)
-        vol_est.update(pid, x, prev)
-        prev = x
-
-        xs.append(x)
-        ewmas.append(vol_est.ewma_vol(pid))
-        rvols.append(vol_est.realized_vol(pid))
+        xs[t] = solver.step(pid, p, gamma)
         regimes.append(regime)
+    ewmas, rvols = vol_est.batch_update(pid, xs, x0)
 
     steps = np.arange(T)
     colors = {"calm": "#d4efdf", "stress": "#fdebd0", "attack": "#fadbd8"}
@@ -80,7 +77,7 @@ def main(out_path: Path = _OUT) -> None:
     ax2.legend(handles=patches + list(ax2.get_lines()), fontsize=7)
 
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out_path, **SAVEFIG_KW)
     print(f"Saved → {out_path}")
     plt.close(fig)
 
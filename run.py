@@ -2,6 +2,5 @@ from chronosrep import ChronosRepModel
 
 if __name__ == "__main__":
     model = ChronosRepModel()
-    for _ in range(ChronosRepModel.T):
-        model.step()
+    model.run()
     print(f"Simulation complete: {ChronosRepModel.N} agents, {ChronosRepModel.T} steps, τ={ChronosRepModel.TAU}")
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+
 import numpy as np
+
+from experiments._plot_helpers import SAVEFIG_KW, configure_mpl, plots_enabled
+
+configure_mpl()
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 
@@ -11,7 +19,8 @@ from chronosrep import (
     TransgressionRecoveryScenario,
     CollusionFarmingScenario,
 )
-from chronosrep.modules.vadm import VADM
+from chronosrep.utils.jit import njit
+from chronosrep.utils.math_utils import ewma_path
 
 SCENARIOS = [
     ("Baseline",                   None),
@@ -25,17 +34,31 @@ def run_scenario(label: str, scenario) -> dict:
     print(f"  Running {label} ...", end=" ", flush=True)
     t0 = time.perf_counter()
     model = ChronosRepModel(scenario=scenario)
-    for _ in range(ChronosRepModel.T):
-        model.step()
+    model.run(ChronosRepModel.T)
     elapsed = time.perf_counter() - t0
-    df = model.datacollector.get_model_vars_dataframe()
+    series = {k: np.asarray(v) for k, v in model.datacollector.model_vars.items()}
     ttd = model.time_to_detection()
+    model.release_agents()
     print(f"done in {elapsed:.1f}s  TTD={ttd}")
-    return {"label": label, "df": df, "ttd": ttd, "model": model}
+    return {"label": label, "series": series, "ttd": ttd, "model": model}
+
+
+def _run_entry(entry: tuple[str, object]) -> dict:
+    r = run_scenario(*entry)
+    del r["model"]
+    return r
+
+
+def run_all_scenarios(max_workers: int | None = None) -> list[dict]:
+    workers = min(max_workers or os.cpu_count() or 1, len(SCENARIOS))
+    if workers == 1:
+        return [_run_entry(entry) for entry in SCENARIOS]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_run_entry, SCENARIOS))
 
 
 def plot_scenarios(results: list[dict]) -> None:
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5), layout="constrained")
     fig.suptitle("ChronosRep — Scenario Comparison (N=1000, T=500)", fontsize=13, fontweight="bold")
 
     metrics = [
@@ -44,12 +67,13 @@ def plot_scenarios(results: list[dict]) -> None:
         ("AttackerAvgReputation", "Attacker Avg Reputation",  axes[2]),
     ]
     colors = ["#2196F3", "#F44336", "#4CAF50", "#FF9800"]
+    labels = [r["label"] for r in results]
+    steps = np.arange(results[0]["series"][metrics[0][0]].size)
 
     for key, ylabel, ax in metrics:
-        for r, color in zip(results, colors):
-            series = r["df"][key]
-            ax.plot(series.index, series.values, label=r["label"],
-                    linewidth=1.5, color=color)
+        Y = np.column_stack([r["series"][key] for r in results])
+        ax.set_prop_cycle(color=colors[:len(results)])
+        ax.plot(steps, Y, label=labels, linewidth=1.5)
         ax.axhline(y=ChronosRepModel.TAU, color="gray", linestyle="--",
                    linewidth=0.8, alpha=0.7, label=f"τ={ChronosRepModel.TAU}")
         ax.set_xlabel("Simulation Step", fontsize=10)
@@ -58,13 +82,25 @@ def plot_scenarios(results: list[dict]) -> None:
         ax.legend(fontsize=7)
         ax.grid(True, alpha=0.25)
 
-    plt.tight_layout()
     out = "experiment_results.png"
-    plt.savefig(out, dpi=150, bbox_inches="tight")
+    plt.savefig(out, **SAVEFIG_KW)
     print(f"  Plot saved → {out}")
     plt.close()
 
 
+def _ou_paths(x0: float, mu: float, thetas: np.ndarray, sigma: float, noise: np.ndarray) -> np.ndarray:
+    out = np.empty((thetas.size, noise.shape[1] + 1))
+    out[:, 0] = x0
+    x = out[:, 0].copy()
+    dz = sigma * noise
+    for t in range(noise.shape[1]):
+        x += thetas * (mu - x)
+        x += dz[:, t]
+        np.clip(x, 0.0, 1.0, out=x)
+        out[:, t + 1] = x
+    return out
+
+
 def plot_figure16() -> None:
     """
     Figure 16: Resilience to Initialization Bias.
@@ -78,19 +114,12 @@ def plot_figure16() -> None:
     THETAS = [0.1, 0.3, 0.8]
     COLORS = ["#F44336", "#FF9800", "#4CAF50"]
 
-    vadm = VADM(sigma=SIGMA)
     rng = np.random.default_rng(42)
+    paths = _ou_paths(X0, MU, np.array(THETAS), SIGMA, rng.standard_normal((len(THETAS), T)))
 
-    fig, ax = plt.subplots(figsize=(9, 5))
+    fig, ax = plt.subplots(figsize=(9, 5), layout="constrained")
 
-    for theta, color in zip(THETAS, COLORS):
-        x = X0
-        trajectory = [x]
-        for _ in range(T):
-            drift = theta * (MU - x) * 1.0
-            diffusion = SIGMA * rng.standard_normal()
-            x = float(np.clip(x + drift + diffusion, 0.0, 1.0))
-            trajectory.append(x)
+    for theta, color, trajectory in zip(THETAS, COLORS, paths):
         ax.plot(range(T + 1), trajectory, color=color, linewidth=1.8,
                 label=rf"Correction Speed $\theta={theta}$")
 
@@ -114,13 +143,42 @@ def plot_figure16() -> None:
                 arrowprops=dict(arrowstyle="->", color="black", lw=1.2),
                 fontsize=9)
 
-    plt.tight_layout()
     out = "figure16_initialization_bias.png"
-    plt.savefig(out, dpi=150, bbox_inches="tight")
+    plt.savefig(out, **SAVEFIG_KW)
     print(f"  Figure 16 saved → {out}")
     plt.close()
 
 
+@njit("float64[::1](int8[:], float64, float64, float64, float64, float64, float64[:])", cache=True, fastmath=True)
+def _ou_jump_path(
+    trace: np.ndarray,
+    x0: float,
+    theta: float,
+    mu_normal: float,
+    sigma: float,
+    jump_scale: float,
+    z: np.ndarray,
+) -> np.ndarray:
+    out = np.empty(trace.shape[0] + 1)
+    out[0] = x0
+    x = x0
+    noise_floor = sigma / max(sqrt(2.0 * theta), 1e-6)
+    k = 0
+    for i in range(trace.shape[0]):
+        mu = mu_normal if trace[i] == 1 else 0.0
+        drift = theta * (mu - x)
+        diffusion = sigma * z[k]
+        k += 1
+        jump = 0.0
+        if abs(mu - x) / noise_floor > 3.0:
+            jump = -abs(jump_scale * z[k])
+            k += 1
+        nxt = x + drift + diffusion + jump
+        x = 0.0 if nxt < 0.0 else (1.0 if nxt > 1.0 else nxt)
+        out[i + 1] = x
+    return out
+
+
 def plot_figure17() -> None:
     """
     Figure 17: Forensic Analysis of Euler Finance Exploit.
@@ -136,45 +194,19 @@ def plot_figure17() -> None:
 
     trace = [1] * ATTACK_STEP + [0] * (N_STEPS - ATTACK_STEP)
 
-    raw_evidence = []
-    r_ewma = 0.9
-    for s in trace:
-        r_ewma = (1 - LAMBDA_EWMA) * r_ewma + LAMBDA_EWMA * s
-        raw_evidence.append(r_ewma)
+    ewma_trace = ewma_path(0.9, np.asarray(trace, dtype=np.float64), LAMBDA_EWMA)
+    raw_evidence = ewma_trace[1:]
 
     rng = np.random.default_rng(7)
-    x_ou = 0.92
-    ou_trajectory = [x_ou]
-    theta = 0.3
-
-    for i, s in enumerate(trace):
-        if s == 1:
-            mu = MU_NORMAL
-        else:
-            mu = 0.0
-
-        drift = theta * (mu - x_ou) * 1.0
-        diffusion = SIGMA * rng.standard_normal()
-
-        epsilon = abs(mu - x_ou)
-        noise_floor = SIGMA / max(np.sqrt(2 * theta), 1e-6)
-        gamma = epsilon / noise_floor
-        jump = 0.0
-        if gamma > 3.0:
-            jump = -abs(float(rng.normal(loc=0.0, scale=JUMP_SCALE)))
-
-        x_ou = float(np.clip(x_ou + drift + diffusion + jump, 0.0, 1.0))
-        ou_trajectory.append(x_ou)
-
+    ou_trajectory = _ou_jump_path(
+        np.asarray(trace, dtype=np.int8), 0.92, 0.3, MU_NORMAL, SIGMA, JUMP_SCALE,
+        rng.standard_normal(2 * N_STEPS),
+    )
     ou_trajectory = ou_trajectory[:N_STEPS]
 
-    baseline_full = [0.9] + [
-        (1 - LAMBDA_EWMA) * prev + LAMBDA_EWMA * s
-        for prev, s in zip([0.9] + raw_evidence[:-1], trace)
-    ]
-    baseline_full = baseline_full[:N_STEPS]
+    baseline_full = ewma_trace[:N_STEPS]
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
 
     steps = list(range(N_STEPS))
     ax.plot(steps, raw_evidence, color="gray", linestyle=":",
@@ -209,35 +241,34 @@ def plot_figure17() -> None:
     ax.legend(fontsize=9, loc="lower left")
     ax.grid(True, alpha=0.25)
 
-    plt.tight_layout()
     out = "figure17_euler_finance_exploit.png"
-    plt.savefig(out, dpi=150, bbox_inches="tight")
+    plt.savefig(out, **SAVEFIG_KW)
     print(f"  Figure 17 saved → {out}")
     plt.close()
 
 
 if __name__ == "__main__":
-    print("=== Figure 16: Initialization Bias Resilience ===")
-    plot_figure16()
+    plots = plots_enabled()
+    if plots:
+        print("=== Figure 16: Initialization Bias Resilience ===")
+        plot_figure16()
 
-    print("\n=== Figure 17: Euler Finance Exploit Forensics ===")
-    plot_figure17()
+        print("\n=== Figure 17: Euler Finance Exploit Forensics ===")
+        plot_figure17()
 
     print(f"\n=== ChronosRep Full Experiment (N={ChronosRepModel.N}, T={ChronosRepModel.T}) ===")
-    results = []
-    for label, scenario in SCENARIOS:
-        results.append(run_scenario(label, scenario))
+    results = run_all_scenarios()
 
     print("\n=== Summary ===")
     for r in results:
-        df = r["df"]
+        series = r["series"]
         print(
             f"  {r['label']:<35} "
-            f"FinalAvgRep={df['AvgReputation'].iloc[-1]:.4f}  "
-            f"FinalIsoRate={df['IsolationRate'].iloc[-1]:.3f}  "
+            f"FinalAvgRep={series['AvgReputation'][-1]:.4f}  "
+            f"FinalIsoRate={series['IsolationRate'][-1]:.3f}  "
             f"TTD={r['ttd']}"
         )
 
-    plot_scenarios(results)
+    if plots:
+        plot_scenarios(results)
     print("\nDone.")
-
@@ -18,8 +18,7 @@ class SmallModel(ChronosRepModel):
 def run(model_cls, label, scenario=None):
     m = model_cls(scenario=scenario)
     t0 = time.perf_counter()
-    for _ in range(model_cls.T):
-        m.step()
+    m.run(model_cls.T)
     elapsed = time.perf_counter() - t0
 
     df = m.datacollector.get_model_vars_dataframe()
@@ -12,19 +12,13 @@ def fix_seed():
     yield
 
 
-@pytest.fixture
-def tiny_model():
-    from chronosrep.model import ChronosRepModel
-    return ChronosRepModel(n_agents=20, t_steps=10, tau=0.4)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vcgen():
     from chronosrep.modules.vcgen import VCGen
     return VCGen()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def irv_pe():
     from chronosrep.modules.irv_pe import IRV_PE
     return IRV_PE()
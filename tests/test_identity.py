@@ -8,36 +8,30 @@ from chronosrep.identity.resolver import DIDResolver
 from chronosrep.identity.revocation import RevocationIndex
 
 
-def test_registry_register_and_get():
+@pytest.fixture
+def prepopulated_registry(vcgen):
     reg = CredentialRegistry()
-    from chronosrep.modules.vcgen import VCGen
-    vcgen = VCGen()
-    creds = vcgen.generate(agent_id=1, n_credentials=3)
-    for c in creds:
-        reg.register(c)
-    assert len(reg.get_by_subject(1)) == 3
+    data = {aid: vcgen.generate(agent_id=aid, n_credentials=n) for aid, n in [(1, 3), (2, 2), (3, 4)]}
+    for creds in data.values():
+        for c in creds:
+            reg.register(c)
+    return reg, data
 
 
-def test_registry_revoke():
-    reg = CredentialRegistry()
-    from chronosrep.modules.vcgen import VCGen
-    vcgen = VCGen()
-    creds = vcgen.generate(agent_id=2, n_credentials=2)
-    for c in creds:
-        reg.register(c)
-    reg.revoke(creds[0].vc_id)
-    active = [c for c in reg.get_by_subject(2) if not c.revoked]
-    assert len(active) == 1
+def test_registry_register_and_get(prepopulated_registry):
+    reg, _ = prepopulated_registry
+    assert len(reg.subject_credentials(1)) == 3
 
 
-def test_registry_revocation_ratio():
-    reg = CredentialRegistry()
-    from chronosrep.modules.vcgen import VCGen
-    vcgen = VCGen()
-    creds = vcgen.generate(agent_id=3, n_credentials=4)
-    for c in creds:
-        reg.register(c)
-    reg.revoke(creds[0].vc_id)
+def test_registry_revoke(prepopulated_registry):
+    reg, data = prepopulated_registry
+    reg.revoke(data[2][0].vc_id)
+    assert reg.active_count(2) == 1
+
+
+def test_registry_revocation_ratio(prepopulated_registry):
+    reg, data = prepopulated_registry
+    reg.revoke(data[3][0].vc_id)
     ratio = reg.revocation_ratio(3)
     assert ratio == pytest.approx(0.25)
 
@@ -64,3 +58,17 @@ def test_revocation_accumulation():
         idx.revoke(0, f"vc-{ep}", epoch=ep)
     acc = idx.accumulation_vector(0, n_epochs=5, epoch_size=1)
     assert acc[-1] >= 1
+
+
+def test_vcrecord_direct_weight_matches_generated(vcgen):
+    from chronosrep.modules.vcgen import VCRecord
+    for vc in vcgen.generate(agent_id=7, n_credentials=8):
+        direct = VCRecord(
+            vc_id=vc.vc_id, vc_type=vc.vc_type, issuer_tier=vc.issuer_tier,
+            issuer_trust=vc.issuer_trust, subject_id=vc.subject_id, revoked=vc.revoked,
+            attributes=vc.attributes, bba=vc.bba, issuance_ts=vc.issuance_ts,
+            chain_depth=vc.chain_depth,
+        )
+        assert direct.vc_type_id == vc.vc_type_id
+        assert direct.tier_id == vc.tier_id
+        assert direct._effective_w == vc._effective_w
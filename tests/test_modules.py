@@ -0,0 +1,44 @@
+"""tests/test_modules.py — unit tests for modules submodule."""
+from __future__ import annotations
+import pytest
+import numpy as np
+
+from chronosrep.modules.bsm import BSM
+from chronosrep.modules.vadm import VADM
+
+
+def test_bsm_batch_matches_scalar(bsm):
+    rng = np.random.default_rng(0)
+    streams = rng.integers(0, 2, size=(4, 50))
+    ref = BSM()
+    for chunk in (streams[:, :20], streams[:, 20:]):
+        out = bsm.monitor_batch([3, 1, 4, 5], chunk)
+        for i, aid in enumerate([3, 1, 4, 5]):
+            r = ref.monitor(aid, chunk[i].tolist())
+            assert out["mean_outcome"][i] == pytest.approx(r["mean_outcome"])
+            assert out["cusum_pos"][i] == pytest.approx(r["cusum_pos"])
+            assert out["anomaly_score"][i] == pytest.approx(r["anomaly_score"])
+            assert out["t"][i] == r["t"]
+
+
+def test_bsm_batch_rejects_duplicate_ids(bsm):
+    with pytest.raises(ValueError):
+        bsm.monitor_batch([1, 1], np.ones((2, 5)))
+
+
+def test_vadm_batch_matches_scalar():
+    # sigma=0 removes the diffusion and jump terms, so both paths are deterministic.
+    batch, ref = VADM(sigma=0.0), VADM(sigma=0.0)
+    irv = np.array([[0.2], [0.6], [0.9]])
+    r = np.array([0.8, 0.1, 0.5])
+    for _ in range(25):
+        x, sw = batch.step_batch([7, 2, 9], irv, r)
+        for i, aid in enumerate([7, 2, 9]):
+            xs, sws = ref.step(aid, irv[i], r[i])
+            assert x[i] == pytest.approx(xs)
+            assert sw[i] == pytest.approx(sws)
+
+
+def test_vadm_batch_rejects_duplicate_ids(vadm):
+    with pytest.raises(ValueError):
+        vadm.step_batch([4, 4], np.full((2, 1), 0.5), np.array([0.5, 0.5]))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 import networkx as nx
 
-from chronosrep.network.topology import TopologyBuilder
+from chronosrep.network.topology import TopologyBuilder, TopologyConfig
 from chronosrep.network.edge_policy import EdgeWeightPolicy
 from chronosrep.network.partition import PartitionCache
 
@@ -15,10 +15,9 @@ def test_er_topology_nodes():
 
 
 def test_ba_topology_connected():
-    builder = TopologyBuilder(seed=1)
-    G = builder.build("barabasi_albert", n=30)
-    ug = G.to_undirected() if G.is_directed() else G
-    assert nx.is_connected(ug)
+    builder = TopologyBuilder(TopologyConfig(mode="barabasi_albert"), seed=1)
+    G = builder.build(n=30)
+    assert nx.is_weakly_connected(G) if G.is_directed() else nx.is_connected(G)
 
 
 def test_ws_topology_nodes():
@@ -42,6 +42,13 @@ def test_jump_fires_high_gamma():
     assert fired
 
 
+def test_jump_batch_duplicate_pids_advance_clock():
+    jp = JumpProcess(lambda_rate=50.0, gamma_threshold=3.0, seed=5)
+    jp.batch_sample([7, 7, 7], [0.0, 0.0, 0.0])
+    jp.sample(7, gamma=5.0)
+    assert jp.last_jump(7).t == 4
+
+
 def test_solver_init_step_clipped():
     p = OUParams(mu=0.7, theta=0.3, sigma=0.05)
     solver = SDESolver(dt=1.0, seed=10)
@@ -50,6 +57,25 @@ def test_solver_init_step_clipped():
     assert 0.0 <= x <= 1.0
 
 
+def test_solver_scalar_state_exact():
+    p = OUParams(mu=0.3, theta=0.3, sigma=0.05)
+    solver = SDESolver(dt=1.0, seed=10)
+    solver.init(0, 0.7)
+    assert solver.current(0) == 0.7
+    x = solver.step(0, p, gamma=0.0)
+    assert solver.params(0).mu == 0.3
+    assert solver.current(0) == x
+
+
+def test_solver_float32_state_consistent():
+    p = OUParams(mu=0.3, theta=0.3, sigma=0.05)
+    solver = SDESolver(dt=1.0, seed=10, dtype=np.float32)
+    solver.init(0, 0.7)
+    x = solver.step(0, p, gamma=0.0)
+    assert solver.params(0).mu == 0.3
+    assert solver.current(0) == x
+
+
 def test_solver_trajectory_length():
     p = OUParams(mu=0.5, theta=0.2, sigma=0.02)
     solver = SDESolver(dt=1.0, seed=20)
@@ -62,8 +88,7 @@ def test_volatility_realized_nonneg():
     ve = VolatilityEstimator(window=20)
     xs = np.cumsum(np.random.default_rng(0).normal(0, 0.05, 30)) + 0.5
     xs = np.clip(xs, 0, 1)
-    for i in range(1, len(xs)):
-        ve.update(0, float(xs[i]), float(xs[i - 1]))
+    ve.batch_update(0, xs[1:], float(xs[0]))
     assert ve.realized_vol(0) >= 0.0
 
 
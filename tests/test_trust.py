@@ -32,8 +32,8 @@ def test_trust_graph_isolate():
 
 def test_propagation_engine_converges():
     g = TrustGraph()
-    for i in range(10):
-        g.record_interaction(i, (i + 1) % 10, success=True)
+    src = np.arange(10)
+    g.record_interactions(src, (src + 1) % 10, 1, 1.0)
     rep = {i: float(np.random.uniform(0.4, 0.9)) for i in range(10)}
     engine = PropagationEngine(damping=0.85, max_iter=30)
     for _ in range(5):
@@ -41,6 +41,20 @@ def test_propagation_engine_converges():
     assert all(0.0 <= v <= 1.0 for v in rep.values())
 
 
+def test_propagation_cold_start_reproducible():
+    g = TrustGraph()
+    src = np.arange(10)
+    for i in src.tolist():
+        g.upsert_node(i, 0.5, 0.1, np.zeros(5))
+    g.record_interactions(src, (src + 3) % 10, 1, 0.8)
+    base = np.linspace(0.3, 0.9, 10)
+    engine = PropagationEngine()
+    first = engine.propagate_array(g, base)
+    engine.propagate_array(g, first)
+    assert np.array_equal(engine.propagate_array(g, base), first)
+    assert np.array_equal(PropagationEngine().propagate_array(g, base), first)
+
+
 def test_decay_exponential():
     cfg = DecayConfig(mode="exponential", rate=0.1)
     sched = DecayScheduler(cfg)
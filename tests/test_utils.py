@@ -5,10 +5,10 @@ import numpy as np
 
 from chronosrep.utils.math_utils import (
     softmax, sigmoid, shannon_entropy, rolling_mean, rolling_std,
-    ewma, z_score, clip_normalize, gini_coefficient, cosine_similarity, kl_divergence,
+    ewma, ewma_path, z_score, clip_normalize, gini_coefficient, cosine_similarity, kl_divergence,
 )
 from chronosrep.utils.seed_manager import set_global_seed, make_rng, fork_rng, temp_seed
-from chronosrep.utils.serialization import save_json, load_json
+from chronosrep.utils.serialization import save_json, load_json, save_pickle, load_pickle
 import tempfile, pathlib
 
 
@@ -18,6 +18,14 @@ def test_softmax_sums_to_one():
     assert np.isclose(s.sum(), 1.0)
 
 
+def test_softmax_extreme_inputs():
+    s = softmax(np.array([1000.0, 1001.0, 1002.0]))
+    assert np.all(np.isfinite(s))
+    s32 = softmax(np.array([1000.0, 1001.0, 1002.0], dtype=np.float32))
+    assert s32.dtype == np.float32
+    assert np.allclose(s32, s, atol=1e-6)
+
+
 def test_sigmoid_bounds():
     assert 0 < sigmoid(0.0) < 1
     assert sigmoid(100.0) > 0.99
@@ -41,6 +49,13 @@ def test_ewma_length():
     assert len(out) == len(arr)
 
 
+def test_ewma_path_long_trace_finite():
+    out = ewma_path(0.5, np.ones(3000), 0.3)
+    assert out.shape == (3001,)
+    assert out[0] == 0.5 and out[1] == pytest.approx(0.65)
+    assert np.all(np.isfinite(out)) and out[-1] == pytest.approx(1.0)
+
+
 def test_gini_zero_for_equal():
     g = gini_coefficient([1.0, 1.0, 1.0, 1.0])
     assert g == pytest.approx(0.0, abs=1e-6)
@@ -88,3 +103,155 @@ def test_save_load_json(tmp_path):
     loaded = load_json(p)
     assert loaded["a"] == 1
     assert loaded["c"] == pytest.approx([0.1, 0.2])
+
+
+def test_save_load_json_numpy_values(tmp_path):
+    data = {
+        1: np.arange(6, dtype=np.float32).reshape(2, 3),
+        "n": np.int64(7),
+        "x": np.float64(0.5),
+        "flags": np.array([True, False]),
+    }
+    loaded = load_json(save_json(data, tmp_path / "np.json"))
+    assert loaded["1"] == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+    assert loaded["n"] == 7
+    assert loaded["x"] == 0.5
+    assert loaded["flags"] == [True, False]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_load_json_nonfinite(tmp_path, monkeypatch, use_orjson):
+    from chronosrep.utils import serialization
+    if use_orjson and not serialization._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "_HAS_ORJSON", use_orjson)
+    data = {"nan": float("nan"), "arr": np.array([1.0, np.inf, -np.inf])}
+    p = save_json(data, tmp_path / "nf.json")
+    raw = p.read_bytes()
+    assert b"NaN" in raw and b"-Infinity" in raw and b"null" not in raw
+    loaded = load_json(p)
+    assert np.isnan(loaded["nan"])
+    assert loaded["arr"] == [1.0, float("inf"), float("-inf")]
+
+
+def test_save_load_pickle_keeps_path(tmp_path):
+    arr = np.arange(6, dtype=np.float64).reshape(2, 3)
+    p = save_pickle(arr, tmp_path / "x.pkl")
+    assert p == tmp_path / "x.pkl"
+    loaded = load_pickle(p)
+    assert np.array_equal(loaded, arr)
+    assert not loaded.flags.writeable
+
+    arrays = {"a": np.arange(3), "b": np.ones((2, 2))}
+    loaded = load_pickle(save_pickle(arrays, tmp_path / "d.pkl"))
+    assert set(loaded) == {"a", "b"}
+    assert np.array_equal(loaded["b"], arrays["b"])
+
+    obj = {"k": [1, "two", None]}
+    assert load_pickle(save_pickle(obj, tmp_path / "o.pkl")) == obj
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["d.pkl", "o.pkl", "x.pkl"]
+
+
+def _fake_model(n=3):
+    from types import SimpleNamespace
+    agents = [SimpleNamespace(unique_id=i, reputation=0.5, isolated=False, is_attacker=False, irv=np.zeros(2))
+              for i in range(n)]
+    return SimpleNamespace(schedule=SimpleNamespace(agents=agents))
+
+
+def test_async_checkpointer_flush_order(tmp_path):
+    from chronosrep.utils.serialization import AsyncCheckpointer
+    model = _fake_model()
+    with AsyncCheckpointer(max_pending=2) as ckpt:
+        for step in range(5):
+            ckpt.save(model, tmp_path / "ckpt.json", step=step)
+        paths = ckpt.flush()
+    assert [p.name for p in paths] == [f"ckpt_step{s:05d}.json" for s in range(5)]
+    assert load_json(paths[-1])["step"] == 4
+
+
+def test_async_checkpointer_backpressure(tmp_path, monkeypatch):
+    import threading
+    from chronosrep.utils import serialization
+    gate = threading.Event()
+    real_write = serialization._write_bytes
+
+    def blocked_write(path, data):
+        gate.wait()
+        return real_write(path, data)
+
+    monkeypatch.setattr(serialization, "_write_bytes", blocked_write)
+    ckpt = serialization.AsyncCheckpointer(max_pending=2)
+    model = _fake_model()
+    ckpt.save(model, tmp_path / "a.json")
+    ckpt.save(model, tmp_path / "b.json")
+    third = threading.Thread(target=ckpt.save, args=(model, tmp_path / "c.json"))
+    third.start()
+    third.join(0.2)
+    assert third.is_alive()
+    gate.set()
+    third.join(5.0)
+    assert not third.is_alive()
+    ckpt.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json", "c.json"]
+
+
+def test_async_checkpointer_close_raises_write_error(tmp_path, monkeypatch):
+    from chronosrep.utils import serialization
+
+    def failing_write(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(serialization, "_write_bytes", failing_write)
+    ckpt = serialization.AsyncCheckpointer()
+    ckpt.save(_fake_model(), tmp_path / "x.json")
+    with pytest.raises(OSError, match="disk full"):
+        ckpt.close()
+    assert ckpt._pool._shutdown
+
+
+def test_save_load_msgpack(tmp_path):
+    pytest.importorskip("msgspec")
+    from chronosrep.utils.serialization import save_msgpack, load_msgpack
+    data = {"step": 3, "rep": np.array([0.25, 0.5]), "n": np.int64(2)}
+    loaded = load_msgpack(save_msgpack(data, tmp_path / "d.msgpack"))
+    assert loaded == {"step": 3, "rep": [0.25, 0.5], "n": 2}
+
+
+def test_msgpack_requires_msgspec(tmp_path, monkeypatch):
+    from chronosrep.utils import serialization
+    monkeypatch.setattr(serialization, "_HAS_MSGSPEC", False)
+    with pytest.raises(ImportError, match="msgspec"):
+        serialization.save_msgpack({"a": 1}, tmp_path / "d.msgpack")
+    with pytest.raises(ImportError, match="msgspec"):
+        serialization.load_msgpack(tmp_path / "d.msgpack")
+
+
+def test_save_load_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    from chronosrep.utils.serialization import save_parquet, load_parquet
+    cols = {"unique_id": np.arange(3), "reputation": np.array([0.1, 0.5, 0.9]), "irv": np.eye(3)}
+    loaded = load_parquet(save_parquet(cols, tmp_path / "s.parquet"))
+    assert np.array_equal(loaded["unique_id"], cols["unique_id"])
+    assert np.allclose(loaded["reputation"], cols["reputation"])
+    assert loaded["irv"].shape == (3, 3) and np.array_equal(loaded["irv"], cols["irv"])
+
+
+def test_results_writer_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    from chronosrep.evaluation.benchmark import RunResult
+    from chronosrep.evaluation.results_writer import ResultsWriter
+    from chronosrep.utils.serialization import load_parquet
+    results = [RunResult("Baseline", s, 20, 10, 0.4, 0.6, 0.1, 0.2, 3.0, 1.0, 0.01) for s in range(2)]
+    loaded = load_parquet(ResultsWriter(tmp_path).write_parquet(results))
+    assert loaded["seed"].tolist() == [0, 1]
+    assert loaded["scenario"].tolist() == ["Baseline", "Baseline"]
+
+
+def test_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    from chronosrep.utils import serialization
+    monkeypatch.setattr(serialization, "_HAS_PYARROW", False)
+    with pytest.raises(ImportError, match="pyarrow"):
+        serialization.save_parquet({"a": np.arange(3)}, tmp_path / "a.parquet")
+    with pytest.raises(ImportError, match="pyarrow"):
+        serialization.load_parquet(tmp_path / "a.parquet")